@@ -0,0 +1,7 @@
+"""
+ASGI application entry point, e.g. uvicorn asgi:app --workers 4
+"""
+
+from department_app.asgi import create_asgi_app
+
+app = create_asgi_app()
@@ -0,0 +1,3 @@
+"""
+Package containing scripts used to measure performance of the application
+"""
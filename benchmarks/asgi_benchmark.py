@@ -0,0 +1,62 @@
+"""
+Module containing load benchmark that compares throughput and latency of the WSGI application served by gunicorn
+sync workers and the async ASGI application served by uvicorn under concurrent REST API reads
+
+Usage: python -m benchmarks.asgi_benchmark [--employees N] [--workers N] [--concurrency N] [--duration S]
+Uses database from SQLALCHEMY_TEST_DATABASE_URI, tables are created and dropped by the benchmark,
+servers are started as subprocesses and require gunicorn, uvicorn, asyncpg and asgiref packages.
+Response cache of the WSGI application is configured by instance/config.py, the async path does not use it.
+"""
+
+# pylint: disable=no-member
+import argparse
+import os
+
+from benchmarks.filter_benchmark import populate_db
+from benchmarks.load import run_load, start_server, stop_server, summarize
+from department_app import create_app
+from department_app.database import db
+
+SERVERS = {'gunicorn': 'gunicorn (WSGI, sync)', 'uvicorn': 'uvicorn (ASGI, async)'}
+
+
+def main():
+    """
+    Runs the benchmark and prints results
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--departments', type=int, default=50)
+    parser.add_argument('--employees', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    environment = dict(os.environ, SQLALCHEMY_DATABASE_URI=os.environ['SQLALCHEMY_TEST_DATABASE_URI'])
+    app = create_app(test_config=True)
+    with app.app_context():
+        db.create_all()
+        try:
+            department_ids = populate_db(args.departments, args.employees)
+            scenarios = [
+                ('employees', 1, lambda rng: f'/api/employees?department_id={rng.choice(department_ids)}&limit=20'),
+                ('department', 1, lambda rng: f'/api/departments/{rng.choice(department_ids)}?include='),
+            ]
+            for server, name in SERVERS.items():
+                process = start_server(server, args.port, args.workers, environment)
+                try:
+                    run_load('127.0.0.1', args.port, scenarios, args.concurrency, 1)
+                    latencies, errors = run_load('127.0.0.1', args.port, scenarios, args.concurrency, args.duration)
+                finally:
+                    stop_server(process)
+                summary = summarize(sum(latencies.values(), []), sum(errors.values()), args.duration)
+                print(f'{name:<22} {summary["rps"]:>8.0f} req/s p50 {summary["latency_ms"]["p50"]:>7.1f} ms '
+                      f'p99 {summary["latency_ms"]["p99"]:>7.1f} ms {sum(errors.values())} errors')
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Module containing benchmark that measures latency of the employees filter query
+without and with indexes on employee department_id and birthdate
+
+Usage: python -m benchmarks.filter_benchmark [--employees N] [--departments N] [--repeat N]
+Uses database from SQLALCHEMY_TEST_DATABASE_URI, tables are created and dropped by the benchmark
+"""
+
+# pylint: disable=no-member
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+from department_app import create_app
+from department_app.database import db
+from department_app.models import Department, Employee
+from department_app.service import get_employees_with_filter
+
+CHUNK_SIZE = 10000
+
+
+def populate_db(number_of_departments: int, number_of_employees: int) -> list:
+    """
+    Populates database with generated departments and employees using batched inserts
+    :param number_of_departments: number of departments to create
+    :type number_of_departments: int
+    :param number_of_employees: number of employees to create
+    :type number_of_employees: int
+    :return: list of ids of created departments
+    :rtype: list
+    """
+    department_ids = [uuid.uuid4() for _ in range(number_of_departments)]
+    db.session.execute(insert(Department.__table__),
+                       [{'department_id': department_id, 'department_name': f'BENCH_DP{index}',
+                         'department_phone_number': '+380000000000'}
+                        for index, department_id in enumerate(department_ids)])
+    for chunk_start in range(0, number_of_employees, CHUNK_SIZE):
+        db.session.execute(insert(Employee.__table__),
+                           [{'employee_id': uuid.uuid4(), 'employee_name': f'BENCH_E{index}',
+                             'position': 'Benchmark Subject', 'salary': random.randint(500, 5000),
+                             'birthdate': date(1960, 1, 1) + timedelta(days=random.randint(0, 15000)),
+                             'department_id': random.choice(department_ids)}
+                            for index in range(chunk_start, min(chunk_start + CHUNK_SIZE, number_of_employees))])
+    db.session.commit()
+    db.session.execute('ANALYZE employee')
+    db.session.commit()
+    return department_ids
+
+
+def measure(department_ids: list, repeat: int) -> dict:
+    """
+    Runs filter queries and returns their median latencies in milliseconds
+    :param department_ids: ids of departments used in filters
+    :type department_ids: list
+    :param repeat: number of times each query is run
+    :type repeat: int
+    :return: dict mapping names of filters to median latencies
+    :rtype: dict
+    """
+    filters = {
+        'department': lambda department_id: (department_id, None, None),
+        'birthdate range': lambda department_id: (None, date(1980, 1, 1), date(1980, 1, 31)),
+        'department and birthdate range': lambda department_id: (department_id, date(1980, 1, 1), date(1982, 1, 1)),
+    }
+    results = {}
+    for name, make_filter in filters.items():
+        latencies = []
+        for _ in range(repeat):
+            filter_args = make_filter(random.choice(department_ids))
+            db.session.expunge_all()
+            start = time.perf_counter()
+            get_employees_with_filter(*filter_args)
+            latencies.append((time.perf_counter() - start) * 1000)
+        results[name] = round(statistics.median(latencies), 2)
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and prints results
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--departments', type=int, default=200)
+    parser.add_argument('--employees', type=int, default=500000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app(test_config=True)
+    with app.app_context():
+        db.create_all()
+        try:
+            department_ids = populate_db(args.departments, args.employees)
+            indexes = Employee.__table__.indexes
+            for index in indexes:
+                index.drop(db.engine)
+            without_indexes = measure(department_ids, args.repeat)
+            for index in indexes:
+                index.create(db.engine)
+            db.session.execute('ANALYZE employee')
+            db.session.commit()
+            with_indexes = measure(department_ids, args.repeat)
+            for name, latency in without_indexes.items():
+                print(f'{name:<32} without indexes {latency:>9} ms   with indexes {with_indexes[name]:>9} ms')
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Module containing microbenchmark that compares JSON encoders of REST API responses
+on a payload of employees with embedded departments
+
+Usage: python -m benchmarks.json_benchmark [--employees N] [--repeat N]
+Does not use a database, employees are transient model instances
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from department_app.models import Department, Employee
+from department_app.rest.representation import dumps_json, dumps_orjson, orjson
+
+
+def make_employees(number_of_employees: int, number_of_departments: int = 50) -> list:
+    """
+    Creates transient employees related to transient departments
+    :param number_of_employees: number of employees to create
+    :type number_of_employees: int
+    :param number_of_departments: number of departments to create
+    :type number_of_departments: int
+    :return: list of employees
+    :rtype: list
+    """
+    departments = [Department(department_id=uuid.uuid4(), department_name=f'BENCH_DP{index}',
+                              department_phone_number='+380000000000')
+                   for index in range(number_of_departments)]
+    return [Employee(employee_id=uuid.uuid4(), employee_name=f'BENCH_E{index}', position='Benchmark Subject',
+                     salary=float(random.randint(500, 5000)),
+                     birthdate=date(1960, 1, 1) + timedelta(days=random.randint(0, 15000)),
+                     department=random.choice(departments))
+            for index in range(number_of_employees)]
+
+
+def legacy_dumps(employees: list) -> bytes:
+    """
+    Encodes employees the way responses were encoded before, with ids and dates converted by hand
+    and flask_restful default json.dumps representation
+    :param employees: list of employees
+    :type employees: list
+    :return: JSON document
+    :rtype: bytes
+    """
+    employees_dicts = []
+    for employee in employees:
+        employee_dict = employee.to_dict()
+        employee_dict['employee_id'] = str(employee_dict['employee_id'])
+        employee_dict['birthdate'] = str(employee_dict['birthdate'])
+        employee_dict['department_id'] = str(employee_dict['department_id'])
+        employee_dict['department']['department_id'] = str(employee_dict['department']['department_id'])
+        employees_dicts.append(employee_dict)
+    return (json.dumps(employees_dicts) + '\n').encode()
+
+
+def measure(encode, employees: list, repeat: int) -> float:
+    """
+    Returns median time in milliseconds of building dictionary representations of employees and encoding them
+    :param encode: function that encodes list of employees
+    :param employees: list of employees
+    :type employees: list
+    :param repeat: number of runs
+    :type repeat: int
+    :return: median time in milliseconds
+    :rtype: float
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode(employees)
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 2)
+
+
+def main():
+    """
+    Runs the benchmark and prints results
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    employees = make_employees(args.employees)
+    encoders = {
+        'json.dumps, str() in to_dict': legacy_dumps,
+        'json.dumps, native encoding': lambda items: dumps_json([item.to_dict() for item in items]),
+    }
+    if orjson is not None:
+        encoders['orjson, native encoding'] = lambda items: dumps_orjson([item.to_dict() for item in items])
+    employees_dicts = [employee.to_dict() for employee in employees]
+    for name, encode in encoders.items():
+        total = measure(encode, employees, args.repeat)
+        print(f'{name:<32} to_dict and encoding {total:>9} ms')
+    for name, encode in (('json.dumps', dumps_json), ('orjson', dumps_orjson if orjson is not None else None)):
+        if encode is not None:
+            print(f'{name:<32} encoding only        {measure(encode, employees_dicts, args.repeat):>9} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Module containing helpers of load benchmarks: starting application servers, generating load from concurrent
+keep-alive HTTP connections and summarizing latencies
+"""
+
+import http.client
+import random
+import socket
+import statistics
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+SERVERS = {
+    'gunicorn': lambda port, workers: ['gunicorn', '--workers', str(workers), '--bind', f'127.0.0.1:{port}',
+                                       'wsgi:app'],
+    'uvicorn': lambda port, workers: ['uvicorn', '--workers', str(workers), '--port', str(port), '--no-access-log',
+                                      'asgi:app'],
+}
+
+
+def wait_for_port(host: str, port: int, timeout: float = 60):
+    """
+    Waits until a server accepts connections on specified port
+    :param host: host of the server
+    :type host: str
+    :param port: port of the server
+    :type port: int
+    :param timeout: time to wait in seconds
+    :type timeout: float
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'server on port {port} has not started')
+
+
+def start_server(server: str, port: int, workers: int, environment: dict) -> subprocess.Popen:
+    """
+    Starts application server as a subprocess and waits until it accepts connections
+    :param server: name of the server from SERVERS
+    :type server: str
+    :param port: port to listen on
+    :type port: int
+    :param workers: number of worker processes
+    :type workers: int
+    :param environment: environment variables of the server
+    :type environment: dict
+    :return: server process
+    :rtype: subprocess.Popen
+    """
+    process = subprocess.Popen(SERVERS[server](port, workers), env=environment,  # pylint: disable=R1732
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port('127.0.0.1', port)
+    except RuntimeError:
+        process.terminate()
+        process.wait()
+        raise
+    return process
+
+
+def stop_server(process: subprocess.Popen):
+    """
+    Stops server process
+    :param process: server process
+    :type process: subprocess.Popen
+    """
+    process.terminate()
+    process.wait()
+
+
+def run_load(host: str, port: int, scenarios: List[Tuple[str, float, Callable]], concurrency: int,
+             duration: float, seed: int = 0) -> Tuple[Dict[str, list], Dict[str, int]]:
+    """
+    Sends GET requests from concurrent keep-alive connections for specified time, every connection picks
+    scenarios at random according to their weights
+    :param host: host of the server
+    :type host: str
+    :param port: port of the server
+    :type port: int
+    :param scenarios: list of tuples containing name, weight and function that receives random.Random
+    and returns path of a request
+    :type scenarios: List[Tuple[str, float, Callable]]
+    :param concurrency: number of connections
+    :type concurrency: int
+    :param duration: time in seconds
+    :type duration: float
+    :param seed: seed of random choices
+    :type seed: int
+    :return: tuple containing dicts mapping scenario names to lists of latencies in milliseconds
+    and to numbers of failed requests
+    :rtype: Tuple[Dict[str, list], Dict[str, int]]
+    """
+    weights = [weight for _, weight, _ in scenarios]
+    latencies, errors = defaultdict(list), defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(client_seed: int):
+        rng = random.Random(client_seed)
+        connection = http.client.HTTPConnection(host, port, timeout=60)
+        client_latencies, client_errors = defaultdict(list), defaultdict(int)
+        while time.monotonic() < deadline:
+            name, _, path_function = rng.choices(scenarios, weights)[0]
+            path = path_function(rng)
+            start = time.perf_counter()
+            try:
+                connection.request('GET', path)
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 400:
+                    client_errors[name] += 1
+            except (OSError, http.client.HTTPException):
+                client_errors[name] += 1
+                connection.close()
+                connection = http.client.HTTPConnection(host, port, timeout=60)
+            client_latencies[name].append((time.perf_counter() - start) * 1000)
+        connection.close()
+        with lock:
+            for name, values in client_latencies.items():
+                latencies[name].extend(values)
+            for name, value in client_errors.items():
+                errors[name] += value
+
+    threads = [threading.Thread(target=client, args=(seed * 1000 + index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return dict(latencies), dict(errors)
+
+
+def summarize(latencies: list, errors: int, duration: float) -> dict:
+    """
+    Returns throughput, error rate and latency percentiles of requests
+    :param latencies: list of latencies in milliseconds
+    :type latencies: list
+    :param errors: number of failed requests
+    :type errors: int
+    :param duration: time of the load in seconds
+    :type duration: float
+    :return: dict containing number of requests, requests per second, error rate and latency percentiles
+    :rtype: dict
+    """
+    if len(latencies) < 2:
+        percentiles = {'p50': None, 'p95': None, 'p99': None, 'max': max(latencies, default=None)}
+    else:
+        quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        percentiles = {'p50': quantiles[49], 'p95': quantiles[94], 'p99': quantiles[98], 'max': max(latencies)}
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / duration,
+        'error_rate': errors / len(latencies) if latencies else 0.0,
+        'latency_ms': percentiles,
+    }
@@ -0,0 +1,273 @@
+"""
+Module containing end-to-end load benchmark of the application, it seeds a dataset of specified scale,
+starts the application server and drives REST API endpoints and HTML pages with a mix of requests
+at every concurrency level of the profile, results are printed or written as JSON and can be compared
+with results of a previous run
+
+Usage: python -m benchmarks.load_benchmark [--scale 1k|100k|1m] [--server gunicorn|uvicorn] [--workers N]
+       [--concurrency 1,8,32] [--duration S] [--warmup S] [--scenarios name=weight,...]
+       [--output results.json] [--baseline baseline.json] [--no-seed] [--keep-data] [--url http://host:port]
+Uses database from SQLALCHEMY_TEST_DATABASE_URI, tables are created, seeded and dropped by the benchmark
+unless --no-seed and --keep-data are given, with --url the load is sent to a running server
+and the database is not touched. Load is generated by threads of this process, run it on a separate host
+or with fewer server workers than cores to keep the client from being the bottleneck.
+"""
+
+# pylint: disable=no-member
+import argparse
+import http.client
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from benchmarks.load import SERVERS, run_load, start_server, stop_server, summarize
+from department_app import create_app
+from department_app.database import db
+from department_app.seed import seed_database
+
+SCALES = {
+    '1k': (10, 1000),
+    '100k': (100, 100000),
+    '1m': (1000, 1000000),
+}
+
+SCENARIOS = {
+    'api_departments': lambda ids, rng: '/api/departments?include=',
+    'api_departments_page': lambda ids, rng: '/api/departments?limit=20&include=',
+    'api_department': lambda ids, rng: f'/api/departments/{rng.choice(ids["departments"])}',
+    'api_employees_department': lambda ids, rng: f'/api/employees?department_id={rng.choice(ids["departments"])}'
+                                                 f'&limit=50',
+    'api_employees_dates': lambda ids, rng: f'/api/employees?start_date={rng.randint(1960, 2000)}-01-01'
+                                            f'&end_date={rng.randint(1960, 2000)}-12-31&limit=50',
+    'api_employee': lambda ids, rng: f'/api/employees/{rng.choice(ids["employees"])}',
+    'html_departments': lambda ids, rng: '/departments/',
+    'html_employees': lambda ids, rng: f'/employees/?department_id={rng.choice(ids["departments"])}',
+}
+
+DEFAULT_WEIGHTS = {
+    'api_departments': 1,
+    'api_departments_page': 2,
+    'api_department': 3,
+    'api_employees_department': 4,
+    'api_employees_dates': 2,
+    'api_employee': 5,
+    'html_departments': 1,
+    'html_employees': 1,
+}
+
+
+def parse_weights(value: str) -> dict:
+    """
+    Parses scenario weights
+    :param value: comma separated pairs of scenario name and weight, e.g. 'api_employee=5,html_departments=1'
+    :type value: str
+    :return: dict mapping scenario names to weights
+    :rtype: dict
+    """
+    weights = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f'unknown scenario {name!r}, available: {", ".join(SCENARIOS)}')
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def get_json(host: str, port: int, path: str):
+    """
+    Sends GET request and returns decoded JSON body
+    """
+    connection = http.client.HTTPConnection(host, port, timeout=300)
+    try:
+        connection.request('GET', path)
+        response = connection.getresponse()
+        if response.status != 200:
+            raise RuntimeError(f'GET {path} returned {response.status}')
+        return json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def discover_ids(host: str, port: int) -> dict:
+    """
+    Returns ids of departments and a sample of employee ids read through REST API of the server
+    :rtype: dict
+    """
+    departments = get_json(host, port, '/api/departments?fields=department_id&include=')
+    employees = get_json(host, port, '/api/employees?fields=employee_id&limit=1000')
+    if not departments or not employees:
+        raise RuntimeError('database of the server contains no departments or employees')
+    return {'departments': [department['department_id'] for department in departments],
+            'employees': [employee['employee_id'] for employee in employees]}
+
+
+def run_profile(host: str, port: int, scenarios: list, args: argparse.Namespace) -> list:
+    """
+    Runs load at every concurrency level of the profile
+    :return: list of dicts containing summary of every stage and its scenarios
+    :rtype: list
+    """
+    stages = []
+    for stage, concurrency in enumerate(args.concurrency):
+        if args.warmup:
+            run_load(host, port, scenarios, concurrency, args.warmup, seed=stage)
+        latencies, errors = run_load(host, port, scenarios, concurrency, args.duration, seed=stage)
+        summary = summarize([latency for values in latencies.values() for latency in values],
+                            sum(errors.values()), args.duration)
+        summary = {'concurrency': concurrency, **summary}
+        summary['scenarios'] = {name: summarize(latencies.get(name, []), errors.get(name, 0), args.duration)
+                                for name, _, _ in scenarios}
+        stages.append(summary)
+        percentiles = ' '.join(f'{name} {value or 0:.1f} ms' for name, value in summary['latency_ms'].items()
+                               if name != 'max')
+        print(f'concurrency {concurrency:>4}: {summary["rps"]:>8.1f} req/s {percentiles} '
+              f'errors {summary["error_rate"]:.2%}', file=sys.stderr)
+    return stages
+
+
+def ratio(value, baseline_value):
+    """
+    Returns ratio of a value to its baseline or None if it cannot be computed
+    """
+    if value is None or not baseline_value:
+        return None
+    return value / baseline_value
+
+
+def compare(stages: list, baseline: dict) -> list:
+    """
+    Compares stages with stages of the same concurrency of a baseline run
+    :param stages: stages of the current run
+    :type stages: list
+    :param baseline: results of a baseline run
+    :type baseline: dict
+    :return: list of dicts containing ratios of throughput and latency percentiles to the baseline
+    :rtype: list
+    """
+    baseline_stages = {stage['concurrency']: stage for stage in baseline['stages']}
+    comparison = []
+    for stage in stages:
+        baseline_stage = baseline_stages.get(stage['concurrency'])
+        if baseline_stage is None:
+            continue
+        item = {'concurrency': stage['concurrency'], 'rps': ratio(stage['rps'], baseline_stage['rps'])}
+        for percentile in ('p50', 'p95', 'p99'):
+            item[percentile] = ratio(stage['latency_ms'][percentile], baseline_stage['latency_ms'][percentile])
+        item['error_rate_delta'] = stage['error_rate'] - baseline_stage['error_rate']
+        comparison.append(item)
+        print(f'concurrency {item["concurrency"]:>4} vs baseline: rps x{item["rps"] or 0:.2f} '
+              f'p50 x{item["p50"] or 0:.2f} p95 x{item["p95"] or 0:.2f} p99 x{item["p99"] or 0:.2f}', file=sys.stderr)
+    return comparison
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses command line arguments of the benchmark
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument('--server', choices=SERVERS, default='gunicorn')
+    parser.add_argument('--url', help='send load to a running server instead of starting one')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--concurrency', type=lambda value: [int(item) for item in value.split(',')],
+                        default=[1, 8, 32])
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--warmup', type=float, default=2)
+    parser.add_argument('--scenarios', type=parse_weights, default=DEFAULT_WEIGHTS)
+    parser.add_argument('--output', help='file to write JSON results to, they are printed if it is not given')
+    parser.add_argument('--baseline', help='JSON results of a previous run to compare with')
+    parser.add_argument('--no-seed', action='store_true', help='use data that is already in the database')
+    parser.add_argument('--keep-data', action='store_true', help='do not drop tables after the run')
+    return parser.parse_args()
+
+
+def run_local(scenarios: list, ids: dict, args: argparse.Namespace, results: dict) -> list:
+    """
+    Seeds the test database, starts a server on it and runs load at every concurrency level of the profile,
+    tables are dropped afterwards unless --keep-data is given
+    :param scenarios: list of tuples containing name, weight and function returning path of a request
+    :type scenarios: list
+    :param ids: dict the ids of departments and employees discovered on the server are stored to
+    :type ids: dict
+    :param args: command line arguments
+    :type args: argparse.Namespace
+    :param results: results of the run, seeding time is stored to it
+    :type results: dict
+    :return: list of dicts containing summary of every stage and its scenarios
+    :rtype: list
+    """
+    environment = dict(os.environ, SQLALCHEMY_DATABASE_URI=os.environ['SQLALCHEMY_TEST_DATABASE_URI'])
+    app = create_app(test_config=True)
+    with app.app_context():
+        db.create_all()
+        try:
+            if not args.no_seed:
+                start = time.perf_counter()
+                seed_database(*SCALES[args.scale], clear=True)
+                results['seed_seconds'] = time.perf_counter() - start
+            db.session.remove()
+            process = start_server(args.server, args.port, args.workers, environment)
+            try:
+                ids.update(discover_ids('127.0.0.1', args.port))
+                return run_profile('127.0.0.1', args.port, scenarios, args)
+            finally:
+                stop_server(process)
+        finally:
+            if not args.keep_data:
+                db.session.remove()
+                db.drop_all()
+
+
+def main():
+    """
+    Runs the benchmark and prints or writes results
+    """
+    args = parse_args()
+    number_of_departments, number_of_employees = SCALES[args.scale]
+    results = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'scale': args.scale,
+        'departments': number_of_departments,
+        'employees': number_of_employees,
+        'server': 'external' if args.url else args.server,
+        'workers': None if args.url else args.workers,
+        'duration': args.duration,
+        'weights': args.scenarios,
+    }
+
+    ids = {}
+
+    def scenario(name: str):
+        return lambda rng: SCENARIOS[name](ids, rng)
+
+    scenarios = [(name, weight, scenario(name)) for name, weight in args.scenarios.items()]
+
+    if args.url:
+        url = urlsplit(args.url)
+        results['url'] = args.url
+        ids.update(discover_ids(url.hostname, url.port or 80))
+        results['stages'] = run_profile(url.hostname, url.port or 80, scenarios, args)
+    else:
+        results['stages'] = run_local(scenarios, ids, args, results)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            results['baseline'] = args.baseline
+            results['comparison'] = compare(results['stages'], json.load(file))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Module containing benchmark that compares per-row time and memory of the ORM read path
+(identity-mapped objects and to_dict), the Core read path (rows mapped to DTOs and as_dict)
+and JSON built by the database of employees and departments list data, encoding is included
+
+Usage: python -m benchmarks.read_path_benchmark [--employees N] [--departments N] [--repeat N]
+Uses database from SQLALCHEMY_TEST_DATABASE_URI, tables are created and dropped by the benchmark
+"""
+
+# pylint: disable=no-member
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from benchmarks.filter_benchmark import populate_db
+from department_app import create_app
+from department_app.database import db
+from department_app.rest.representation import dumps
+from department_app.service import get_employees_with_filter, get_employees_data, get_employees_json, \
+    get_all_departments, get_departments_data, get_departments_json
+
+
+def measure(read, repeat: int) -> tuple:
+    """
+    Runs read function and returns its median time and peak memory usage
+    :param read: function returning JSON document
+    :param repeat: number of runs
+    :type repeat: int
+    :return: tuple containing size of the document, median time in milliseconds and peak memory usage in bytes
+    :rtype: tuple
+    """
+    timings = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        rows = read()
+        timings.append((time.perf_counter() - start) * 1000)
+        del rows
+    db.session.expunge_all()
+    tracemalloc.start()
+    rows = read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(rows), statistics.median(timings), peak
+
+
+def main():
+    """
+    Runs the benchmark and prints results
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--departments', type=int, default=200)
+    parser.add_argument('--employees', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    paths = {
+        'employees ORM': lambda: dumps([employee.to_dict()
+                                        for employee in get_employees_with_filter(loader=joinedload)]),
+        'employees Core': lambda: dumps(get_employees_data()),
+        'employees database': get_employees_json,
+        'departments ORM': lambda: dumps([department.to_dict() for department in get_all_departments(selectinload)]),
+        'departments Core': lambda: dumps(get_departments_data()),
+        'departments database': get_departments_json,
+    }
+    app = create_app(test_config=True)
+    with app.app_context():
+        db.create_all()
+        try:
+            populate_db(args.departments, args.employees)
+            for name, read in paths.items():
+                size, timing, peak = measure(read, args.repeat)
+                print(f'{name:<22} {timing:>9.1f} ms {timing * 1000 / args.employees:>7.2f} us/employee '
+                      f'{peak / 1024:>9.0f} KiB peak {peak / args.employees:>7.0f} B/employee '
+                      f'({size / 1024:.0f} KiB document)')
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+Module containing benchmark that compares HTML pages rendered with in-process data access
+against pages that fetch their data through HTTP requests back to the application
+
+Usage: python -m benchmarks.views_benchmark [--employees N] [--departments N] [--requests N]
+Uses database from SQLALCHEMY_TEST_DATABASE_URI, tables are created and dropped by the benchmark
+"""
+
+# pylint: disable=no-member
+import argparse
+import logging
+import random
+import statistics
+import threading
+import time
+from datetime import date, timedelta
+
+import requests
+from flask import Blueprint, Flask, render_template, url_for, g
+from werkzeug.serving import make_server
+
+from department_app import create_app
+from department_app.database import db
+from department_app.models import Department, Employee
+
+# seconds to wait for a response, so that a hung server fails the benchmark instead of hanging it
+REQUEST_TIMEOUT = 30
+
+legacy = Blueprint('legacy', __name__)
+
+
+@legacy.route('/legacy/employees/', methods=['GET'])
+def legacy_employees_view() -> str:
+    """
+    Renders employees page the way it was rendered before in-process data access, with two requests to the API
+    :return: rendered HTML page
+    :rtype: str
+    """
+    employees_json = requests.get(url_for('rest_api.employeesapi', _external=True),
+                                  timeout=REQUEST_TIMEOUT).json()
+    departments_json = requests.get(url_for('rest_api.departmentsapi', _external=True),
+                                    timeout=REQUEST_TIMEOUT).json()
+    return render_template('employees.html', employees=employees_json, departments=departments_json)
+
+
+@legacy.route('/legacy/departments/', methods=['GET'])
+def legacy_departments_view() -> str:
+    """
+    Renders departments page the way it was rendered before in-process data access, with one request to the API
+    :return: rendered HTML page
+    :rtype: str
+    """
+    departments_json = requests.get(url_for('rest_api.departmentsapi', _external=True),
+                                    timeout=REQUEST_TIMEOUT).json()
+    return render_template('departments.html', departments=departments_json)
+
+
+class WorkerMonitor:
+    """
+    Class that counts requests handled by the server and the highest number of requests handled at the same time
+    """
+    def __init__(self, app: Flask):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.handled = 0
+        app.before_request(self._started)
+        app.teardown_request(self._finished)
+
+    def _started(self):
+        with self._lock:
+            g.monitored = True
+            self.in_flight += 1
+            self.handled += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _finished(self, _exception):
+        if g.get('monitored'):
+            with self._lock:
+                self.in_flight -= 1
+
+    def reset(self):
+        """
+        Resets collected counters
+        """
+        with self._lock:
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.handled = 0
+
+
+def populate_db(number_of_departments: int, number_of_employees: int):
+    """
+    Populates database with generated departments and employees
+    :param number_of_departments: number of departments to create
+    :type number_of_departments: int
+    :param number_of_employees: number of employees to create
+    :type number_of_employees: int
+    """
+    departments = [Department(department_name=f'BENCH_DP{index}', department_phone_number='+380000000000')
+                   for index in range(number_of_departments)]
+    db.session.add_all(departments)
+    db.session.flush()
+    db.session.add_all(Employee(employee_name=f'BENCH_E{index}', position='Benchmark Subject',
+                                salary=random.randint(500, 5000),
+                                birthdate=date(1960, 1, 1) + timedelta(days=random.randint(0, 15000)),
+                                department_id=random.choice(departments).department_id)
+                       for index in range(number_of_employees))
+    db.session.commit()
+
+
+def measure(base_url: str, path: str, monitor: WorkerMonitor, number_of_requests: int) -> dict:
+    """
+    Requests page specified number of times and returns latency and worker usage statistics
+    :param base_url: url of the running server
+    :type base_url: str
+    :param path: path of the page
+    :type path: str
+    :param monitor: monitor attached to the application
+    :type monitor: WorkerMonitor
+    :param number_of_requests: number of page requests
+    :type number_of_requests: int
+    :return: dict containing latency and worker usage statistics
+    :rtype: dict
+    """
+    session = requests.Session()
+    session.get(base_url + path, timeout=REQUEST_TIMEOUT).raise_for_status()
+    monitor.reset()
+    latencies = []
+    for _ in range(number_of_requests):
+        start = time.perf_counter()
+        session.get(base_url + path, timeout=REQUEST_TIMEOUT).raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        'mean_ms': round(statistics.mean(latencies), 2),
+        'median_ms': round(statistics.median(latencies), 2),
+        'max_ms': round(max(latencies), 2),
+        'requests_per_page': monitor.handled / number_of_requests,
+        'peak_busy_workers': monitor.peak_in_flight,
+    }
+
+
+def main():
+    """
+    Runs the benchmark and prints results
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--departments', type=int, default=20)
+    parser.add_argument('--employees', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=50)
+    args = parser.parse_args()
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    app = create_app(test_config=True)
+    app.register_blueprint(legacy)
+    monitor = WorkerMonitor(app)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    app.config['SERVER_NAME'] = f'127.0.0.1:{server.server_port}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with app.app_context():
+        db.create_all()
+        populate_db(args.departments, args.employees)
+    try:
+        for page, legacy_page in (('/employees/', '/legacy/employees/'), ('/departments/', '/legacy/departments/')):
+            for name, path in (('loopback', legacy_page), ('in-process', page)):
+                result = measure(base_url, path, monitor, args.requests)
+                print(f'{page:<14} {name:<11} ' + ' '.join(f'{key}={value}' for key, value in result.items()))
+    finally:
+        server.shutdown()
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
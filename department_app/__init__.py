@@ -9,9 +9,14 @@ from flask_uuid import FlaskUUID
 from dotenv import load_dotenv
 
 from department_app import database
+from department_app import pool
+from department_app import cache
+from department_app import instrumentation
+from department_app import metrics
 from department_app import models
 from department_app import service
 from department_app import rest
+from department_app import seed
 from department_app import views
 
 
@@ -32,6 +37,8 @@ def create_app(test_config: bool = False) -> Flask:
     else:
         app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('SQLALCHEMY_TEST_DATABASE_URI')
         app.config.from_pyfile('test_config.py', silent=True)
+    # True to build JSON of whole collections in PostgreSQL when they are requested without pagination
+    app.config.setdefault('DATABASE_JSON_RESPONSES', False)
 
     try:
         os.makedirs(app.instance_path)
@@ -40,12 +47,20 @@ def create_app(test_config: bool = False) -> Flask:
 
     FlaskUUID(app)
 
+    pool.init_app(app)
+    models.init_app(app)
     database.db.init_app(app)
     database.migrate.init_app(app, database.db)
+    cache.response_cache.init_app(app)
+    instrumentation.init_app(app)
+    metrics.init_app(app)
     with app.app_context():
+        instrumentation.listen(database.db.engine)
         database.db.create_all()
 
     app.register_blueprint(rest.rest_api, url_prefix='/api')
     app.register_blueprint(views.departments)
     app.register_blueprint(views.employees)
+    app.cli.add_command(seed.seed_command)
+    app.cli.add_command(service.import_service.import_employees_command)
     return app
@@ -0,0 +1,250 @@
+"""
+Module containing async ASGI application serving the REST API
+
+GET requests of departments and employees collections and items are handled by coroutines that run queries
+of department_app.service.async_service on an async engine with asyncpg driver, all other requests are passed
+to the WSGI application, every request in its own thread, so routes, status codes and error bodies are the same
+as of the WSGI deployment. Requires asyncpg and asgiref packages.
+
+Requests handled by coroutines bypass Flask request hooks: their responses are not stored in or served from
+the response cache, they are not counted by Prometheus metrics and their queries are not recorded
+by SQL instrumentation (X-Query-Count header and slow query log). Requests passed to the WSGI application
+are handled with all of them.
+"""
+
+import re
+from typing import Tuple, Union
+from urllib.parse import parse_qsl, urlencode
+from uuid import UUID
+
+from asgiref.sync import ThreadSensitiveContext
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from werkzeug.http import parse_etags
+
+from department_app import create_app
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag, employee_tag
+from department_app.models import Department, Employee
+from department_app.pool import pool_options
+from department_app.rest.conditional import make_etag
+from department_app.rest.employee_api import parse_employees_filter_args
+from department_app.rest.fields import get_fields_args, with_fields, remove_fields
+from department_app.rest.pagination import pop_page_args, next_page_args
+from department_app.rest.representation import RawJSON, dumps
+from department_app.service import async_service, employee_department_tag
+
+UUID_PATTERN = '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """
+    Class for ASGI wrapper of a WSGI application that runs every request in its own thread
+    instead of a single thread shared by all requests
+    """
+    async def __call__(self, scope, receive, send):
+        async with ThreadSensitiveContext():
+            await super().__call__(scope, receive, send)
+
+
+def async_database_url(database_url: str) -> str:
+    """
+    Returns URL of the database with asyncpg driver
+    :param database_url: URL of the database used by the WSGI application
+    :type database_url: str
+    :return: URL of the database for the async engine
+    :rtype: str
+    """
+    return str(make_url(database_url).set(drivername='postgresql+asyncpg'))
+
+
+class AsyncRestAPI:
+    """
+    ASGI application serving GET requests of departments and employees asynchronously
+    and passing other requests to the WSGI application
+    """
+    def __init__(self, app: Flask):
+        self.app = app
+        self.engine = create_async_engine(async_database_url(app.config['SQLALCHEMY_DATABASE_URI']),
+                                          **pool_options(app.config))
+        self.session_factory = sessionmaker(self.engine, class_=AsyncSession)
+        self.wsgi = ThreadPoolWsgiToAsgi(app)
+        # routes contain pattern, handler and function returning cache tags of the data, like in REST API resources
+        self.routes = (
+            (re.compile('/api/departments'), self.get_departments, lambda: (DEPARTMENTS_TAG,)),
+            (re.compile(f'/api/departments/(?P<department_id>{UUID_PATTERN})'), self.get_department,
+             lambda department_id: (department_tag(department_id),)),
+            (re.compile('/api/employees'), self.get_employees, lambda: (EMPLOYEES_TAG,)),
+            (re.compile(f'/api/employees/(?P<employee_id>{UUID_PATTERN})'), self.get_employee,
+             lambda employee_id: (employee_tag(employee_id), employee_department_tag(employee_id))),
+        )
+
+    async def __call__(self, scope: dict, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            for pattern, handler, tags in self.routes:
+                match = pattern.fullmatch(scope['path'])
+                if match:
+                    params = {name: UUID(value) for name, value in match.groupdict().items()}
+                    await self.handle(handler, params, tags(**params), scope, send)
+                    return
+        await self.wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        """
+        Handles lifespan messages of the server, disposes the engine on shutdown
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle(self, handler, params: dict, tags: tuple, scope: dict, send):
+        """
+        Runs handler of a GET request, responds with 304 Not Modified if If-None-Match header of the request
+        contains ETag of the response, ETags are the same as of the WSGI application
+        :param handler: coroutine function returning tuple containing data, status code and headers
+        :param params: parameters of the route
+        :type params: dict
+        :param tags: cache tags of the data or SQL expressions returning them
+        :type tags: tuple
+        :param scope: scope of the request
+        :type scope: dict
+        :param send: function sending ASGI messages
+        """
+        args_items = parse_qsl(scope['query_string'].decode('latin-1'), keep_blank_values=True)
+        # the first value of an arg is used, like request.args.get does
+        request_args = dict(reversed(args_items))
+
+        async with self.session_factory() as session:
+            etag = make_etag(scope['path'], args_items, await async_service.get_data_version(session, *tags))
+            if parse_etags(dict(scope['headers']).get(b'if-none-match', b'').decode('latin-1')).contains(etag):
+                await send({'type': 'http.response.start', 'status': 304,
+                            'headers': [(b'etag', f'"{etag}"'.encode())]})
+                await send({'type': 'http.response.body', 'body': b''})
+                return
+            data, status_code, headers = await handler(session, scope, request_args, **params)
+
+        if status_code == 200:
+            headers['ETag'] = f'"{etag}"'
+        body = (data + '\n').encode() if isinstance(data, RawJSON) else dumps(data)
+        headers.update({'Content-Type': 'application/json', 'Content-Length': str(len(body))})
+        await send({'type': 'http.response.start', 'status': status_code,
+                    'headers': [(name.lower().encode(), value.encode()) for name, value in headers.items()]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    @staticmethod
+    def next_page_headers(scope: dict, request_args: dict, page: list, limit: Union[int, None],
+                          name_field: str, id_field: str) -> dict:
+        """
+        Returns headers with a link to the next page if the page is full
+        :param scope: scope of the request
+        :type scope: dict
+        :param request_args: request args that have to be preserved in the link
+        :type request_args: dict
+        :param page: list of item dicts of the current page
+        :type page: list
+        :param limit: page size, None if collection is not paginated
+        :type limit: int or None
+        :param name_field: name of the item field containing name
+        :type name_field: str
+        :param id_field: name of the item field containing id
+        :type id_field: str
+        :return: dict containing Link header or empty dict
+        :rtype: dict
+        """
+        next_args = next_page_args(request_args, page, limit, name_field, id_field)
+        if next_args is None:
+            return {}
+        server_host, server_port = scope['server']
+        host = dict(scope['headers']).get(b'host', b'').decode('latin-1') or f'{server_host}:{server_port}'
+        return {'Link': f'<{scope["scheme"]}://{host}{scope["path"]}?{urlencode(next_args)}>; rel="next"'}
+
+    async def get_departments(self, session: AsyncSession, scope: dict, request_args: dict) -> Tuple:
+        """
+        Returns list of departments, works like DepartmentsAPI.get
+        """
+        try:
+            limit, after = pop_page_args(request_args)
+            fields, include = get_fields_args(request_args, Department)
+        except ValueError as error:
+            return {'error': str(error)}, 400, {}
+        if limit is None and self.app.config['DATABASE_JSON_RESPONSES']:
+            departments_json = await async_service.get_departments_json(session, fields, include)
+            if departments_json is not None:
+                return RawJSON(departments_json), 200, {}
+        fields, key_fields = with_fields(fields, ('department_name', 'department_id'))
+        departments_dicts = await async_service.get_departments_data(session, limit, after, fields, include)
+        headers = self.next_page_headers(scope, request_args, departments_dicts, limit,
+                                         'department_name', 'department_id')
+        return remove_fields(departments_dicts, key_fields), 200, headers
+
+    @staticmethod
+    async def get_department(session: AsyncSession, _scope: dict, request_args: dict, department_id: UUID) -> Tuple:
+        """
+        Returns department with specified id, works like DepartmentAPI.get
+        """
+        try:
+            fields, include = get_fields_args(request_args, Department)
+        except ValueError as error:
+            return {'error': str(error)}, 400, {}
+        department = await async_service.get_department_data(session, department_id, fields, include)
+        if not department:
+            return {'error': 'Not Found'}, 404, {}
+        return department, 200, {}
+
+    async def get_employees(self, session: AsyncSession, scope: dict, request_args: dict) -> Tuple:
+        """
+        Returns list of employees, works like EmployeesAPI.get
+        """
+        try:
+            limit, after = pop_page_args(request_args)
+            fields, include = get_fields_args(request_args, Employee)
+        except ValueError as error:
+            return {'error': str(error)}, 400, {}
+        filters, error = parse_employees_filter_args(request_args)
+        if error:
+            return (*error, {})
+        if filters[0] is not None and not await async_service.department_exists(session, filters[0]):
+            return {'error': 'department not found'}, 404, {}
+        if limit is None and self.app.config['DATABASE_JSON_RESPONSES']:
+            employees_json = await async_service.get_employees_json(session, *filters, fields, include)
+            if employees_json is not None:
+                return RawJSON(employees_json), 200, {}
+        fields, key_fields = with_fields(fields, ('employee_name', 'employee_id'))
+        employees_dicts = await async_service.get_employees_data(session, *filters, limit, after, fields, include)
+        headers = self.next_page_headers(scope, request_args, employees_dicts, limit, 'employee_name', 'employee_id')
+        return remove_fields(employees_dicts, key_fields), 200, headers
+
+    @staticmethod
+    async def get_employee(session: AsyncSession, _scope: dict, request_args: dict, employee_id: UUID) -> Tuple:
+        """
+        Returns employee with specified id, works like EmployeeAPI.get
+        """
+        try:
+            fields, include = get_fields_args(request_args, Employee)
+        except ValueError as error:
+            return {'error': str(error)}, 400, {}
+        employee = await async_service.get_employee_data(session, employee_id, fields, include)
+        if not employee:
+            return {'error': 'Not Found'}, 404, {}
+        return employee, 200, {}
+
+
+def create_asgi_app(test_config: bool = False) -> AsyncRestAPI:
+    """
+    Initializes WSGI application and ASGI application serving it
+    :param test_config: True to use testing configuration
+    :type test_config: bool
+    :return: returns ASGI app
+    :rtype: AsyncRestAPI
+    """
+    return AsyncRestAPI(create_app(test_config))
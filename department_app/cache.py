@@ -0,0 +1,295 @@
+"""
+Module containing response cache used by REST API read endpoints
+
+Entries are tagged with the resources they contain and are invalidated by the service functions
+that change these resources. The in-process backend is local to a worker, so keys of entries also contain
+versions of cache tags of the resource when a conditional request decorator has read them (flask.g.data_version),
+which makes changes made through other workers visible immediately.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import wraps
+from typing import Callable, Iterable, Union
+from urllib.parse import urlencode
+
+from flask import Flask, current_app, g, request
+
+DEPARTMENTS_TAG = 'departments'
+EMPLOYEES_TAG = 'employees'
+
+
+def department_tag(department_id) -> str:
+    """
+    Returns tag of cache entries that contain department with specified id
+    :param department_id: id of a department
+    :return: cache tag
+    :rtype: str
+    """
+    return f'department:{department_id}'
+
+
+def employee_tag(employee_id) -> str:
+    """
+    Returns tag of cache entries that contain employee with specified id
+    :param employee_id: id of an employee
+    :return: cache tag
+    :rtype: str
+    """
+    return f'employee:{employee_id}'
+
+
+class MemoryCacheBackend:
+    """
+    In-process cache backend that evicts least recently used entries and entries older than ttl
+    """
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._tags = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """
+        Returns cached value or None if there is no valid entry with specified key
+        :param key: key of an entry
+        :type key: str
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, tags: Iterable[str]):
+        """
+        Stores value with specified key and tags
+        :param key: key of an entry
+        :type key: str
+        :param value: value to store
+        :param tags: tags of the entry
+        :type tags: Iterable[str]
+        """
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+            for tag in tags:
+                self._tags[tag].add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]):
+        """
+        Removes entries that have any of specified tags
+        :param tags: tags of entries
+        :type tags: Iterable[str]
+        """
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    self._remove(key)
+
+    def size(self) -> int:
+        """
+        Returns number of stored entries
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend:
+    """
+    Cache backend shared by all workers, stores entries in redis, requires redis package
+    """
+    def __init__(self, url: str, ttl: float, prefix: str = 'department_app:cache:'):
+        import redis  # pylint: disable=import-outside-toplevel
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key: str):
+        """
+        Returns cached value or None if there is no valid entry with specified key
+        :param key: key of an entry
+        :type key: str
+        """
+        value = self._redis.get(self.prefix + key)
+        return pickle.loads(value) if value is not None else None
+
+    def set(self, key: str, value, tags: Iterable[str]):
+        """
+        Stores value with specified key and tags
+        :param key: key of an entry
+        :type key: str
+        :param value: value to store
+        :param tags: tags of the entry
+        :type tags: Iterable[str]
+        """
+        ttl = max(int(self.ttl), 1)
+        pipeline = self._redis.pipeline()
+        pipeline.set(self.prefix + key, pickle.dumps(value), ex=ttl)
+        for tag in tags:
+            pipeline.sadd(self.prefix + 'tag:' + tag, self.prefix + key)
+            pipeline.expire(self.prefix + 'tag:' + tag, ttl)
+        pipeline.execute()
+
+    def invalidate(self, tags: Iterable[str]):
+        """
+        Removes entries that have any of specified tags
+        :param tags: tags of entries
+        :type tags: Iterable[str]
+        """
+        for tag in tags:
+            tag_key = self.prefix + 'tag:' + tag
+            keys = self._redis.smembers(tag_key)
+            self._redis.delete(tag_key, *keys)
+
+    def size(self) -> int:
+        """
+        Returns number of stored entries
+        :rtype: int
+        """
+        return sum(1 for key in self._redis.scan_iter(self.prefix + '*') if b':tag:' not in key)
+
+
+class _CacheState:
+    """
+    Class containing cache backend and counters of an application
+    """
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def count(self, is_hit: bool):
+        """
+        Increments hit or miss counter
+        :param is_hit: True for a hit, False for a miss
+        :type is_hit: bool
+        """
+        with self.lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class ResponseCache:
+    """
+    Class for cache of REST API responses, backend is configured with RESPONSE_CACHE_BACKEND
+    ('memory', 'redis' or None to disable caching), RESPONSE_CACHE_TTL, RESPONSE_CACHE_SIZE
+    and RESPONSE_CACHE_REDIS_URL
+    """
+    @staticmethod
+    def init_app(app: Flask):
+        """
+        Sets default cache configuration of the application
+        :param app: Flask application
+        :type app: Flask
+        """
+        app.config.setdefault('RESPONSE_CACHE_BACKEND', 'memory')
+        app.config.setdefault('RESPONSE_CACHE_TTL', 30)
+        app.config.setdefault('RESPONSE_CACHE_SIZE', 1024)
+        app.config.setdefault('RESPONSE_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+    @staticmethod
+    def _state() -> Union[_CacheState, None]:
+        state = current_app.extensions.get('response_cache')
+        if state is None:
+            backend_name = current_app.config.get('RESPONSE_CACHE_BACKEND')
+            ttl = current_app.config.get('RESPONSE_CACHE_TTL', 30)
+            if backend_name == 'memory':
+                backend = MemoryCacheBackend(current_app.config.get('RESPONSE_CACHE_SIZE', 1024), ttl)
+            elif backend_name == 'redis':
+                backend = RedisCacheBackend(current_app.config['RESPONSE_CACHE_REDIS_URL'], ttl)
+            elif not backend_name:
+                backend = None
+            else:
+                raise ValueError(f'unknown RESPONSE_CACHE_BACKEND {backend_name!r}')
+            state = current_app.extensions.setdefault('response_cache', _CacheState(backend))
+        return state if state.backend is not None else None
+
+    def cached(self, tags: Callable[..., Iterable[str]]) -> Callable:
+        """
+        Decorator that caches successful responses of a resource method,
+        key of an entry is built from request path, query args and version of the data if it is known
+        :param tags: function that receives response data and keyword arguments of the method
+        and returns tags of the entry
+        :type tags: Callable[..., Iterable[str]]
+        :return: decorator
+        :rtype: Callable
+        """
+        def decorator(method: Callable) -> Callable:
+            @wraps(method)
+            def wrapper(*args, **kwargs):
+                state = self._state()
+                if state is None:
+                    return method(*args, **kwargs)
+
+                key = f'{request.host}{request.path}?{urlencode(sorted(request.args.items(multi=True)))}'
+                if 'data_version' in g:
+                    key += f'#{g.data_version}'
+                response = state.backend.get(key)
+                state.count(response is not None)
+                if response is not None:
+                    data, status_code, headers = response
+                    return data, status_code, dict(headers, **{'X-Cache': 'HIT'})
+
+                response = method(*args, **kwargs)
+                data, status_code, headers = (tuple(response) + ({},))[:3]
+                if status_code == 200:
+                    state.backend.set(key, (data, status_code, headers), tags(data, **kwargs))
+                return data, status_code, dict(headers, **{'X-Cache': 'MISS'})
+            return wrapper
+        return decorator
+
+    def invalidate(self, *tags: str):
+        """
+        Removes cached responses that have any of specified tags
+        :param tags: tags of entries
+        :type tags: str
+        """
+        state = self._state()
+        if state is not None:
+            state.backend.invalidate(tags)
+
+    def stats(self) -> dict:
+        """
+        Returns cache counters of the application
+        :return: dict containing backend name, number of hits, misses and stored entries
+        :rtype: dict
+        """
+        state = self._state()
+        if state is None:
+            return {'backend': None, 'hits': 0, 'misses': 0, 'size': 0}
+        return {
+            'backend': current_app.config.get('RESPONSE_CACHE_BACKEND'),
+            'hits': state.hits,
+            'misses': state.misses,
+            'size': state.backend.size(),
+        }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,134 @@
+"""
+Module containing per-request instrumentation of SQL statements
+
+Cursor execution listeners of the database engine count statements executed while handling a request
+and measure their total and longest execution time. Counters of the current request are stored
+in flask.g.query_stats, with SQL_INSTRUMENTATION_HEADERS enabled they are sent in X-Query-Count
+and Server-Timing response headers. Statements slower than SLOW_QUERY_THRESHOLD seconds are logged
+by department_app.slow_query logger with parameter values redacted.
+"""
+
+import logging
+import time
+
+from flask import Flask, Response, current_app, g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+slow_query_logger = logging.getLogger('department_app.slow_query')
+
+
+class QueryStats:
+    """
+    Class containing counters of SQL statements executed while handling a request
+    """
+    __slots__ = ('count', 'total_time', 'max_time')
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, duration: float):
+        """
+        Records executed statement
+        :param duration: execution time in seconds
+        :type duration: float
+        """
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+    def server_timing(self) -> str:
+        """
+        Returns value of Server-Timing header
+        :rtype: str
+        """
+        return (f'db;desc="{self.count} queries";dur={self.total_time * 1000:.2f}, '
+                f'db-max;desc="slowest query";dur={self.max_time * 1000:.2f}')
+
+
+def redact_parameters(parameters, executemany: bool = False):
+    """
+    Returns copy of statement parameters with values replaced by '?', keys and positions are kept
+    :param parameters: dict, tuple or list of parameters
+    :param executemany: True if parameters is a sequence of parameter sets
+    :type executemany: bool
+    :return: redacted parameters
+    """
+    if executemany:
+        return f'{len(parameters)} parameter sets'
+    if isinstance(parameters, dict):
+        return {key: '?' for key in parameters}
+    if isinstance(parameters, (list, tuple)):
+        return tuple('?' for _ in parameters)
+    return '?'
+
+
+def before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    """
+    Engine event listener storing start time of a statement
+    """
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, _cursor, statement, parameters, _context, executemany):
+    """
+    Engine event listener recording execution time of a statement in counters of the current request
+    and logging slow statement
+    """
+    duration = time.perf_counter() - conn.info['query_start_time'].pop()
+    if not has_app_context():
+        return
+    query_stats = g.get('query_stats')
+    if query_stats is not None:
+        query_stats.record(duration)
+    threshold = current_app.config['SLOW_QUERY_THRESHOLD']
+    if threshold is not None and duration >= threshold:
+        slow_query_logger.warning('slow query (%.1f ms): %s; parameters: %s', duration * 1000,
+                                  ' '.join(statement.split()), redact_parameters(parameters, executemany))
+
+
+def start_request():
+    """
+    Resets counters of SQL statements of the current request
+    """
+    g.query_stats = QueryStats()
+
+
+def add_headers(response: Response) -> Response:
+    """
+    Adds X-Query-Count and Server-Timing headers to the response if SQL_INSTRUMENTATION_HEADERS is enabled
+    :param response: response of the request
+    :type response: Response
+    :return: response
+    :rtype: Response
+    """
+    query_stats = g.get('query_stats')
+    if query_stats is not None and current_app.config['SQL_INSTRUMENTATION_HEADERS']:
+        response.headers['X-Query-Count'] = str(query_stats.count)
+        response.headers.add('Server-Timing', query_stats.server_timing())
+    return response
+
+
+def listen(engine: Engine):
+    """
+    Installs cursor execution listeners on the engine
+    :param engine: database engine
+    :type engine: Engine
+    """
+    if not event.contains(engine, 'before_cursor_execute', before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+
+def init_app(app: Flask):
+    """
+    Sets default instrumentation configuration and registers request hooks of the application
+    :param app: Flask application
+    :type app: Flask
+    """
+    app.config.setdefault('SQL_INSTRUMENTATION_HEADERS', False)
+    app.config.setdefault('SLOW_QUERY_THRESHOLD', 0.5)
+    app.before_request(start_request)
+    app.after_request(add_headers)
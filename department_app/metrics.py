@@ -0,0 +1,130 @@
+"""
+Module containing Prometheus metrics of requests served by the application
+
+Requests are counted by endpoint, method and status, their latency, response size and time spent
+in SQL statements are recorded in histograms, requests in progress are tracked by a gauge, metrics are served
+in Prometheus text format at /metrics. With several workers PROMETHEUS_MULTIPROC_DIR environment variable
+has to point to an empty directory shared by the workers, they write metrics to memory-mapped files there
+and /metrics aggregates them. Requires prometheus_client package, metrics are disabled if it is not installed
+or METRICS_ENABLED is False.
+"""
+
+import os
+import time
+
+from flask import Flask, Response, g, request
+
+try:
+    import prometheus_client
+    from prometheus_client import Counter, Gauge, Histogram, multiprocess
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+LABELS = ('endpoint', 'method')
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+DB_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+if prometheus_client is not None:
+    REQUESTS = Counter('http_requests_total', 'Number of handled requests', LABELS + ('status',))
+    REQUEST_DURATION = Histogram('http_request_duration_seconds', 'Request latency', LABELS)
+    REQUESTS_IN_PROGRESS = Gauge('http_requests_in_progress', 'Number of requests in progress', LABELS,
+                                 multiprocess_mode='livesum')
+    RESPONSE_SIZE = Histogram('http_response_size_bytes', 'Size of response body', LABELS, buckets=SIZE_BUCKETS)
+    DB_DURATION = Histogram('http_request_db_duration_seconds', 'Time spent in SQL statements of a request', LABELS,
+                            buckets=DB_TIME_BUCKETS)
+else:  # pragma: no cover
+    REQUESTS = REQUEST_DURATION = REQUESTS_IN_PROGRESS = RESPONSE_SIZE = DB_DURATION = None
+
+
+def request_labels() -> tuple:
+    """
+    Returns labels of the current request, requests that do not match any route share 'none' endpoint
+    :return: tuple containing endpoint and method
+    :rtype: tuple
+    """
+    return request.endpoint or 'none', request.method
+
+
+def start_request():
+    """
+    Stores labels and start time of the request and increments gauge of requests in progress
+    """
+    g.metrics_labels = request_labels()
+    g.metrics_start_time = time.perf_counter()
+    REQUESTS_IN_PROGRESS.labels(*g.metrics_labels).inc()
+
+
+def record_response(response: Response) -> Response:
+    """
+    Records status, latency, size and database time of the request
+    :param response: response of the request
+    :type response: Response
+    :return: response
+    :rtype: Response
+    """
+    start_time = g.pop('metrics_start_time', None)
+    if start_time is None:
+        return response
+    labels = g.metrics_labels
+    REQUESTS.labels(*labels, response.status_code).inc()
+    REQUEST_DURATION.labels(*labels).observe(time.perf_counter() - start_time)
+    if response.content_length is not None:
+        RESPONSE_SIZE.labels(*labels).observe(response.content_length)
+    query_stats = g.get('query_stats')
+    if query_stats is not None:
+        DB_DURATION.labels(*labels).observe(query_stats.total_time)
+    return response
+
+
+def finish_request(_error):
+    """
+    Decrements gauge of requests in progress, records request that has failed with unhandled exception
+    """
+    labels = g.pop('metrics_labels', None)
+    if labels is None:
+        return
+    REQUESTS_IN_PROGRESS.labels(*labels).dec()
+    start_time = g.pop('metrics_start_time', None)
+    if start_time is not None:
+        REQUESTS.labels(*labels, 500).inc()
+        REQUEST_DURATION.labels(*labels).observe(time.perf_counter() - start_time)
+
+
+def metrics_view() -> Response:
+    """
+    Returns metrics of all workers in Prometheus text format
+    :rtype: Response
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return Response(prometheus_client.generate_latest(registry), mimetype=prometheus_client.CONTENT_TYPE_LATEST)
+
+
+def mark_process_dead(pid: int):
+    """
+    Removes live gauge values of a stopped worker, has to be called by the server when a worker exits
+    :param pid: process id of the worker
+    :type pid: int
+    """
+    if prometheus_client is not None and 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
+def init_app(app: Flask):
+    """
+    Sets default metrics configuration, registers request hooks and /metrics route of the application
+    :param app: Flask application
+    :type app: Flask
+    """
+    app.config.setdefault('METRICS_ENABLED', prometheus_client is not None)
+    if not app.config['METRICS_ENABLED']:
+        return
+    if prometheus_client is None:
+        raise ValueError('METRICS_ENABLED requires prometheus_client package')
+    app.before_request(start_request)
+    app.after_request(record_response)
+    app.teardown_request(finish_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
@@ -0,0 +1,31 @@
+"""Department on delete policy.
+
+Revision ID: 3d9b2e6f1a47
+Revises: 8a3f6d2b7c15
+Create Date: 2026-10-18 16:05:23.841467
+
+ON DELETE policy of the foreign key is read from DEPARTMENT_ON_DELETE of the application config,
+to change the policy of an existing database downgrade to 8a3f6d2b7c15 and upgrade again.
+"""
+from alembic import op
+from flask import current_app
+
+from department_app.models import department_on_delete
+
+
+# revision identifiers, used by Alembic.
+revision = '3d9b2e6f1a47'
+down_revision = '8a3f6d2b7c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_constraint('employee_department_id_fkey', 'employee', type_='foreignkey')
+    op.create_foreign_key('employee_department_id_fkey', 'employee', 'department',
+                          ['department_id'], ['department_id'], ondelete=department_on_delete(current_app.config))
+
+
+def downgrade():
+    op.drop_constraint('employee_department_id_fkey', 'employee', type_='foreignkey')
+    op.create_foreign_key('employee_department_id_fkey', 'employee', 'department', ['department_id'], ['department_id'])
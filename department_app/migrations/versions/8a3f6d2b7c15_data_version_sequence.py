@@ -0,0 +1,24 @@
+"""Data version sequence.
+
+Revision ID: 8a3f6d2b7c15
+Revises: 5c1e7a9d2f40
+Create Date: 2026-10-18 11:40:07.512931
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a3f6d2b7c15'
+down_revision = '5c1e7a9d2f40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(sa.schema.CreateSequence(sa.Sequence('data_version_seq')))
+
+
+def downgrade():
+    op.execute(sa.schema.DropSequence(sa.Sequence('data_version_seq')))
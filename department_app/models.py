@@ -2,14 +2,29 @@
 Module containing database models objects
 """
 
+import os
 import uuid
+from typing import Iterable, Union
 
-from sqlalchemy import Column, String, Float, Date, ForeignKey
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import Column, String, Float, Date, ForeignKey, Index, Sequence, BigInteger, event, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, query_expression
 
 from department_app.database import db
 
+# source of versions of data versions, so a version is never repeated even if its row is replaced
+data_version_seq = Sequence('data_version_seq', metadata=db.Model.metadata)
+
+
+class DataVersion(db.Model):
+    """
+    Class for version of data that cached responses with a cache tag (e.g. department:<id> or employees) contain,
+    it is changed in the same transaction as the data and is used to validate ETags and cached responses
+    """
+    tag = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+
 
 class Department(db.Model):
     """
@@ -19,44 +34,73 @@ class Department(db.Model):
     department_name = Column(String)
     department_phone_number = Column(String)
 
-    employees = relationship("Employee", backref="department")
+    # employees are handled by ON DELETE policy of the foreign key when a department is deleted
+    employees = relationship("Employee", back_populates="department", passive_deletes=True)
+
+    # names of fields and related objects that can be selected for dictionary representation
+    FIELDS = ('department_id', 'department_name', 'department_phone_number', 'number_of_employees', 'average_salary')
+    RELATIONS = ('employees',)
+
+    # populated by queries that compute employees statistics in SQL, None otherwise
+    loaded_number_of_employees = query_expression()
+    loaded_average_salary = query_expression()
 
     @property
     def number_of_employees(self) -> int:
         """
-        Property that calculates number of employees related to the department
+        Property that calculates number of employees related to the department,
+        uses value computed by the database if it has been loaded
         :return: number of employees related to the department
         :rtype: int
         """
+        if self.loaded_number_of_employees is not None:
+            return self.loaded_number_of_employees
         return len(self.employees)
 
     @property
     def average_salary(self) -> float:
         """
-        Property that calculates average salary of employees related to the department
+        Property that calculates average salary of employees related to the department,
+        uses value computed by the database if it has been loaded
         :return: average salary of employees related to the department
         :rtype: float
         """
+        if self.loaded_average_salary is not None:
+            return self.loaded_average_salary
         if self.number_of_employees > 0:
             average_salary = (sum(employee.salary for employee in self.employees) / self.number_of_employees)
         else:
             average_salary = 0
         return average_salary
 
-    def to_dict(self) -> dict:
+    def to_dict(self, fields: Union[Iterable[str], None] = None, include: Union[Iterable[str], None] = None) -> dict:
         """
-        Method returns dictionary representation of the Department
+        Method returns dictionary representation of the Department, ids are not converted to strings
+        :param fields: names of fields to represent, None to represent all fields
+        :type fields: Iterable[str] or None
+        :param include: names of related objects to embed, employees are embedded without their department,
+        None to embed employees with their department
+        :type include: Iterable[str] or None
         :return: dictionary representation of the Department
         :rtype: dict
         """
-        return {
-            'department_id': str(self.department_id),
-            'department_name': self.department_name,
-            'department_phone_number': self.department_phone_number,
-            'number_of_employees': self.number_of_employees,
-            'average_salary': self.average_salary,
-            'employees': tuple(employee.to_dict() for employee in self.employees),
-        }
+        fields = self.FIELDS if fields is None else fields
+        department_dict = {}
+        if 'department_id' in fields:
+            department_dict['department_id'] = self.department_id
+        if 'department_name' in fields:
+            department_dict['department_name'] = self.department_name
+        if 'department_phone_number' in fields:
+            department_dict['department_phone_number'] = self.department_phone_number
+        if 'number_of_employees' in fields:
+            department_dict['number_of_employees'] = self.number_of_employees
+        if 'average_salary' in fields:
+            department_dict['average_salary'] = self.average_salary
+        if include is None:
+            department_dict['employees'] = tuple(employee.to_dict() for employee in self.employees)
+        elif 'employees' in include:
+            department_dict['employees'] = tuple(employee.to_dict(include=()) for employee in self.employees)
+        return department_dict
 
 
 class Employee(db.Model):
@@ -67,26 +111,102 @@ class Employee(db.Model):
     employee_name = Column(String)
     position = Column(String)
     salary = Column(Float)
-    birthdate = Column(Date)
-    department_id = Column(UUID(as_uuid=True), ForeignKey('department.department_id'))
+    birthdate = Column(Date, index=True)
+    # ON DELETE policy of tables created by an application is set by apply_department_on_delete
+    department_id = Column(UUID(as_uuid=True), ForeignKey('department.department_id', ondelete='SET NULL'),
+                           index=True)
+
+    department = relationship("Department", back_populates="employees")
+
+    __table_args__ = (
+        Index('ix_employee_department_id_birthdate', 'department_id', 'birthdate'),
+    )
 
-    def to_dict(self) -> dict:
+    # names of fields and related objects that can be selected for dictionary representation
+    FIELDS = ('employee_id', 'employee_name', 'position', 'salary', 'birthdate', 'department_id')
+    RELATIONS = ('department',)
+
+    def to_dict(self, fields: Union[Iterable[str], None] = None, include: Union[Iterable[str], None] = None) -> dict:
         """
-        Method returns dictionary representation of the Employee
+        Method returns dictionary representation of the Employee, ids and birthdate are not converted to strings
+        :param fields: names of fields to represent, None to represent all fields
+        :type fields: Iterable[str] or None
+        :param include: names of related objects to embed, None to embed department
+        :type include: Iterable[str] or None
         :return: dictionary representation of the Employee
         :rtype: dict
         """
-        return {
-            'employee_id': str(self.employee_id),
-            'employee_name': self.employee_name,
-            'position': self.position,
-            'salary': self.salary,
-            'birthdate': str(self.birthdate),
-            'department_id': str(self.department_id),
-            'department': {
-                'department_id': str(self.department.department_id),
+        fields = self.FIELDS if fields is None else fields
+        include = self.RELATIONS if include is None else include
+        employee_dict = {}
+        if 'employee_id' in fields:
+            employee_dict['employee_id'] = self.employee_id
+        if 'employee_name' in fields:
+            employee_dict['employee_name'] = self.employee_name
+        if 'position' in fields:
+            employee_dict['position'] = self.position
+        if 'salary' in fields:
+            employee_dict['salary'] = self.salary
+        if 'birthdate' in fields:
+            employee_dict['birthdate'] = self.birthdate
+        if 'department_id' in fields:
+            employee_dict['department_id'] = self.department_id
+        if 'department' in include:
+            employee_dict['department'] = {
+                'department_id': self.department.department_id,
                 'department_name': self.department.department_name,
                 'department_phone_number': self.department.department_phone_number
-            }
+            } if self.department is not None else None
+        return employee_dict
+
+
+# policies of deleting a department that has employees: leave them without a department, delete them
+# or refuse to delete the department, the first one is the policy of the model
+DEPARTMENT_ON_DELETE_POLICIES = ('SET NULL', 'CASCADE', 'RESTRICT')
+# name PostgreSQL gives to the foreign key of employees to departments
+DEPARTMENT_FOREIGN_KEY_NAME = 'employee_department_id_fkey'
 
-        }
+
+def department_on_delete(config: dict) -> str:
+    """
+    Returns ON DELETE policy of foreign key of employees to departments set in DEPARTMENT_ON_DELETE key of config
+    :param config: dict containing DEPARTMENT_ON_DELETE key, 'SET NULL' is used if it is not set
+    :type config: dict
+    :return: one of DEPARTMENT_ON_DELETE_POLICIES
+    :rtype: str
+    """
+    policy = (config.get('DEPARTMENT_ON_DELETE') or 'SET NULL').upper().replace('_', ' ')
+    if policy not in DEPARTMENT_ON_DELETE_POLICIES:
+        raise ValueError('DEPARTMENT_ON_DELETE is invalid')
+    return policy
+
+
+@event.listens_for(Employee.__table__, 'after_create')
+def apply_department_on_delete(_table, connection, **_kwargs):
+    """
+    Replaces the foreign key of employees to departments of a just created employee table with a foreign key
+    with ON DELETE policy of the current application, the shared table metadata is not changed,
+    so applications with different policies can work in the same process
+    """
+    policy = department_on_delete(current_app.config) if has_app_context() else DEPARTMENT_ON_DELETE_POLICIES[0]
+    if policy == DEPARTMENT_ON_DELETE_POLICIES[0]:
+        return
+    if connection.dialect.name != 'postgresql':
+        raise ValueError('DEPARTMENT_ON_DELETE requires PostgreSQL')
+    connection.execute(text(
+        f'ALTER TABLE {Employee.__tablename__} DROP CONSTRAINT {DEPARTMENT_FOREIGN_KEY_NAME}, '
+        f'ADD CONSTRAINT {DEPARTMENT_FOREIGN_KEY_NAME} FOREIGN KEY (department_id) '
+        f'REFERENCES {Department.__tablename__} (department_id) ON DELETE {policy}'
+    ))
+
+
+def init_app(app: Flask):
+    """
+    Reads ON DELETE policy of the foreign key of employees to departments from DEPARTMENT_ON_DELETE key
+    of instance config or environment variable, the policy is used by tables created by the application
+    and by the migration that adds it
+    :param app: Flask application
+    :type app: Flask
+    """
+    app.config.setdefault('DEPARTMENT_ON_DELETE', os.getenv('DEPARTMENT_ON_DELETE'))
+    app.config['DEPARTMENT_ON_DELETE'] = department_on_delete(app.config)
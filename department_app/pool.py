@@ -0,0 +1,199 @@
+"""
+Module containing configuration and instrumentation of the database connection pool
+
+Pool options are read from DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW, DATABASE_POOL_TIMEOUT,
+DATABASE_POOL_RECYCLE and DATABASE_POOL_PRE_PING keys of instance config or environment variables
+with the same names, unset options keep SQLAlchemy defaults and SQLALCHEMY_ENGINE_OPTIONS of instance config
+take precedence. The pool counts checkouts, time spent waiting for a connection, timeouts, new connections
+and invalidations, so pool starvation can be told apart from slow queries.
+"""
+
+import os
+import threading
+import time
+
+from flask import Flask
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+
+def parse_bool(value) -> bool:
+    """
+    Converts config value to bool
+    :param value: bool or string such as 'true', '1', 'no'
+    :return: converted value
+    :rtype: bool
+    """
+    if isinstance(value, bool):
+        return value
+    if str(value).lower() in ('1', 'true', 'yes', 'on'):
+        return True
+    if str(value).lower() in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError(value)
+
+
+POOL_SETTINGS = {
+    'DATABASE_POOL_SIZE': ('pool_size', int),
+    'DATABASE_MAX_OVERFLOW': ('max_overflow', int),
+    'DATABASE_POOL_TIMEOUT': ('pool_timeout', float),
+    'DATABASE_POOL_RECYCLE': ('pool_recycle', int),
+    'DATABASE_POOL_PRE_PING': ('pool_pre_ping', parse_bool),
+}
+
+
+def pool_options(config: dict) -> dict:
+    """
+    Returns engine keyword arguments of the pool options that are set in config
+    :param config: dict containing DATABASE_POOL_* keys
+    :type config: dict
+    :return: dict of engine keyword arguments
+    :rtype: dict
+    """
+    options = {}
+    for name, (option, convert) in POOL_SETTINGS.items():
+        value = config.get(name)
+        if value is None or value == '':
+            continue
+        try:
+            options[option] = convert(value)
+        except ValueError:
+            raise ValueError(f'{name} is invalid') from None
+    return options
+
+
+class PoolMetrics:
+    """
+    Class containing counters of a connection pool
+    """
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.peak_checked_out = 0
+        self.lock = threading.Lock()
+
+    def record_checkout(self, wait: float, checked_out: int):
+        """
+        Records successful checkout
+        :param wait: time spent waiting for a connection in seconds
+        :type wait: float
+        :param checked_out: number of connections in use after the checkout
+        :type checked_out: int
+        """
+        with self.lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self, wait: float):
+        """
+        Records checkout that has failed because no connection became available in time
+        :param wait: time spent waiting for a connection in seconds
+        :type wait: float
+        """
+        with self.lock:
+            self.timeouts += 1
+            self.checkout_wait_total += wait
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+
+    def on_connect(self, _dbapi_connection, _connection_record):
+        """
+        Pool event listener counting new database connections
+        """
+        with self.lock:
+            self.connects += 1
+
+    def on_invalidate(self, _dbapi_connection, _connection_record, _exception):
+        """
+        Pool event listener counting invalidated connections
+        """
+        with self.lock:
+            self.invalidations += 1
+
+    def as_dict(self) -> dict:
+        """
+        Returns counters
+        :rtype: dict
+        """
+        with self.lock:
+            return {
+                'checkouts': self.checkouts,
+                'checkout_wait_total': self.checkout_wait_total,
+                'checkout_wait_max': self.checkout_wait_max,
+                'timeouts': self.timeouts,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'peak_checked_out': self.peak_checked_out,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    Queue pool that measures time spent waiting for a connection, counters are kept when the pool is recreated
+    by Engine.dispose
+    """
+    def __init__(self, creator, **kw):
+        super().__init__(creator, **kw)
+        self.metrics = PoolMetrics()
+        if '_dispatch' not in kw:
+            # listeners are copied to recreated pools together with dispatch
+            event.listen(self, 'connect', self.metrics.on_connect)
+            event.listen(self, 'invalidate', self.metrics.on_invalidate)
+            event.listen(self, 'soft_invalidate', self.metrics.on_invalidate)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection_record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start, self.checkedout())
+        return connection_record
+
+
+def pool_stats(engine: Engine) -> dict:
+    """
+    Returns state and counters of the connection pool of an engine
+    :param engine: database engine
+    :type engine: Engine
+    :return: dict containing pool class, size, numbers of connections in use, idle and overflow connections
+    and counters if the pool is instrumented
+    :rtype: dict
+    """
+    pool = engine.pool
+    stats = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({'size': pool.size(), 'checked_out': pool.checkedout(), 'checked_in': pool.checkedin(),
+                      'overflow': pool.overflow()})
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(pool.metrics.as_dict())
+    return stats
+
+
+def init_app(app: Flask):
+    """
+    Builds SQLALCHEMY_ENGINE_OPTIONS of the application from pool options of instance config
+    and environment variables, has to be called before the engine is created
+    :param app: Flask application
+    :type app: Flask
+    """
+    for name in POOL_SETTINGS:
+        app.config.setdefault(name, os.getenv(name))
+    options = pool_options(app.config)
+    database_uri = app.config.get('SQLALCHEMY_DATABASE_URI')
+    if database_uri and make_url(database_uri).get_backend_name() != 'sqlite':
+        options['poolclass'] = InstrumentedQueuePool
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
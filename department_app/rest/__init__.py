@@ -5,14 +5,27 @@ Package containing REST API blueprint and classes to work with REST API
 from flask import Blueprint
 from flask_restful import Api
 
-from .department_api import DepartmentsAPI, DepartmentAPI
-from .employee_api import EmployeesAPI, EmployeeAPI
+from .department_api import DepartmentsAPI, DepartmentsBatchAPI, DepartmentAPI, DepartmentTransferAPI
+from .employee_api import EmployeesAPI, EmployeesBatchAPI, EmployeesExportAPI, EmployeesImportAPI, \
+    EmployeesSalaryAPI, EmployeeAPI
+from .cache_api import CacheAPI
+from .pool_api import PoolAPI
+from .representation import output_json
 
 
 rest_api = Blueprint('rest_api', __name__)
 api = Api(rest_api)
+api.representations['application/json'] = output_json
 
 api.add_resource(DepartmentsAPI, '/departments')
+api.add_resource(DepartmentsBatchAPI, '/departments/batch')
 api.add_resource(DepartmentAPI, '/departments/<uuid:department_id>')
+api.add_resource(DepartmentTransferAPI, '/departments/<uuid:department_id>/transfer')
 api.add_resource(EmployeesAPI, '/employees')
+api.add_resource(EmployeesBatchAPI, '/employees/batch')
+api.add_resource(EmployeesExportAPI, '/employees/export')
+api.add_resource(EmployeesImportAPI, '/employees/import')
+api.add_resource(EmployeesSalaryAPI, '/employees/salary')
 api.add_resource(EmployeeAPI, '/employees/<uuid:employee_id>')
+api.add_resource(CacheAPI, '/cache')
+api.add_resource(PoolAPI, '/pool')
@@ -0,0 +1,58 @@
+"""
+Module containing functions to work with batch requests of REST API
+"""
+from typing import Tuple, Union
+from uuid import UUID
+
+from flask import request
+import validators
+
+MAX_BATCH_SIZE = 10000
+
+
+def get_batch_items() -> Tuple[Union[list, None], Union[Tuple[dict, int], None]]:
+    """
+    Returns items of a batch received as JSON array in request body
+    :return: tuple containing list of items and None,
+    or None and tuple containing dict with error message and status code if request body is invalid
+    :rtype: Tuple[Union[list, None], Union[Tuple[dict, int], None]]
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        return None, ({'error': 'request body has to be a JSON array'}, 400)
+    if len(items) > MAX_BATCH_SIZE:
+        return None, ({'error': f'batch size exceeds {MAX_BATCH_SIZE}'}, 400)
+    return items, None
+
+
+def parse_batch_id(item: Union[dict, str], field: str) -> Tuple[Union[UUID, None], Union[Tuple[dict, int], None]]:
+    """
+    Parses and validates id of a batch item
+    :param item: dict containing the id field or the id itself
+    :type item: dict or str
+    :param field: name of the id field
+    :type field: str
+    :return: tuple containing id and None,
+    or None and tuple containing dict with error message and status code if id is invalid
+    :rtype: Tuple[Union[UUID, None], Union[Tuple[dict, int], None]]
+    """
+    if isinstance(item, dict):
+        if field not in item:
+            return None, ({'error': f"missing parameter '{field}'"}, 400)
+        item = item[field]
+    if not isinstance(item, str) or not validators.uuid(item):
+        return None, ({'error': f'{field} is invalid'}, 400)
+    return UUID(item), None
+
+
+def batch_errors_response(errors: dict) -> Tuple[dict, int]:
+    """
+    Returns response for a batch that has been rejected because of invalid items
+    :param errors: dict mapping indexes of invalid items to tuples containing dict with error message and status code
+    :type errors: dict
+    :return: tuple containing dict with errors of items and status code
+    :rtype: Tuple[dict, int]
+    """
+    status_code = 404 if all(code == 404 for _, code in errors.values()) else 400
+    items = [dict(error, index=index) for index, (error, _) in sorted(errors.items())]
+    return {'error': 'batch contains invalid items', 'items': items}, status_code
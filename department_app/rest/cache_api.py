@@ -0,0 +1,23 @@
+"""
+Module containing REST API resource class to work with response cache
+"""
+from typing import Tuple
+
+from flask_restful import Resource
+
+from department_app.cache import response_cache
+
+
+class CacheAPI(Resource):
+    """
+    Resource class to work with response cache
+    """
+    @staticmethod
+    def get() -> Tuple[dict, int]:
+        """
+        Returns response cache counters and status code
+        :return: tuple containing dict with cache backend name, numbers of hits, misses and stored entries
+        and status code
+        :rtype: Tuple[dict, int]
+        """
+        return response_cache.stats(), 200
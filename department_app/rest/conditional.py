@@ -0,0 +1,57 @@
+"""
+Module containing decorator that adds ETag validation to REST API read endpoints
+"""
+import hashlib
+from functools import wraps
+from typing import Callable, Iterable, Tuple
+from urllib.parse import urlencode
+
+from flask import Response, g, request
+
+from department_app.service import get_data_version
+
+
+def make_etag(path: str, args: Iterable[Tuple[str, str]], data_version: str) -> str:
+    """
+    Returns ETag of a representation of a resource
+    :param path: path of the resource
+    :type path: str
+    :param args: request args
+    :type args: Iterable[Tuple[str, str]]
+    :param data_version: version of the data the representation contains
+    :type data_version: str
+    :return: ETag without quotes
+    :rtype: str
+    """
+    return hashlib.sha1(f'{path}?{urlencode(sorted(args))}#{data_version}'.encode()).hexdigest()
+
+
+def conditional(tags: Callable[..., Iterable]) -> Callable:
+    """
+    Decorator that sets ETag header of successful responses of a resource method and responds with
+    304 Not Modified without calling the method if If-None-Match header of the request contains that ETag,
+    ETag is built from request path, query args and versions of cache tags of the resource,
+    so checking it costs one query
+    :param tags: function that receives keyword arguments of the method and returns cache tags
+    of the data the response contains or SQL expressions returning them
+    :type tags: Callable[..., Iterable]
+    :return: decorator
+    :rtype: Callable
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            # version has to be read before the data, a change committed in between makes the ETag stale,
+            # not the data
+            g.data_version = get_data_version(*tags(**kwargs))
+            etag = make_etag(request.path, request.args.items(multi=True), g.data_version)
+            if request.if_none_match.contains(etag):
+                return Response(status=304, headers={'ETag': f'"{etag}"'})
+
+            response = method(*args, **kwargs)
+            data, status_code, headers = (tuple(response) + ({},))[:3]
+            if status_code == 200:
+                headers = dict(headers, ETag=f'"{etag}"')
+            return data, status_code, headers
+        return wrapper
+    return decorator
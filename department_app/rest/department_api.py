@@ -3,14 +3,54 @@ Module containing REST API resource classes to work with departments
 """
 import re
 from uuid import UUID
-from typing import Tuple
+from typing import Tuple, Union
 
-from flask import request
+from flask import request, current_app, url_for
 from flask_restful import Resource
 import validators
 
-from department_app.service import get_all_departments, get_department_by_id, create_department, delete_department, \
-    update_department
+from department_app.models import Department
+from department_app.service import get_departments_data, get_department_data, create_department, delete_department, \
+    update_department, create_departments, update_departments, delete_departments, get_departments_json, \
+    get_existing_department_ids, transfer_employees
+from department_app.cache import response_cache, DEPARTMENTS_TAG, department_tag, employee_tag
+from department_app.rest.conditional import conditional
+from department_app.rest.pagination import pop_page_args, next_page_headers
+from department_app.rest.fields import get_fields_args, with_fields, remove_fields
+from department_app.rest.representation import RawJSON
+from department_app.rest.batch import get_batch_items, parse_batch_id, batch_errors_response, MAX_BATCH_SIZE
+
+
+def parse_department_data(request_data: dict,
+                          partial: bool = False) -> Tuple[Union[dict, None], Union[Tuple[dict, int], None]]:
+    """
+    Parses and validates department data (department_name, department_phone_number)
+    :param request_data: dict containing department data
+    :type request_data: dict
+    :param partial: True if fields that are not specified have to be skipped instead of reported as missing
+    :type partial: bool
+    :return: tuple containing dict of department data and None,
+    or None and tuple containing dict with error message and status code if data is invalid
+    :rtype: Tuple[Union[dict, None], Union[Tuple[dict, int], None]]
+    """
+    department_data = {}
+    if 'department_name' in request_data:
+        department_name = request_data['department_name']
+        if not isinstance(department_name, str) or not validators.length(department_name, min=3, max=32):
+            return None, ({'error': 'department_name is invalid'}, 400)
+        department_data['department_name'] = department_name
+    elif not partial:
+        return None, ({'error': "missing parameter 'department_name'"}, 400)
+
+    if 'department_phone_number' in request_data:
+        department_phone_number = request_data['department_phone_number']
+        if not isinstance(department_phone_number, str) or \
+                not re.match(r'(\+?[\d]{1,3})?\d{10}$', department_phone_number):
+            return None, ({'error': 'department_phone_number is invalid'}, 400)
+        department_data['department_phone_number'] = department_phone_number
+    elif not partial:
+        return None, ({'error': "missing parameter 'department_phone_number'"}, 400)
+    return department_data, None
 
 
 class DepartmentsAPI(Resource):
@@ -18,38 +58,132 @@ class DepartmentsAPI(Resource):
     Resource class to work with departments
     """
     @staticmethod
-    def get() -> Tuple[list, int]:
+    @conditional(lambda: (DEPARTMENTS_TAG,))
+    @response_cache.cached(lambda departments: (DEPARTMENTS_TAG,))
+    def get() -> Tuple[Union[dict, list], ...]:
         """
-        Returns list of all departments in the database and status code
-        :return: tuple containing list of departments and status code
-        :rtype: Tuple[list, int]
+        Returns list of departments in the database, paginated if limit or after are received from request args,
+        containing only fields and related objects received as comma separated fields and include request args,
+        or dict containing error message, status code and headers containing link to the next page
+        :return: tuple containing list of departments or dict containing error message, status code and headers
+        :rtype: Tuple[Union[dict, list], ...]
         """
-        departments = get_all_departments()
-        departments_dicts = [department.to_dict() for department in departments]
-        return departments_dicts, 200
+        request_data = request.args.to_dict()
+        try:
+            limit, after = pop_page_args(request_data)
+            fields, include = get_fields_args(request_data, Department)
+        except ValueError as error:
+            return {'error': str(error)}, 400
+        if limit is None and current_app.config['DATABASE_JSON_RESPONSES']:
+            departments_json = get_departments_json(fields, include)
+            if departments_json is not None:
+                return RawJSON(departments_json), 200
+        fields, key_fields = with_fields(fields, ('department_name', 'department_id'))
+        departments_dicts = get_departments_data(limit, after, fields, include)
+        headers = next_page_headers('rest_api.departmentsapi', request_data, departments_dicts, limit,
+                                    'department_name', 'department_id')
+        return remove_fields(departments_dicts, key_fields), 200, headers
 
     @staticmethod
-    def post() -> Tuple[dict, int]:
+    def post() -> Tuple[dict, ...]:
         """
-        Creates department using data from request from, returns dict containing message and status code
-        :return: tuple containing message dict and status code
-        :rtype: Tuple[dict, int]
+        Creates department using data from request from, returns dict containing message and fields
+        of created department, status code and Location header of created department
+        or dict containing error message and status code
+        :return: tuple containing dict, status code and headers or tuple containing error dict and status code
+        :rtype: Tuple[dict, ...]
         """
+        department_data, error = parse_department_data(request.form.to_dict())
+        if error:
+            return error
+        department = create_department(**department_data)
+        location = url_for('rest_api.departmentapi', department_id=department['department_id'])
+        return dict(department, success='department has been created'), 201, {'Location': location}
+
+
+class DepartmentsBatchAPI(Resource):
+    """
+    Resource class to work with batches of departments
+    """
+    @staticmethod
+    def post() -> Tuple[Union[dict, list], int]:
+        """
+        Creates departments using JSON array of department data from request body in a single transaction,
+        returns list of results or dict containing errors of invalid items and status code
+        :return: tuple containing list of results or dict containing errors and status code
+        :rtype: Tuple[Union[dict, list], int]
+        """
+        items, error = get_batch_items()
+        if error:
+            return error
+        departments_data, errors = [], {}
+        for index, item in enumerate(items):
+            department_data, error = parse_department_data(item) if isinstance(item, dict) \
+                else (None, ({'error': 'item has to be a JSON object'}, 400))
+            if error:
+                errors[index] = error
+            departments_data.append(department_data)
+        if errors:
+            return batch_errors_response(errors)
+
+        department_ids = create_departments(departments_data)
+        return [{'success': 'department has been created', 'department_id': str(department_id)}
+                for department_id in department_ids], 201
+
+    @staticmethod
+    def put() -> Tuple[Union[dict, list], int]:
+        """
+        Updates departments using JSON array of department data containing department_id from request body
+        in a single transaction, returns list of results or dict containing errors of invalid items and status code
+        :return: tuple containing list of results or dict containing errors and status code
+        :rtype: Tuple[Union[dict, list], int]
+        """
+        items, error = get_batch_items()
+        if error:
+            return error
+        departments_data, errors = [], {}
+        for index, item in enumerate(items):
+            department_id, error = parse_batch_id(item, 'department_id')
+            department_data = None
+            if not error:
+                department_data, error = parse_department_data(item, partial=True)
+            if error:
+                errors[index] = error
+            else:
+                departments_data.append(dict(department_data, department_id=department_id))
+        if errors:
+            return batch_errors_response(errors)
+
+        results = update_departments(departments_data)
+        return [{'success': 'department has been updated'} if is_updated else {'error': 'Not Found'}
+                for is_updated in results], 200
+
+    @staticmethod
+    def delete() -> Tuple[Union[dict, list], int]:
+        """
+        Deletes departments with ids from JSON array in request body in a single transaction,
+        returns list of results or dict containing errors of invalid items and status code
+        :return: tuple containing list of results or dict containing errors and status code
+        :rtype: Tuple[Union[dict, list], int]
+        """
+        items, error = get_batch_items()
+        if error:
+            return error
+        department_ids, errors = [], {}
+        for index, item in enumerate(items):
+            department_id, error = parse_batch_id(item, 'department_id')
+            if error:
+                errors[index] = error
+            department_ids.append(department_id)
+        if errors:
+            return batch_errors_response(errors)
+
         try:
-            request_data = request.form.to_dict()
-            department_name_is_valid = validators.length(request_data['department_name'], min=3, max=32)
-            if not department_name_is_valid:
-                return {'error': 'department_name is invalid'}, 400
-            department_name = request_data['department_name']
-
-            department_phone_number_match = re.match(r'(\+?[\d]{1,3})?\d{10}$', request_data['department_phone_number'])
-            if not department_phone_number_match:
-                return {'error': 'department_phone_number is invalid'}, 400
-            department_phone_number = request_data['department_phone_number']
-            create_department(department_name, department_phone_number)
-        except KeyError as error:
-            return {'error': f'missing parameter {str(error)}'}, 400
-        return {'success': 'department has been created'}, 201
+            results = delete_departments(department_ids)
+        except ValueError as error:
+            return {'error': str(error)}, 409
+        return [{'success': 'department has been deleted'} if is_deleted else {'error': 'Not Found'}
+                for is_deleted in results], 200
 
 
 class DepartmentAPI(Resource):
@@ -57,18 +191,28 @@ class DepartmentAPI(Resource):
     Resource class to work with single department
     """
     @staticmethod
+    @conditional(lambda department_id: (department_tag(department_id),))
+    @response_cache.cached(lambda department, department_id: (
+        department_tag(department_id),
+        *(employee_tag(employee['employee_id']) for employee in department.get('employees', ()))
+    ))
     def get(department_id: UUID) -> Tuple[dict, int]:
         """
-        Returns department with specified id
+        Returns department with specified id containing only fields and related objects
+        received as comma separated fields and include request args
         :param department_id: id of a department
         :type department_id: UUID
         :return: tuple containing message dict or dict representation of a department and status code
         :rtype: Tuple[dict, int]
         """
-        department = get_department_by_id(department_id)
+        try:
+            fields, include = get_fields_args(request.args, Department)
+        except ValueError as error:
+            return {'error': str(error)}, 400
+        department = get_department_data(department_id, fields, include)
         if not department:
             return {'error': 'Not Found'}, 404
-        return department.to_dict(), 200
+        return department, 200
 
     @staticmethod
     def put(department_id: UUID) -> Tuple[dict, int]:
@@ -80,30 +224,12 @@ class DepartmentAPI(Resource):
         :return: tuple containing message dict and status code
         :rtype: Tuple[dict, int]
         """
-        try:
-            request_data = request.form.to_dict()
-            if 'department_name' in request_data:
-                department_name_is_valid = validators.length(request_data['department_name'], min=3, max=32)
-                if not department_name_is_valid:
-                    return {'error': 'department_name is invalid'}, 400
-                department_name = request_data['department_name']
-            else:
-                department_name = None
-
-            if 'department_phone_number' in request_data:
-                department_phone_number_match = re.match(r'(\+?[\d]{1,3})?\d{10}$',
-                                                         request_data['department_phone_number'])
-                if not department_phone_number_match:
-                    return {'error': 'department_phone_number is invalid'}, 400
-                department_phone_number = request_data['department_phone_number']
-            else:
-                department_phone_number = None
-
-            is_updated = update_department(department_id, department_name, department_phone_number)
-            if not is_updated:
-                return {'error': 'Not Found'}, 404
-        except KeyError as error:
-            return {'error': f'missing parameter {str(error)}'}, 400
+        department_data, error = parse_department_data(request.form.to_dict(), partial=True)
+        if error:
+            return error
+        is_updated = update_department(department_id, **department_data)
+        if not is_updated:
+            return {'error': 'Not Found'}, 404
         return {'success': 'department has been updated'}, 201
 
     @staticmethod
@@ -115,7 +241,57 @@ class DepartmentAPI(Resource):
         :return: tuple containing message dict and status code
         :rtype: Tuple[dict, int]
         """
-        is_deleted = delete_department(department_id)
+        try:
+            is_deleted = delete_department(department_id)
+        except ValueError as error:
+            return {'error': str(error)}, 409
         if not is_deleted:
             return {'error': 'Not Found'}, 404
         return {'success': 'department has been deleted'}, 200
+
+
+class DepartmentTransferAPI(Resource):
+    """
+    Resource class to move employees to a department
+    """
+    @staticmethod
+    def post(department_id: UUID) -> Tuple[dict, int]:
+        """
+        Moves all employees of department with from_department_id or employees with ids from employee_ids array,
+        received in JSON object in request body, to department with specified id in a single transaction,
+        returns dict containing message and number of moved employees or dict containing error message
+        and status code
+        :param department_id: id of the department employees are moved to
+        :type department_id: UUID
+        :return: tuple containing message dict and status code
+        :rtype: Tuple[dict, int]
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or ('from_department_id' in data) == ('employee_ids' in data):
+            return {'error': 'request body has to be a JSON object containing from_department_id '
+                             'or employee_ids'}, 400
+        from_department_id, employee_ids = None, None
+        if 'from_department_id' in data:
+            from_department_id, error = parse_batch_id(data, 'from_department_id')
+            if error:
+                return error
+        else:
+            if not isinstance(data['employee_ids'], list):
+                return {'error': 'employee_ids is invalid'}, 400
+            if len(data['employee_ids']) > MAX_BATCH_SIZE:
+                return {'error': f'batch size exceeds {MAX_BATCH_SIZE}'}, 400
+            employee_ids = []
+            for item in data['employee_ids']:
+                employee_id, error = parse_batch_id(item, 'employee_id')
+                if error:
+                    return error
+                employee_ids.append(employee_id)
+
+        department_ids = {department_id} | ({from_department_id} if from_department_id else set())
+        if get_existing_department_ids(department_ids) != department_ids:
+            return {'error': 'department not found'}, 404
+        moved_ids, missing_ids = transfer_employees(department_id, from_department_id, employee_ids)
+        if missing_ids:
+            return {'error': 'employees not found',
+                    'employee_ids': [str(employee_id) for employee_id in missing_ids]}, 404
+        return {'success': 'employees have been transferred', 'transferred': len(moved_ids)}, 200
@@ -1,16 +1,132 @@
 """
 Module containing REST API resource classes to work with employees
 """
+import math
 from uuid import UUID
 from datetime import datetime, date
 from typing import Tuple, Union
 
-from flask import request
+from flask import request, current_app, url_for, Response, stream_with_context
 from flask_restful import Resource
 import validators
 
-from department_app.service import get_all_employees, get_employees_with_filter, get_employee_by_id, \
-    create_employee, delete_employee, update_employee, get_department_by_id
+from department_app.models import Employee
+from department_app.service import get_employees_data, get_employee_data, create_employee, delete_employee, \
+    update_employee, get_department_by_id, iter_employees_data, create_employees, update_employees, delete_employees, \
+    get_existing_department_ids, get_employees_json, import_employees_csv, adjust_salaries, employee_department_tag
+from department_app.cache import response_cache, EMPLOYEES_TAG, department_tag, employee_tag
+from department_app.rest.conditional import conditional
+from department_app.rest.pagination import pop_page_args, next_page_headers
+from department_app.rest.fields import get_fields_args, with_fields, remove_fields
+from department_app.rest.representation import dumps, RawJSON
+from department_app.rest.batch import get_batch_items, parse_batch_id, batch_errors_response
+
+
+def parse_employees_filter(request_data: dict) -> Tuple[Union[tuple, None], Union[Tuple[dict, int], None]]:
+    """
+    Parses and validates employees filtering options (department_id, start_date, end_date) received from request args
+    and checks that the department exists
+    :param request_data: dict containing request args
+    :type request_data: dict
+    :return: tuple containing tuple of filtering options (None for options that are not specified) and None,
+    or None and tuple containing dict with error message and status code if an option is invalid
+    :rtype: Tuple[Union[tuple, None], Union[Tuple[dict, int], None]]
+    """
+    filters, error = parse_employees_filter_args(request_data)
+    if error:
+        return None, error
+    if filters[0] is not None and not get_department_by_id(filters[0]):
+        return None, ({'error': 'department not found'}, 404)
+    return filters, None
+
+
+def parse_employees_filter_args(request_data: dict) -> Tuple[Union[tuple, None], Union[Tuple[dict, int], None]]:
+    """
+    Parses and validates employees filtering options (department_id, start_date, end_date) received from request args
+    without querying the database
+    :param request_data: dict containing request args
+    :type request_data: dict
+    :return: tuple containing tuple of filtering options (None for options that are not specified) and None,
+    or None and tuple containing dict with error message and status code if an option is invalid
+    :rtype: Tuple[Union[tuple, None], Union[Tuple[dict, int], None]]
+    """
+    if 'department_id' in request_data:
+        department_id = request_data['department_id']
+        if not validators.uuid(department_id):
+            return None, ({'error': 'department_id is invalid'}, 400)
+        department_id = UUID(department_id)
+    else:
+        department_id = None
+    if 'start_date' in request_data:
+        start_date = request_data['start_date']
+        try:
+            start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+        except ValueError:
+            return None, ({'error': 'start_date is invalid'}, 400)
+        else:
+            if not validators.between(start_date, max=date.today()):
+                return None, ({'error': 'start_date is invalid'}, 400)
+    else:
+        start_date = None
+    if 'end_date' in request_data:
+        end_date = request_data['end_date']
+        try:
+            end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+        except ValueError:
+            return None, ({'error': 'end_date is invalid'}, 400)
+        else:
+            if not validators.between(end_date, max=date.today()):
+                return None, ({'error': 'end_date is invalid'}, 400)
+    else:
+        end_date = None
+    return (department_id, start_date, end_date), None
+
+
+def parse_employee_data(request_data: dict,
+                        partial: bool = False) -> Tuple[Union[dict, None], Union[Tuple[dict, int], None]]:
+    """
+    Parses and validates employee data (employee_name, position, salary, birthdate, department_id),
+    existence of the department is not checked
+    :param request_data: dict containing employee data
+    :type request_data: dict
+    :param partial: True if fields that are not specified have to be skipped instead of reported as missing
+    :type partial: bool
+    :return: tuple containing dict of employee data and None,
+    or None and tuple containing dict with error message and status code if data is invalid
+    :rtype: Tuple[Union[dict, None], Union[Tuple[dict, int], None]]
+    """
+    employee_data = {}
+    for field in ('employee_name', 'position', 'salary', 'birthdate', 'department_id'):
+        if field not in request_data:
+            if partial:
+                continue
+            return None, ({'error': f"missing parameter '{field}'"}, 400)
+        value = request_data[field]
+
+        if field in ('employee_name', 'position'):
+            is_valid = isinstance(value, str) and validators.length(value, min=2, max=32)
+        elif field == 'salary':
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
+                is_valid = False
+            else:
+                is_valid = value > 0
+        elif field == 'birthdate':
+            try:
+                value = datetime.strptime(value, "%Y-%m-%d").date()
+            except (ValueError, TypeError):
+                is_valid = False
+            else:
+                is_valid = validators.between(value, max=date.today())
+        else:
+            is_valid = isinstance(value, str) and validators.uuid(value)
+            value = UUID(value) if is_valid else value
+
+        if not is_valid:
+            return None, ({'error': f'{field} is invalid'}, 400)
+        employee_data[field] = value
+    return employee_data, None
 
 
 class EmployeesAPI(Resource):
@@ -18,99 +134,272 @@ class EmployeesAPI(Resource):
     Resource class to work with employees
     """
     @staticmethod
-    def get() -> Tuple[Union[dict, list], int]:
+    @conditional(lambda: (EMPLOYEES_TAG,))
+    @response_cache.cached(lambda employees: (EMPLOYEES_TAG,))
+    def get() -> Tuple[Union[dict, list], ...]:
         """
-        Returns list of employees in the database that satisfy filtering options, received from request args
+        Returns list of employees in the database that satisfy filtering options, received from request args,
+        paginated if limit or after are received from request args,
+        containing only fields and related objects received as comma separated fields and include request args,
+        or dict containing error message, status code and headers containing link to the next page
+        :return: tuple containing list of employees or dict containing error message, status code and headers
+        :rtype: Tuple[Union[dict, list], ...]
+        """
+        request_data = request.args.to_dict()
+        try:
+            limit, after = pop_page_args(request_data)
+            fields, include = get_fields_args(request_data, Employee)
+        except ValueError as error:
+            return {'error': str(error)}, 400
+
+        filters, error = parse_employees_filter(request_data)
+        if error:
+            return error
+        if limit is None and current_app.config['DATABASE_JSON_RESPONSES']:
+            employees_json = get_employees_json(*filters, fields=fields, include=include)
+            if employees_json is not None:
+                return RawJSON(employees_json), 200
+        fields, key_fields = with_fields(fields, ('employee_name', 'employee_id'))
+        employees_dicts = get_employees_data(*filters, limit=limit, after=after, fields=fields, include=include)
+        headers = next_page_headers('rest_api.employeesapi', request_data, employees_dicts, limit,
+                                    'employee_name', 'employee_id')
+        return remove_fields(employees_dicts, key_fields), 200, headers
+
+    @staticmethod
+    def post() -> Tuple[dict, ...]:
+        """
+        Creates employee using data from request from, returns dict containing message and fields
+        of created employee, status code and Location header of created employee
         or dict containing error message and status code
-        :return: tuple containing list of departments or dict containing error message and status code
+        :return: tuple containing dict, status code and headers or tuple containing error dict and status code
+        :rtype: Tuple[dict, ...]
+        """
+        employee_data, error = parse_employee_data(request.form.to_dict())
+        if error:
+            return error
+        if not get_department_by_id(employee_data['department_id']):
+            return {'error': 'department not found'}, 404
+        employee = create_employee(**employee_data)
+        location = url_for('rest_api.employeeapi', employee_id=employee['employee_id'])
+        return dict(employee, success='employee has been created'), 201, {'Location': location}
+
+
+def check_departments_exist(employees_data: list, errors: dict):
+    """
+    Checks that departments of batch items exist using a single query and records errors of items that refer to
+    nonexistent departments
+    :param employees_data: list of parsed employee data, None for invalid items
+    :type employees_data: list
+    :param errors: dict mapping indexes of invalid items to tuples containing dict with error message and status code
+    :type errors: dict
+    """
+    existing_department_ids = get_existing_department_ids(employee_data['department_id']
+                                                          for employee_data in employees_data
+                                                          if employee_data and 'department_id' in employee_data)
+    for index, employee_data in enumerate(employees_data):
+        if employee_data and 'department_id' in employee_data \
+                and employee_data['department_id'] not in existing_department_ids:
+            errors[index] = ({'error': 'department not found'}, 404)
+
+
+class EmployeesBatchAPI(Resource):
+    """
+    Resource class to work with batches of employees
+    """
+    @staticmethod
+    def post() -> Tuple[Union[dict, list], int]:
+        """
+        Creates employees using JSON array of employee data from request body in a single transaction,
+        returns list of results or dict containing errors of invalid items and status code
+        :return: tuple containing list of results or dict containing errors and status code
         :rtype: Tuple[Union[dict, list], int]
         """
-        request_data = request.args.to_dict()
+        items, error = get_batch_items()
+        if error:
+            return error
+        employees_data, errors = [], {}
+        for index, item in enumerate(items):
+            employee_data, error = parse_employee_data(item) if isinstance(item, dict) \
+                else (None, ({'error': 'item has to be a JSON object'}, 400))
+            if error:
+                errors[index] = error
+            employees_data.append(employee_data)
+        check_departments_exist(employees_data, errors)
+        if errors:
+            return batch_errors_response(errors)
 
-        if request_data:
-            if 'department_id' in request_data:
-                department_id = request_data['department_id']
-                if not validators.uuid(department_id):
-                    return {'error': 'department_id is invalid'}, 400
-                department_id = UUID(department_id)
-                if not get_department_by_id(department_id):
-                    return {'error': 'department not found'}, 404
-            else:
-                department_id = None
-            if 'start_date' in request_data:
-                start_date = request_data['start_date']
-                try:
-                    start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-                except ValueError:
-                    return {'error': 'start_date is invalid'}, 400
-                else:
-                    if not validators.between(start_date, max=date.today()):
-                        return {'error': 'start_date is invalid'}, 400
-            else:
-                start_date = None
-            if 'end_date' in request_data:
-                end_date = request_data['end_date']
-                try:
-                    end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-                except ValueError:
-                    return {'error': 'end_date is invalid'}, 400
-                else:
-                    if not validators.between(end_date, max=date.today()):
-                        return {'error': 'end_date is invalid'}, 400
+        employee_ids = create_employees(employees_data)
+        return [{'success': 'employee has been created', 'employee_id': str(employee_id)}
+                for employee_id in employee_ids], 201
+
+    @staticmethod
+    def put() -> Tuple[Union[dict, list], int]:
+        """
+        Updates employees using JSON array of employee data containing employee_id from request body
+        in a single transaction, returns list of results or dict containing errors of invalid items and status code
+        :return: tuple containing list of results or dict containing errors and status code
+        :rtype: Tuple[Union[dict, list], int]
+        """
+        items, error = get_batch_items()
+        if error:
+            return error
+        employees_data, errors = [], {}
+        for index, item in enumerate(items):
+            employee_id, error = parse_batch_id(item, 'employee_id')
+            employee_data = None
+            if not error:
+                employee_data, error = parse_employee_data(item, partial=True)
+            if error:
+                errors[index] = error
+                employees_data.append(None)
             else:
-                end_date = None
-            employees = get_employees_with_filter(department_id, start_date, end_date)
-        else:
-            employees = get_all_employees()
-        employees_dicts = [employee.to_dict() for employee in employees]
-        return employees_dicts, 200
+                employees_data.append(dict(employee_data, employee_id=employee_id))
+        check_departments_exist(employees_data, errors)
+        if errors:
+            return batch_errors_response(errors)
+
+        results = update_employees(employees_data)
+        return [{'success': 'employee has been updated'} if is_updated else {'error': 'Not Found'}
+                for is_updated in results], 200
 
+    @staticmethod
+    def delete() -> Tuple[Union[dict, list], int]:
+        """
+        Deletes employees with ids from JSON array in request body in a single transaction,
+        returns list of results or dict containing errors of invalid items and status code
+        :return: tuple containing list of results or dict containing errors and status code
+        :rtype: Tuple[Union[dict, list], int]
+        """
+        items, error = get_batch_items()
+        if error:
+            return error
+        employee_ids, errors = [], {}
+        for index, item in enumerate(items):
+            employee_id, error = parse_batch_id(item, 'employee_id')
+            if error:
+                errors[index] = error
+            employee_ids.append(employee_id)
+        if errors:
+            return batch_errors_response(errors)
+
+        results = delete_employees(employee_ids)
+        return [{'success': 'employee has been deleted'} if is_deleted else {'error': 'Not Found'}
+                for is_deleted in results], 200
+
+
+class EmployeesExportAPI(Resource):
+    """
+    Resource class to export employees
+    """
+    @staticmethod
+    def get() -> Union[Response, Tuple[dict, int]]:
+        """
+        Streams employees in the database that satisfy filtering options, received from request args,
+        as newline-delimited JSON or returns dict containing error message and status code
+        :return: streamed response or tuple containing dict with error message and status code
+        :rtype: Response or Tuple[dict, int]
+        """
+        filters, error = parse_employees_filter(request.args.to_dict())
+        if error:
+            return error
+        lines = (dumps(employee) for employee in iter_employees_data(*filters))
+        return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+
+class EmployeesImportAPI(Resource):
+    """
+    Resource class to import employees from CSV files
+    """
     @staticmethod
     def post() -> Tuple[dict, int]:
         """
-        Creates employee using data from request from, returns dict containing message and status code
-        :return: tuple containing message dict and status code
+        Imports employees from CSV file, received as file field of multipart form or as text/csv request body,
+        in a single transaction, returns dict containing numbers of created and updated employees
+        or dict containing errors of rejected rows with their line numbers and status code
+        :return: tuple containing dict with results or errors and status code
         :rtype: Tuple[dict, int]
         """
+        if 'file' in request.files:
+            stream = request.files['file'].stream
+        elif request.mimetype == 'text/csv':
+            stream = request.stream
+        else:
+            return {'error': 'CSV file has to be sent as file field or text/csv body'}, 400
         try:
-            request_data = request.form.to_dict()
-            employee_name = request_data['employee_name']
-            if not validators.length(employee_name, min=2, max=32):
-                return {'error': 'employee_name is invalid'}, 400
+            result, rejected = import_employees_csv(stream)
+        except ValueError as error:
+            return {'error': str(error)}, 400
+        if rejected:
+            status = 404 if all(row['error'] == 'department not found' for row in rejected['rows']) else 400
+            return {'error': 'file contains invalid rows', 'rejected': rejected['count'],
+                    'rows': rejected['rows']}, status
+        return dict(result, success='employees have been imported'), 201
 
-            position = request_data['position']
-            if not validators.length(position, min=2, max=32):
-                return {'error': 'position is invalid'}, 400
 
-            salary = request_data['salary']
-            try:
-                salary = float(salary)
-            except ValueError:
-                return {'error': 'salary is invalid'}, 400
-            else:
-                if salary <= 0:
-                    return {'error': 'salary is invalid'}, 400
+def parse_salary_change(data: dict) -> Tuple[Union[dict, None], Union[Tuple[dict, int], None]]:
+    """
+    Parses and validates salary change (percent or amount), position condition and dry_run flag
+    received in JSON object
+    :param data: dict containing salary change options
+    :type data: dict
+    :return: tuple containing dict of options and None,
+    or None and tuple containing dict with error message and status code if an option is invalid
+    :rtype: Tuple[Union[dict, None], Union[Tuple[dict, int], None]]
+    """
+    if ('percent' in data) == ('amount' in data):
+        return None, ({'error': "one of parameters 'percent' and 'amount' is required"}, 400)
+    options = {}
+    for field in ('percent', 'amount'):
+        if field in data:
+            value = data[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                return None, ({'error': f'{field} is invalid'}, 400)
+            options[field] = float(value)
+    if 'position' in data:
+        if not isinstance(data['position'], str) or not validators.length(data['position'], min=2, max=32):
+            return None, ({'error': 'position is invalid'}, 400)
+        options['position'] = data['position']
+    if not isinstance(data.get('dry_run', False), bool):
+        return None, ({'error': 'dry_run is invalid'}, 400)
+    options['dry_run'] = data.get('dry_run', False)
+    return options, None
 
-            birthdate = request_data['birthdate']
-            try:
-                birthdate = datetime.strptime(birthdate, "%Y-%m-%d").date()
-            except ValueError:
-                return {'error': 'birthdate is invalid'}, 400
-            else:
-                if not validators.between(birthdate, max=date.today()):
-                    return {'error': 'birthdate is invalid'}, 400
 
-            department_id = request_data['department_id']
-            if not validators.uuid(department_id):
-                return {'error': 'department_id is invalid'}, 400
-            department_id = UUID(department_id)
-            if not get_department_by_id(department_id):
-                return {'error': 'department not found'}, 404
+class EmployeesSalaryAPI(Resource):
+    """
+    Resource class to change salaries of employees
+    """
+    @staticmethod
+    def post() -> Tuple[dict, int]:
+        """
+        Changes salaries of employees that satisfy filtering options (department_id, position, start_date, end_date)
+        by percent or amount, received in JSON object in request body, in a single transaction,
+        or only reports numbers of affected employees and sums of salaries if dry_run is true,
+        returns dict containing results or error message and status code
+        :return: tuple containing dict with results or error message and status code
+        :rtype: Tuple[dict, int]
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return {'error': 'request body has to be a JSON object'}, 400
+        options, error = parse_salary_change(data)
+        if error:
+            return error
+        filter_data = {field: data[field] for field in ('department_id', 'start_date', 'end_date') if field in data}
+        for field, value in filter_data.items():
+            if not isinstance(value, str):
+                return {'error': f'{field} is invalid'}, 400
+        filters, error = parse_employees_filter(filter_data)
+        if error:
+            return error
+        department_id, start_date, end_date = filters
 
-            create_employee(employee_name, position, salary, birthdate, department_id)
-        except KeyError as error:
-            return {'error': f'missing parameter {str(error)}'}, 400
-        return {'success': 'employee has been created'}, 201
+        result = adjust_salaries(department_id=department_id, start_date=start_date, end_date=end_date, **options)
+        if options['dry_run']:
+            return dict(result, dry_run=True), 200
+        if result['rejected']:
+            return {'error': 'salary is invalid', 'rejected': result['rejected']}, 400
+        return {'success': 'salaries have been changed', 'updated': result['matched']}, 200
 
 
 class EmployeeAPI(Resource):
@@ -118,18 +407,28 @@ class EmployeeAPI(Resource):
     Resource class to work with single employee
     """
     @staticmethod
+    @conditional(lambda employee_id: (employee_tag(employee_id), employee_department_tag(employee_id)))
+    @response_cache.cached(lambda employee, employee_id: (
+        employee_tag(employee_id),
+        *((department_tag(employee['department']['department_id']),) if employee.get('department') else ())
+    ))
     def get(employee_id: UUID) -> Tuple[dict, int]:
         """
-        Returns employee with specified id
+        Returns employee with specified id containing only fields and related objects
+        received as comma separated fields and include request args
         :param employee_id: id of an employee
         :type employee_id: UUID
         :return: tuple containing message dict or dict representation of an employee and status code
         :rtype: Tuple[dict, int]
         """
-        employee = get_employee_by_id(employee_id)
+        try:
+            fields, include = get_fields_args(request.args, Employee)
+        except ValueError as error:
+            return {'error': str(error)}, 400
+        employee = get_employee_data(employee_id, fields, include)
         if not employee:
             return {'error': 'Not Found'}, 404
-        return employee.to_dict(), 200
+        return employee, 200
 
     @staticmethod
     def put(employee_id: UUID):
@@ -141,61 +440,14 @@ class EmployeeAPI(Resource):
         :return: tuple containing message dict and status code
         :rtype: Tuple[dict, int]
         """
-        try:
-            request_data = request.form.to_dict()
-            if 'employee_name' in request_data:
-                employee_name = request_data['employee_name']
-                if not validators.length(employee_name, min=2, max=32):
-                    return {'error': 'employee_name is invalid'}, 400
-            else:
-                employee_name = None
-
-            if 'position' in request_data:
-                position = request_data['position']
-                if not validators.length(position, min=2, max=32):
-                    return {'error': 'position is invalid'}, 400
-            else:
-                position = None
-
-            if 'salary' in request_data:
-                salary = request_data['salary']
-                try:
-                    salary = float(salary)
-                except ValueError:
-                    return {'error': 'salary is invalid'}, 400
-                else:
-                    if salary <= 0:
-                        return {'error': 'salary is invalid'}, 400
-            else:
-                salary = None
-
-            if 'birthdate' in request_data:
-                birthdate = request_data['birthdate']
-                try:
-                    birthdate = datetime.strptime(birthdate, "%Y-%m-%d").date()
-                except ValueError:
-                    return {'error': 'birthdate is invalid'}, 400
-                else:
-                    if not validators.between(birthdate, max=date.today()):
-                        return {'error': 'birthdate is invalid'}, 400
-            else:
-                birthdate = None
-
-            if 'department_id' in request_data:
-                department_id = request_data['department_id']
-                if not validators.uuid(department_id):
-                    return {'error': 'department_id is invalid'}, 400
-                department_id = UUID(department_id)
-                if not get_department_by_id(department_id):
-                    return {'error': 'department not found'}, 404
-            else:
-                department_id = None
-
-            is_updated = update_employee(employee_id, employee_name, position, salary, birthdate, department_id)
-            if not is_updated:
-                return {'error': 'Not Found'}, 404
-        except KeyError as error:
-            return {'error': f'missing parameter {str(error)}'}, 400
+        employee_data, error = parse_employee_data(request.form.to_dict(), partial=True)
+        if error:
+            return error
+        if 'department_id' in employee_data and not get_department_by_id(employee_data['department_id']):
+            return {'error': 'department not found'}, 404
+        is_updated = update_employee(employee_id, **employee_data)
+        if not is_updated:
+            return {'error': 'Not Found'}, 404
         return {'success': 'employee has been updated'}, 201
 
     @staticmethod
@@ -0,0 +1,62 @@
+"""
+Module containing functions to work with sparse fieldsets of REST API resources
+"""
+from typing import Tuple, Union, Iterable
+
+
+def get_fields_args(request_data: dict, model) -> Tuple[Union[tuple, None], Union[tuple, None]]:
+    """
+    Gets and validates comma separated fields and include args, args are left in request_data
+    so that links to other pages keep them
+    :param request_data: dict containing request args
+    :type request_data: dict
+    :param model: model class with FIELDS and RELATIONS that can be selected
+    :return: tuple containing names of fields (None if not specified)
+    and names of related objects to embed (None if not specified)
+    :rtype: Tuple[Union[tuple, None], Union[tuple, None]]
+    :raises ValueError: if fields or include are invalid
+    """
+    fields = include = None
+    if 'fields' in request_data:
+        fields = tuple(field for field in request_data['fields'].split(',') if field)
+        if not fields or not set(fields).issubset(model.FIELDS):
+            raise ValueError('fields is invalid')
+    if 'include' in request_data:
+        include = tuple(relation for relation in request_data['include'].split(',') if relation)
+        if not set(include).issubset(model.RELATIONS):
+            raise ValueError('include is invalid')
+    return fields, include
+
+
+def with_fields(fields: Union[tuple, None], names: Iterable[str]) -> Tuple[Union[tuple, None], tuple]:
+    """
+    Adds names of fields required by the caller (e.g. sort key of a page) to selected fields
+    :param fields: names of selected fields, None if all fields are selected
+    :type fields: tuple or None
+    :param names: names of required fields
+    :type names: Iterable[str]
+    :return: tuple containing names of fields to load and names of added fields
+    :rtype: Tuple[Union[tuple, None], tuple]
+    """
+    if fields is None:
+        return None, ()
+    added = tuple(name for name in names if name not in fields)
+    return fields + added, added
+
+
+def remove_fields(items: list, names: Iterable[str]) -> list:
+    """
+    Removes fields added by with_fields from dictionary representations
+    :param items: list of dictionary representations
+    :type items: list
+    :param names: names of fields to remove
+    :type names: Iterable[str]
+    :return: list of dictionary representations
+    :rtype: list
+    """
+    names = tuple(names)
+    if names:
+        for item in items:
+            for name in names:
+                del item[name]
+    return items
@@ -0,0 +1,113 @@
+"""
+Module containing functions to work with keyset pagination of REST API collections
+"""
+import base64
+import json
+from typing import Tuple, Union
+from uuid import UUID
+
+from flask import url_for
+
+MAX_PAGE_LIMIT = 1000
+
+
+def encode_cursor(name: str, item_id: str) -> str:
+    """
+    Encodes sort key (name, id) of the last item of a page into an opaque cursor
+    :param name: name of an item
+    :type name: str
+    :param item_id: id of an item
+    :type item_id: str
+    :return: cursor pointing after the item
+    :rtype: str
+    """
+    return base64.urlsafe_b64encode(json.dumps([name, str(item_id)]).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, UUID]:
+    """
+    Decodes cursor created by encode_cursor
+    :param cursor: cursor received from a client
+    :type cursor: str
+    :raises ValueError: if cursor is invalid
+    :return: sort key (name, id) of an item
+    :rtype: Tuple[str, UUID]
+    """
+    try:
+        name, item_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(name, str):
+            raise ValueError
+        return name, UUID(str(item_id))
+    except (ValueError, TypeError) as error:
+        raise ValueError('after is invalid') from error
+
+
+def pop_page_args(request_data: dict) -> Tuple[Union[int, None], Union[tuple, None]]:
+    """
+    Removes pagination arguments from request data and returns them parsed
+    :param request_data: dict containing request args
+    :type request_data: dict
+    :raises ValueError: if pagination arguments are invalid
+    :return: tuple containing page size and decoded cursor, None for arguments that are not specified
+    :rtype: Tuple[int or None, Tuple[str, UUID] or None]
+    """
+    limit = request_data.pop('limit', None)
+    after = request_data.pop('after', None)
+    if limit is not None:
+        if not limit.isdigit() or not 0 < int(limit) <= MAX_PAGE_LIMIT:
+            raise ValueError('limit is invalid')
+        limit = int(limit)
+    elif after is not None:
+        limit = MAX_PAGE_LIMIT
+    if after is not None:
+        after = decode_cursor(after)
+    return limit, after
+
+
+def next_page_args(request_args: dict, page: list, limit: Union[int, None],
+                   name_field: str, id_field: str) -> Union[dict, None]:
+    """
+    Returns request args of the next page if the page is full
+    :param request_args: request args that have to be preserved
+    :type request_args: dict
+    :param page: list of item dicts of the current page
+    :type page: list
+    :param limit: page size, None if collection is not paginated
+    :type limit: int or None
+    :param name_field: name of the item field containing name
+    :type name_field: str
+    :param id_field: name of the item field containing id
+    :type id_field: str
+    :return: dict of request args of the next page or None if there is no next page
+    :rtype: dict or None
+    """
+    if limit is None or len(page) < limit:
+        return None
+    cursor = encode_cursor(page[-1][name_field], page[-1][id_field])
+    return dict(request_args, limit=limit, after=cursor)
+
+
+def next_page_headers(endpoint: str, request_args: dict, page: list, limit: Union[int, None],
+                      name_field: str, id_field: str) -> dict:
+    """
+    Returns headers with a link to the next page if the page is full
+    :param endpoint: endpoint of the collection
+    :type endpoint: str
+    :param request_args: request args that have to be preserved in the link
+    :type request_args: dict
+    :param page: list of item dicts of the current page
+    :type page: list
+    :param limit: page size, None if collection is not paginated
+    :type limit: int or None
+    :param name_field: name of the item field containing name
+    :type name_field: str
+    :param id_field: name of the item field containing id
+    :type id_field: str
+    :return: dict containing Link header or empty dict
+    :rtype: dict
+    """
+    next_args = next_page_args(request_args, page, limit, name_field, id_field)
+    if next_args is None:
+        return {}
+    next_url = url_for(endpoint, _external=True, **next_args)
+    return {'Link': f'<{next_url}>; rel="next"'}
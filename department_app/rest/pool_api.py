@@ -0,0 +1,24 @@
+"""
+Module containing REST API resource class to work with database connection pool
+"""
+from typing import Tuple
+
+from flask_restful import Resource
+
+from department_app.database import db
+from department_app.pool import pool_stats
+
+
+class PoolAPI(Resource):
+    """
+    Resource class to work with database connection pool
+    """
+    @staticmethod
+    def get() -> Tuple[dict, int]:
+        """
+        Returns state and counters of the database connection pool and status code
+        :return: tuple containing dict with pool size, numbers of connections in use, idle and overflow connections,
+        numbers of checkouts, timeouts, new and invalidated connections, checkout wait times and status code
+        :rtype: Tuple[dict, int]
+        """
+        return pool_stats(db.engine), 200
@@ -0,0 +1,87 @@
+"""
+Module containing JSON representation of REST API responses
+
+Responses are encoded with orjson if it is installed, otherwise with the standard json module,
+both encoders write UUID, date and float values natively, so dictionary representations of models
+can contain raw column values. RawJSON documents, e.g. built by the database, are sent without encoding.
+"""
+import json
+from datetime import date
+from typing import Union
+from uuid import UUID
+
+from flask import Response, make_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    # UUID type returned by asyncpg is not a subclass of uuid.UUID
+    from asyncpg.pgproto.pgproto import UUID as AsyncpgUUID
+    UUID_TYPES = (UUID, AsyncpgUUID)
+except ImportError:  # pragma: no cover
+    UUID_TYPES = (UUID,)
+
+
+class RawJSON(str):
+    """
+    Class for JSON documents that are already encoded
+    """
+
+
+def _default(value) -> str:
+    """
+    Encodes values that are not supported by the standard json module
+    :param value: value to encode
+    :return: string representation of the value
+    :rtype: str
+    :raises TypeError: if value type is not supported
+    """
+    if isinstance(value, UUID_TYPES):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps_json(data) -> bytes:
+    """
+    Encodes data to JSON using the standard json module
+    :param data: data to encode
+    :return: JSON document ending with a newline
+    :rtype: bytes
+    """
+    return (json.dumps(data, default=_default, separators=(',', ':')) + '\n').encode()
+
+
+def dumps_orjson(data) -> bytes:
+    """
+    Encodes data to JSON using orjson
+    :param data: data to encode
+    :return: JSON document ending with a newline
+    :rtype: bytes
+    """
+    return orjson.dumps(data, default=_default, option=orjson.OPT_APPEND_NEWLINE)
+
+
+dumps = dumps_orjson if orjson is not None else dumps_json
+
+
+def output_json(data: Union[dict, list, RawJSON], code: int, headers: Union[dict, None] = None) -> Response:
+    """
+    Makes response containing JSON representation of data, registered as application/json representation of the Api
+    :param data: data to encode or RawJSON document
+    :type data: dict or list or RawJSON
+    :param code: status code of the response
+    :type code: int
+    :param headers: headers of the response
+    :type headers: dict or None
+    :return: response
+    :rtype: Response
+    """
+    body = (data + '\n').encode() if isinstance(data, RawJSON) else dumps(data)
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    return response
@@ -0,0 +1,347 @@
+"""
+Module containing generator of synthetic departments and employees and `flask seed` command
+
+Data is deterministic for a given seed: department sizes follow a long-tailed distribution, positions
+have their own weights and log-normal salary distributions, birthdates are skewed towards younger employees.
+Rows are loaded into PostgreSQL with COPY FROM STDIN streamed in chunks and with batched inserts
+on other backends.
+"""
+
+# pylint: disable=no-member
+import io
+import itertools
+import math
+import random
+import time
+import uuid
+from datetime import date
+from typing import Iterable, Iterator, List, Sequence
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import delete, insert, select, text
+
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag, employee_tag
+from department_app.database import db
+from department_app.models import Department, Employee
+from department_app.service.version_service import commit_changes
+
+FIRST_NAMES = ('Olena', 'Andrii', 'Iryna', 'Oleksandr', 'Natalia', 'Dmytro', 'Kateryna', 'Serhii', 'Yulia', 'Maksym',
+               'Tetiana', 'Ivan', 'Oksana', 'Volodymyr', 'Mariia', 'Bohdan', 'Anna', 'Taras', 'Sofiia', 'Yurii',
+               'Viktoriia', 'Mykola', 'Daria', 'Roman', 'Halyna', 'Petro', 'Alina', 'Vasyl', 'Liudmyla', 'Artem')
+LAST_NAMES = ('Shevchenko', 'Kovalenko', 'Bondarenko', 'Tkachenko', 'Kravchenko', 'Oliinyk', 'Shevchuk', 'Koval',
+              'Polishchuk', 'Bondar', 'Tkachuk', 'Moroz', 'Marchenko', 'Lysenko', 'Rudenko', 'Savchenko', 'Petrenko',
+              'Kovalchuk', 'Melnyk', 'Boiko', 'Pavlenko', 'Levchenko', 'Kharchenko', 'Karpenko', 'Havryliuk')
+DEPARTMENT_NAMES = ('Sales', 'Marketing', 'Engineering', 'Finance', 'Human Resources', 'Support', 'Logistics',
+                    'Legal', 'Research', 'Procurement', 'Quality Assurance', 'Operations', 'Security', 'Design')
+# position, weight, median monthly salary and sigma of log-normal salary distribution
+POSITIONS = (
+    ('Intern', 4, 500, 0.20),
+    ('Junior Specialist', 20, 900, 0.25),
+    ('Specialist', 30, 1500, 0.25),
+    ('Senior Specialist', 18, 2500, 0.25),
+    ('Team Lead', 8, 3500, 0.20),
+    ('Manager', 10, 3000, 0.30),
+    ('Accountant', 6, 1400, 0.20),
+    ('Director', 2, 6000, 0.35),
+)
+POSITION_WEIGHTS = tuple(weight for _, weight, _, _ in POSITIONS)
+# position, mu and sigma of log-normal salary distribution
+SALARY_PARAMETERS = tuple((name, math.log(median), sigma) for name, _, median, sigma in POSITIONS)
+OLDEST_BIRTHDATE = date(1960, 1, 1)
+YOUNGEST_BIRTHDATE = date(2004, 12, 31)
+BIRTHDATE_DAYS = (YOUNGEST_BIRTHDATE - OLDEST_BIRTHDATE).days
+
+DEPARTMENT_COLUMNS = ('department_id', 'department_name', 'department_phone_number')
+EMPLOYEE_COLUMNS = ('employee_id', 'employee_name', 'position', 'salary', 'birthdate', 'department_id')
+
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+# text format of COPY values by type, PostgreSQL accepts UUIDs as 32 hex digits
+COPY_FORMATTERS = {
+    str: lambda value: value.translate(COPY_ESCAPES),
+    uuid.UUID: lambda value: value.hex,
+    float: float.__repr__,
+    date: date.isoformat,
+    type(None): lambda value: '\\N',
+}
+# secondary indexes of employee table are rebuilt after loading at least this many employees into an empty table
+DEFER_INDEXES_MIN_ROWS = 100000
+
+
+def random_uuid(rng: random.Random) -> uuid.UUID:
+    """
+    Returns version 4 UUID generated by a seeded random generator
+    :param rng: random generator
+    :type rng: random.Random
+    :rtype: uuid.UUID
+    """
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def generate_departments(rng: random.Random, number_of_departments: int) -> List[tuple]:
+    """
+    Returns generated department rows
+    :param rng: random generator
+    :type rng: random.Random
+    :param number_of_departments: number of departments
+    :type number_of_departments: int
+    :return: list of tuples of DEPARTMENT_COLUMNS values
+    :rtype: List[tuple]
+    """
+    return [(random_uuid(rng), f'{DEPARTMENT_NAMES[index % len(DEPARTMENT_NAMES)]} {index + 1}',
+             f'+380{rng.randrange(10 ** 9):09d}')
+            for index in range(number_of_departments)]
+
+
+def generate_employees(rng: random.Random, number_of_employees: int, department_ids: Sequence[uuid.UUID],
+                       chunk_size: int = 10000) -> Iterator[tuple]:
+    """
+    Generates employee rows, departments get long-tailed numbers of employees
+    :param rng: random generator
+    :type rng: random.Random
+    :param number_of_employees: number of employees
+    :type number_of_employees: int
+    :param department_ids: ids of departments of employees
+    :type department_ids: Sequence[uuid.UUID]
+    :param chunk_size: number of rows whose random choices are drawn at once
+    :type chunk_size: int
+    :return: iterator of tuples of EMPLOYEE_COLUMNS values
+    :rtype: Iterator[tuple]
+    """
+    department_weights = [rng.paretovariate(1.5) for _ in department_ids]
+    for chunk_start in range(0, number_of_employees, chunk_size):
+        yield from generate_employees_chunk(rng, min(chunk_size, number_of_employees - chunk_start), department_ids,
+                                            department_weights)
+
+
+def generate_employees_chunk(rng: random.Random, size: int, department_ids: Sequence[uuid.UUID],
+                             department_weights: Sequence[float]) -> Iterator[tuple]:
+    """
+    Generates a chunk of employee rows, random choices of the chunk are drawn at once
+    :param rng: random generator
+    :type rng: random.Random
+    :param size: number of employees
+    :type size: int
+    :param department_ids: ids of departments of employees
+    :type department_ids: Sequence[uuid.UUID]
+    :param department_weights: weights of departments
+    :type department_weights: Sequence[float]
+    :return: iterator of tuples of EMPLOYEE_COLUMNS values
+    :rtype: Iterator[tuple]
+    """
+    first_day, days = OLDEST_BIRTHDATE.toordinal(), BIRTHDATE_DAYS
+    lognormvariate, triangular, getrandbits = rng.lognormvariate, rng.triangular, rng.getrandbits
+    for first_name, last_name, (position, mu, sigma), department_id in zip(
+            rng.choices(FIRST_NAMES, k=size), rng.choices(LAST_NAMES, k=size),
+            rng.choices(SALARY_PARAMETERS, POSITION_WEIGHTS, k=size),
+            rng.choices(department_ids, department_weights, k=size)):
+        yield (uuid.UUID(int=getrandbits(128), version=4), f'{first_name} {last_name}', position,
+               round(lognormvariate(mu, sigma), -1), date.fromordinal(first_day + int(triangular(0, days, days))),
+               department_id)
+
+
+def format_copy_row(row: Iterable) -> str:
+    """
+    Returns row in text format of COPY
+    :param row: values of the row
+    :type row: Iterable
+    :rtype: str
+    """
+    return '\t'.join([COPY_FORMATTERS.get(value.__class__, str)(value) for value in row]) + '\n'
+
+
+class CopyStream(io.TextIOBase):
+    """
+    Read-only text stream of rows in text format of COPY, rows are formatted in chunks when they are read
+    """
+    def __init__(self, rows: Iterable[Iterable], chunk_size: int):
+        super().__init__()
+        self._rows = iter(rows)
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self.rows_count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_chunk(self) -> str:
+        lines = [format_copy_row(row) for row in itertools.islice(self._rows, self._chunk_size)]
+        self.rows_count += len(lines)
+        return ''.join(lines)
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def copy_rows(table_name: str, columns: Sequence[str], rows: Iterable[Iterable], chunk_size: int) -> int:
+    """
+    Loads rows into PostgreSQL table with COPY FROM STDIN in the transaction of the session
+    :param table_name: name of the table
+    :type table_name: str
+    :param columns: names of columns
+    :type columns: Sequence[str]
+    :param rows: iterable of row values
+    :type rows: Iterable[Iterable]
+    :param chunk_size: number of rows formatted at once
+    :type chunk_size: int
+    :return: number of loaded rows
+    :rtype: int
+    """
+    stream = CopyStream(rows, chunk_size)
+    with db.session.connection().connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {table_name} ({", ".join(columns)}) FROM STDIN', stream, size=1 << 20)
+    return stream.rows_count
+
+
+def insert_rows(table, columns: Sequence[str], rows: Iterable[Iterable], chunk_size: int) -> int:
+    """
+    Loads rows into table with batched inserts in the transaction of the session
+    :param table: SQLAlchemy table
+    :param columns: names of columns
+    :type columns: Sequence[str]
+    :param rows: iterable of row values
+    :type rows: Iterable[Iterable]
+    :param chunk_size: number of rows of a batch
+    :type chunk_size: int
+    :return: number of loaded rows
+    :rtype: int
+    """
+    rows = iter(rows)
+    rows_count = 0
+    while True:
+        batch = [dict(zip(columns, row)) for row in itertools.islice(rows, chunk_size)]
+        if not batch:
+            return rows_count
+        db.session.execute(insert(table), batch)
+        rows_count += len(batch)
+
+
+def clear_tables(is_postgresql: bool) -> list:
+    """
+    Deletes all departments and employees in the transaction of the session
+    :param is_postgresql: True if the database is PostgreSQL, tables are truncated then
+    :type is_postgresql: bool
+    :return: cache tags of deleted departments and employees
+    :rtype: list
+    """
+    tables = f'{Employee.__tablename__}, {Department.__tablename__}'
+    if is_postgresql:
+        # rows created by other transactions after ids are read would be truncated without changing their versions
+        db.session.execute(text(f'LOCK TABLE {tables} IN ACCESS EXCLUSIVE MODE'))
+    deleted_tags = [*map(department_tag, db.session.execute(select(Department.department_id)).scalars()),
+                    *map(employee_tag, db.session.execute(select(Employee.employee_id)).scalars())]
+    if is_postgresql:
+        db.session.execute(text(f'TRUNCATE {tables}'))
+    else:
+        db.session.execute(delete(Employee.__table__))
+        db.session.execute(delete(Department.__table__))
+    return deleted_tags
+
+
+def deferred_employee_indexes(number_of_employees: int) -> list:
+    """
+    Returns secondary indexes of employee table that are rebuilt after loading employees,
+    indexes are deferred only if the table is empty and at least DEFER_INDEXES_MIN_ROWS employees are loaded
+    :param number_of_employees: number of loaded employees
+    :type number_of_employees: int
+    :return: list of indexes ordered by name
+    :rtype: list
+    """
+    if number_of_employees < DEFER_INDEXES_MIN_ROWS or \
+            db.session.execute(select(Employee.employee_id).limit(1)).first() is not None:
+        return []
+    return sorted(Employee.__table__.indexes, key=lambda index: index.name)
+
+
+def copy_seed_rows(departments: Iterable[Iterable], employees: Iterable[Iterable], number_of_employees: int,
+                   chunk_size: int):
+    """
+    Loads departments and employees into PostgreSQL with COPY in the transaction of the session
+    :param departments: iterable of department row values
+    :type departments: Iterable[Iterable]
+    :param employees: iterable of employee row values
+    :type employees: Iterable[Iterable]
+    :param number_of_employees: number of employees
+    :type number_of_employees: int
+    :param chunk_size: number of rows formatted at once
+    :type chunk_size: int
+    """
+    # building indexes once after COPY is much faster than updating them for every row,
+    # dropped indexes are restored in the same transaction
+    deferred_indexes = deferred_employee_indexes(number_of_employees)
+    connection = db.session.connection()
+    for index in deferred_indexes:
+        index.drop(connection)
+    copy_rows(Department.__tablename__, DEPARTMENT_COLUMNS, departments, chunk_size)
+    copy_rows(Employee.__tablename__, EMPLOYEE_COLUMNS, employees, chunk_size)
+    for index in deferred_indexes:
+        index.create(connection)
+
+
+def seed_database(number_of_departments: int, number_of_employees: int, seed: int = 0,
+                  chunk_size: int = 50000, clear: bool = False) -> List[uuid.UUID]:
+    """
+    Generates departments and employees and loads them into the database in a single transaction,
+    secondary indexes of an empty employee table are rebuilt after large loads into PostgreSQL
+    :param number_of_departments: number of departments
+    :type number_of_departments: int
+    :param number_of_employees: number of employees
+    :type number_of_employees: int
+    :param seed: seed of random generator, the same seed produces the same data
+    :type seed: int
+    :param chunk_size: number of rows formatted or inserted at once
+    :type chunk_size: int
+    :param clear: True to delete existing departments and employees first
+    :type clear: bool
+    :return: list of ids of created departments
+    :rtype: List[uuid.UUID]
+    """
+    if number_of_employees and not number_of_departments:
+        raise ValueError('employees require at least one department')
+    is_postgresql = db.engine.dialect.name == 'postgresql'
+    deleted_tags = clear_tables(is_postgresql) if clear else []
+
+    rng = random.Random(seed)
+    departments = generate_departments(rng, number_of_departments)
+    employees = generate_employees(rng, number_of_employees, [row[0] for row in departments])
+    if is_postgresql:
+        copy_seed_rows(departments, employees, number_of_employees, chunk_size)
+    else:
+        insert_rows(Department.__table__, DEPARTMENT_COLUMNS, departments, chunk_size)
+        insert_rows(Employee.__table__, EMPLOYEE_COLUMNS, employees, chunk_size)
+    commit_changes(DEPARTMENTS_TAG, EMPLOYEES_TAG, *deleted_tags)
+    if is_postgresql:
+        db.session.execute(text(f'ANALYZE {Department.__tablename__}, {Employee.__tablename__}'))
+        db.session.commit()
+    return [row[0] for row in departments]
+
+
+@click.command('seed')
+@click.option('--departments', 'number_of_departments', type=click.IntRange(min=0), default=100, show_default=True,
+              help='Number of departments to generate.')
+@click.option('--employees', 'number_of_employees', type=click.IntRange(min=0), default=10000, show_default=True,
+              help='Number of employees to generate.')
+@click.option('--seed', type=int, default=0, show_default=True, help='Seed of random generator.')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=50000, show_default=True,
+              help='Number of rows formatted or inserted at once.')
+@click.option('--clear', is_flag=True, help='Delete existing departments and employees first.')
+@with_appcontext
+def seed_command(number_of_departments: int, number_of_employees: int, seed: int, chunk_size: int, clear: bool):
+    """
+    Fills the database with generated departments and employees.
+    """
+    start = time.perf_counter()
+    try:
+        seed_database(number_of_departments, number_of_employees, seed, chunk_size, clear)
+    except ValueError as error:
+        raise click.UsageError(str(error)) from error
+    click.echo(f'Created {number_of_departments} departments and {number_of_employees} employees '
+               f'in {time.perf_counter() - start:.1f} s')
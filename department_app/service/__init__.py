@@ -4,3 +4,5 @@ Package containing functions to work with the database models
 
 from department_app.service.department_service import *
 from department_app.service.employee_service import *
+from department_app.service.import_service import *
+from department_app.service.version_service import *
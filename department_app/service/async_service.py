@@ -0,0 +1,230 @@
+"""
+Module containing async versions of read functions of department_app.service,
+they run the same queries on an AsyncSession of an async engine (e.g. with asyncpg driver)
+"""
+
+# pylint: disable=no-member
+from datetime import date
+from typing import Union, Tuple, Iterable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from department_app.models import Department
+from department_app.service.dto import DepartmentDTO
+from department_app.service.version_service import data_version_query, data_version_from_rows
+from department_app.service.department_service import departments_dtos_query, attach_employees, \
+    departments_json_query
+from department_app.service.employee_service import EmployeesFilter, employees_dtos_query, \
+    employees_dtos_from_rows, employees_json_query
+
+
+async def get_data_version(session: AsyncSession, *tags) -> str:
+    """
+    Function returns version of data with specified cache tags
+    :param session: async session
+    :type session: AsyncSession
+    :param tags: cache tags or SQL expressions returning cache tags
+    :return: version of the data
+    :rtype: str
+    """
+    return data_version_from_rows(await session.execute(data_version_query(tags)))
+
+
+async def department_exists(session: AsyncSession, department_id: UUID) -> bool:
+    """
+    Function checks that department with specified id exists
+    :param session: async session
+    :type session: AsyncSession
+    :param department_id: id of a department
+    :type department_id: UUID
+    :return: True if department exists else False
+    :rtype: bool
+    """
+    query = select(Department.__table__.c.department_id).where(Department.__table__.c.department_id == department_id)
+    return (await session.execute(query)).first() is not None
+
+
+async def _get_departments_dtos(session: AsyncSession,
+                                limit: Union[int, None] = None,
+                                after: Union[Tuple[str, UUID], None] = None,
+                                fields: Union[Iterable[str], None] = None,
+                                include: Union[Iterable[str], None] = None,
+                                department_id: Union[UUID, None] = None) -> list:
+    """
+    Function returns list of DepartmentDTO, parameters are the same as of get_departments_data
+    """
+    include_employees, include_employees_department = include is None or 'employees' in include, include is None
+    query, names = departments_dtos_query(limit, after, fields, include_employees, include_employees_department,
+                                          department_id)
+    departments = [DepartmentDTO(**dict(zip(names, row))) for row in await session.execute(query)]
+    if include_employees and departments:
+        employees_query, employees_names = employees_dtos_query(
+            EmployeesFilter(department_ids=[department.department_id for department in departments]),
+            include_department=False
+        )
+        employees = employees_dtos_from_rows(await session.execute(employees_query), employees_names, False)
+        attach_employees(departments, employees, include_employees_department)
+    return departments
+
+
+async def get_departments_data(session: AsyncSession,
+                               limit: Union[int, None] = None,
+                               after: Union[Tuple[str, UUID], None] = None,
+                               fields: Union[Iterable[str], None] = None,
+                               include: Union[Iterable[str], None] = None) -> list:
+    """
+    Function returns dictionary representations of all departments ordered by name and id
+    :param session: async session
+    :type session: AsyncSession
+    :param limit: maximum number of departments to return, None to return all
+    :type limit: int or None
+    :param after: (department_name, department_id) of the department after which departments are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed employees with their department
+    :type include: Iterable[str] or None
+    :return: list of dictionary representations of all departments
+    :rtype: list
+    """
+    departments = await _get_departments_dtos(session, limit, after, fields, include)
+    return [department.as_dict(fields, include) for department in departments]
+
+
+async def get_departments_json(session: AsyncSession,
+                               fields: Union[Iterable[str], None] = None,
+                               include: Union[Iterable[str], None] = None) -> Union[str, None]:
+    """
+    Function returns JSON array of dictionary representations of all departments ordered by name and id,
+    the document is built by PostgreSQL and is not decoded
+    :param session: async session
+    :type session: AsyncSession
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed employees with their department
+    :type include: Iterable[str] or None
+    :return: JSON document, None if the database is not PostgreSQL
+    :rtype: str or None
+    """
+    if session.bind.dialect.name != 'postgresql':
+        return None
+    return (await session.execute(departments_json_query(fields, include))).scalar_one()
+
+
+async def get_department_data(session: AsyncSession,
+                              department_id: UUID,
+                              fields: Union[Iterable[str], None] = None,
+                              include: Union[Iterable[str], None] = None) -> Union[dict, bool]:
+    """
+    Function returns dictionary representation of Department with specified id
+    :param session: async session
+    :type session: AsyncSession
+    :param department_id: id of a department
+    :type department_id: UUID
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed employees with their department
+    :type include: Iterable[str] or None
+    :return: dictionary representation of a department if department exists else False
+    :rtype: dict or bool
+    """
+    departments = await _get_departments_dtos(session, fields=fields, include=include, department_id=department_id)
+    if not departments:
+        return False
+    return departments[0].as_dict(fields, include)
+
+
+async def get_employees_data(session: AsyncSession,
+                             department_id: Union[UUID, None] = None,
+                             start_date: Union[date, None] = None,
+                             end_date: Union[date, None] = None,
+                             limit: Union[int, None] = None,
+                             after: Union[Tuple[str, UUID], None] = None,
+                             fields: Union[Iterable[str], None] = None,
+                             include: Union[Iterable[str], None] = None) -> list:
+    """
+    Function returns dictionary representations of Employees that are satisfying conditions ordered by name and id
+    :param session: async session
+    :type session: AsyncSession
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param limit: maximum number of employees to return, None to return all
+    :type limit: int or None
+    :param after: (employee_name, employee_id) of the employee after which employees are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed department
+    :type include: Iterable[str] or None
+    :return: list of dictionary representations of employees that are satisfying conditions
+    :rtype: list
+    """
+    include_department = include is None or 'department' in include
+    query, names = employees_dtos_query(EmployeesFilter(department_id, start_date, end_date), limit, after, fields,
+                                        include_department)
+    employees = employees_dtos_from_rows(await session.execute(query), names, include_department)
+    return [employee.as_dict(fields, include) for employee in employees]
+
+
+async def get_employees_json(session: AsyncSession,
+                             department_id: Union[UUID, None] = None,
+                             start_date: Union[date, None] = None,
+                             end_date: Union[date, None] = None,
+                             fields: Union[Iterable[str], None] = None,
+                             include: Union[Iterable[str], None] = None) -> Union[str, None]:
+    """
+    Function returns JSON array of dictionary representations of Employees that are satisfying conditions
+    ordered by name and id, the document is built by PostgreSQL and is not decoded
+    :param session: async session
+    :type session: AsyncSession
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed department
+    :type include: Iterable[str] or None
+    :return: JSON document, None if the database is not PostgreSQL
+    :rtype: str or None
+    """
+    if session.bind.dialect.name != 'postgresql':
+        return None
+    query = employees_json_query(department_id, start_date, end_date, fields, include)
+    return (await session.execute(query)).scalar_one()
+
+
+async def get_employee_data(session: AsyncSession,
+                            employee_id: UUID,
+                            fields: Union[Iterable[str], None] = None,
+                            include: Union[Iterable[str], None] = None) -> Union[dict, bool]:
+    """
+    Function returns dictionary representation of Employee with specified id
+    :param session: async session
+    :type session: AsyncSession
+    :param employee_id: id of an employee
+    :type employee_id: UUID
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed department
+    :type include: Iterable[str] or None
+    :return: dictionary representation of an employee if employee exists else False
+    :rtype: dict or bool
+    """
+    include_department = include is None or 'department' in include
+    query, names = employees_dtos_query(EmployeesFilter(employee_id=employee_id), fields=fields,
+                                        include_department=include_department)
+    employees = employees_dtos_from_rows(await session.execute(query), names, include_department)
+    if not employees:
+        return False
+    return employees[0].as_dict(fields, include)
@@ -3,52 +3,323 @@ Module containing functions to work with the Department model
 """
 
 # pylint: disable=no-member
-from typing import Union
+import uuid
+from typing import Union, Callable, Tuple, Iterable
 
 from uuid import UUID
+from sqlalchemy import func, tuple_, select, insert, update, delete, literal, cast, Text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import selectinload, with_expression, load_only
+
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag
 from department_app.database import db
-from department_app.models import Department
+from department_app.service.version_service import commit_changes, with_data_versions
+from department_app.models import Department, Employee
+from department_app.service.dto import DepartmentDTO
+from department_app.service.employee_service import get_employees_dtos, employee_json_object
+
+# SQLSTATE of violated foreign key constraint
+FOREIGN_KEY_VIOLATION = '23503'
+
+
+def department_statistics() -> tuple:
+    """
+    Function returns subquery containing number of employees and average salary of every department
+    that has employees, it is the only SQL definition of these statistics and all department queries
+    outer join it to departments on department_id
+    :return: tuple containing the subquery and number of employees and average salary columns,
+    which are 0 for departments without employees
+    :rtype: tuple
+    """
+    employee_table = Employee.__table__
+    statistics = select(employee_table.c.department_id,
+                        func.count(employee_table.c.employee_id).label('number_of_employees'),
+                        func.avg(employee_table.c.salary).label('average_salary')) \
+        .group_by(employee_table.c.department_id) \
+        .subquery('department_statistics')
+    return statistics, func.coalesce(statistics.c.number_of_employees, 0), \
+        func.coalesce(statistics.c.average_salary, 0.0)
+
+
+def _departments_query(fields: Union[Iterable[str], None] = None):
+    """
+    Function returns query of departments that loads only columns of specified fields,
+    number of employees and average salary of departments are computed by the database if they are specified
+    :param fields: names of Department fields to load, None to load all fields
+    :type fields: Iterable[str] or None
+    :return: query of departments
+    """
+    query = Department.query.populate_existing()
+    if fields is not None:
+        query = query.options(load_only(Department.department_id,
+                                        *(getattr(Department, field) for field in fields
+                                          if field in Department.__table__.columns)))
+    if fields is None or {'number_of_employees', 'average_salary'}.intersection(fields):
+        statistics, number_of_employees, average_salary = department_statistics()
+        query = query \
+            .outerjoin(statistics, statistics.c.department_id == Department.department_id) \
+            .options(with_expression(Department.loaded_number_of_employees, number_of_employees),
+                     with_expression(Department.loaded_average_salary, average_salary))
+    return query
 
 
-def get_all_departments() -> list:
+def get_all_departments(loader: Union[Callable, None] = None,
+                        limit: Union[int, None] = None,
+                        after: Union[Tuple[str, UUID], None] = None,
+                        fields: Union[Iterable[str], None] = None) -> list:
     """
-    Function returns list of all departments
+    Function returns list of all departments ordered by name and id,
+    number of employees and average salary of departments are computed by the database in the same query
+    :param loader: loader option used to load employees of departments (e.g. selectinload or joinedload),
+    None to load them lazily
+    :type loader: Callable or None
+    :param limit: maximum number of departments to return, None to return all
+    :type limit: int or None
+    :param after: (department_name, department_id) of the department after which departments are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of Department fields to load, None to load all fields
+    :type fields: Iterable[str] or None
     :return: list of all departments
     :rtype: list
     """
-    departments = Department.query.all()
+    query = _departments_query(fields).order_by(Department.department_name, Department.department_id)
+    if after is not None:
+        query = query.filter(tuple_(Department.department_name, Department.department_id) > tuple_(*after))
+    if limit is not None:
+        query = query.limit(limit)
+    if loader is not None:
+        query = query.options(loader(Department.employees))
+    departments = query.all()
     return departments
 
 
-def get_department_by_id(department_id: UUID) -> Union[Department, bool]:
+def get_department_by_id(department_id: UUID, loader: Union[Callable, None] = None) -> Union[Department, bool]:
     """
     Function returns Department with specified id
     :param department_id: id of a department
     :type department_id: UUID
+    :param loader: loader option used to load employees of the department (e.g. selectinload or joinedload),
+    None to load them lazily
+    :type loader: Callable or None
     :return: Department if department exists else False
     :rtype: Department or bool
     """
-    department = db.session.get(Department, department_id)
+    options = (loader(Department.employees),) if loader is not None else ()
+    department = db.session.get(Department, department_id, options=options)
     if not department:
         return False
 
     return department
 
 
-def create_department(department_name: str, department_phone_number: str) -> bool:
+def get_departments_data(limit: Union[int, None] = None,
+                         after: Union[Tuple[str, UUID], None] = None,
+                         fields: Union[Iterable[str], None] = None,
+                         include: Union[Iterable[str], None] = None) -> list:
+    """
+    Function returns dictionary representations of all departments ordered by name and id,
+    only columns of specified fields are loaded and employees are loaded only if they are embedded
+    :param limit: maximum number of departments to return, None to return all
+    :type limit: int or None
+    :param after: (department_name, department_id) of the department after which departments are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed employees with their department
+    :type include: Iterable[str] or None
+    :return: list of dictionary representations of all departments
+    :rtype: list
+    """
+    departments = get_departments_dtos(limit, after, fields,
+                                       include_employees=include is None or 'employees' in include,
+                                       include_employees_department=include is None)
+    return [department.as_dict(fields, include) for department in departments]
+
+
+def get_departments_dtos(limit: Union[int, None] = None,
+                         after: Union[Tuple[str, UUID], None] = None,
+                         fields: Union[Iterable[str], None] = None,
+                         include_employees: bool = True,
+                         include_employees_department: bool = True) -> list:
+    """
+    Function returns read-only representations of all departments ordered by name and id,
+    Core select of only needed columns is used, so no ORM objects are created,
+    number of employees and average salary of departments are computed by the database if they are needed
+    :param limit: maximum number of departments to return, None to return all
+    :type limit: int or None
+    :param after: (department_name, department_id) of the department after which departments are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of Department fields to load, None to load all fields
+    :type fields: Iterable[str] or None
+    :param include_employees: True if employees of departments have to be loaded
+    :type include_employees: bool
+    :param include_employees_department: True if department of employees has to be embedded into them
+    :type include_employees_department: bool
+    :return: list of DepartmentDTO
+    :rtype: list
+    """
+    query, names = departments_dtos_query(limit, after, fields, include_employees, include_employees_department)
+    departments = [DepartmentDTO(**dict(zip(names, row))) for row in db.session.execute(query)]
+    if include_employees and departments:
+        employees = get_employees_dtos(department_ids=[department.department_id for department in departments],
+                                       include_department=False)
+        attach_employees(departments, employees, include_employees_department)
+    return departments
+
+
+def departments_dtos_query(limit: Union[int, None] = None,
+                           after: Union[Tuple[str, UUID], None] = None,
+                           fields: Union[Iterable[str], None] = None,
+                           include_employees: bool = True,
+                           include_employees_department: bool = True,
+                           department_id: Union[UUID, None] = None) -> tuple:
+    """
+    Function returns Core select of departments used by get_departments_dtos, parameters are the same,
+    the query does not depend on a session, so it is shared with the async service
+    :param department_id: id of the department, None if not specified
+    :type department_id: UUID or None
+    :return: tuple containing the select and names of selected Department fields
+    :rtype: tuple
+    """
+    department_table = Department.__table__
+    required_fields = {'department_id'}
+    if include_employees and include_employees_department:
+        required_fields.update(('department_name', 'department_phone_number'))
+    names = tuple(field for field in Department.FIELDS
+                  if (fields is None or field in fields or field in required_fields) and field in department_table.c)
+    query = select(*(department_table.c[name] for name in names)) \
+        .order_by(department_table.c.department_name, department_table.c.department_id)
+    if fields is None or {'number_of_employees', 'average_salary'}.intersection(fields):
+        names += ('number_of_employees', 'average_salary')
+        statistics, number_of_employees, average_salary = department_statistics()
+        query = query \
+            .add_columns(number_of_employees, average_salary) \
+            .select_from(department_table.outerjoin(statistics,
+                                                    statistics.c.department_id == department_table.c.department_id))
+    if department_id is not None:
+        query = query.where(department_table.c.department_id == department_id)
+    if after is not None:
+        query = query.where(tuple_(department_table.c.department_name, department_table.c.department_id)
+                            > tuple_(*after))
+    if limit is not None:
+        query = query.limit(limit)
+    return query, names
+
+
+def attach_employees(departments: list, employees: list, include_employees_department: bool):
+    """
+    Function sets employees of DepartmentDTO from list of EmployeeDTO of these departments
+    :param departments: list of DepartmentDTO
+    :type departments: list
+    :param employees: list of EmployeeDTO
+    :type employees: list
+    :param include_employees_department: True if department of employees has to be embedded into them
+    :type include_employees_department: bool
+    """
+    employees_by_department = {department.department_id: [] for department in departments}
+    for employee in employees:
+        employees_by_department[employee.department_id].append(employee)
+    for department in departments:
+        department.employees = employees_by_department[department.department_id]
+        if include_employees_department:
+            department_data = {
+                'department_id': department.department_id,
+                'department_name': department.department_name,
+                'department_phone_number': department.department_phone_number,
+            }
+            for employee in department.employees:
+                employee.department = department_data
+
+
+def get_departments_json(fields: Union[Iterable[str], None] = None,
+                         include: Union[Iterable[str], None] = None) -> Union[str, None]:
     """
-    Function creates new Department
+    Function returns JSON array of dictionary representations of all departments ordered by name and id,
+    the document is built by PostgreSQL and is not decoded
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed employees with their department
+    :type include: Iterable[str] or None
+    :return: JSON document, None if the database is not PostgreSQL
+    :rtype: str or None
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return None
+    return db.session.execute(departments_json_query(fields, include)).scalar_one()
+
+
+def departments_json_query(fields: Union[Iterable[str], None] = None, include: Union[Iterable[str], None] = None):
+    """
+    Function returns PostgreSQL select used by get_departments_json, parameters are the same
+    :return: select of the JSON document
+    """
+    department_table, employee_table = Department.__table__, Employee.__table__
+    statistics, number_of_employees, average_salary = department_statistics()
+    values = {'number_of_employees': number_of_employees, 'average_salary': average_salary}
+    arguments = []
+    for field in Department.FIELDS:
+        if fields is None or field in fields:
+            arguments += (literal(field), values[field] if field in values else department_table.c[field])
+    if include is None or 'employees' in include:
+        employee_object = employee_json_object(employee_table, None, include is None, department_table)
+        employees_array = select(func.coalesce(func.json_agg(employee_object), func.json_build_array())) \
+            .where(employee_table.c.department_id == department_table.c.department_id)
+        arguments += (literal('employees'), employees_array.scalar_subquery())
+    departments_array = func.json_agg(aggregate_order_by(func.json_build_object(*arguments),
+                                                         department_table.c.department_name,
+                                                         department_table.c.department_id))
+    departments = department_table
+    if fields is None or values.keys() & set(fields):
+        departments = department_table.outerjoin(statistics,
+                                                 statistics.c.department_id == department_table.c.department_id)
+    return select(cast(func.coalesce(departments_array, func.json_build_array()), Text)).select_from(departments)
+
+
+def get_department_data(department_id: UUID,
+                        fields: Union[Iterable[str], None] = None,
+                        include: Union[Iterable[str], None] = None) -> Union[dict, bool]:
+    """
+    Function returns dictionary representation of Department with specified id,
+    only columns of specified fields are loaded and employees are loaded only if they are embedded
+    :param department_id: id of a department
+    :type department_id: UUID
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed employees with their department
+    :type include: Iterable[str] or None
+    :return: dictionary representation of a department if department exists else False
+    :rtype: dict or bool
+    """
+    query = _departments_query(fields).filter(Department.department_id == department_id)
+    if include is None or 'employees' in include:
+        query = query.options(selectinload(Department.employees))
+    department = query.one_or_none()
+    if not department:
+        return False
+    return department.to_dict(fields, include)
+
+
+def create_department(department_name: str, department_phone_number: str) -> dict:
+    """
+    Function creates new Department using a single statement
     :param department_name: name of a department
     :type department_name: str
     :param department_phone_number: phone number of a department
     :type department_phone_number: str
-    :return: returns True
-    :rtype: bool
+    :return: dict containing id and fields of created department
+    :rtype: dict
     """
-    department = Department(department_name=department_name, department_phone_number=department_phone_number)
-    db.session.add(department)
-    db.session.commit()
-    return True
+    query = insert(Department.__table__) \
+        .values(department_id=uuid.uuid4(), department_name=department_name,
+                department_phone_number=department_phone_number) \
+        .returning(*Department.__table__.columns)
+    department = dict(db.session.execute(with_data_versions(query, DEPARTMENTS_TAG)).mappings().one())
+    commit_changes(DEPARTMENTS_TAG, versions_changed=True)
+    return department
 
 
 def update_department(department_id: UUID,
@@ -65,32 +336,130 @@ def update_department(department_id: UUID,
     :return: returns True on success else False
     :rtype: bool
     """
-    department = db.session.get(Department, department_id)
-    if not department:
+    values = {name: value for name, value in (('department_name', department_name),
+                                               ('department_phone_number', department_phone_number))
+              if value is not None}
+    if not values:
+        return bool(get_existing_department_ids((department_id,)))
+
+    tags = (DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag(department_id))
+    query = update(Department.__table__) \
+        .where(Department.department_id == department_id) \
+        .values(**values) \
+        .returning(Department.department_id)
+    if db.session.execute(with_data_versions(query, *tags)).first() is None:
+        db.session.rollback()
         return False
+    commit_changes(*tags, versions_changed=True)
+    return True
 
-    if department_name is not None:
-        department.department_name = department_name
-    if department_phone_number is not None:
-        department.department_phone_number = department_phone_number
 
-    db.session.add(department)
-    db.session.commit()
-    return True
+def execute_department_delete(query):
+    """
+    Function executes DELETE statement of departments, employees of deleted departments are handled
+    by ON DELETE policy of the foreign key
+    :param query: DELETE statement
+    :return: result of the statement
+    :raises ValueError: if the policy is RESTRICT and a department has employees
+    """
+    try:
+        return db.session.execute(query)
+    except IntegrityError as error:
+        db.session.rollback()
+        if getattr(error.orig, 'pgcode', None) == FOREIGN_KEY_VIOLATION:
+            raise ValueError('department has employees') from error
+        raise
 
 
 def delete_department(department_id: UUID) -> bool:
     """
-    Function deletes Department with specified id
+    Function deletes Department with specified id using a single statement, employees of the department
+    are left without a department, deleted or prevent deletion according to DEPARTMENT_ON_DELETE policy
     :param department_id: id of a department
     :type department_id: UUID
     :return: returns True on success else False
     :rtype: bool
+    :raises ValueError: if the department has employees and the policy is RESTRICT
     """
-    department = db.session.get(Department, department_id)
-    if not department:
+    tags = (DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag(department_id))
+    query = delete(Department.__table__) \
+        .where(Department.department_id == department_id) \
+        .returning(Department.department_id)
+    if execute_department_delete(with_data_versions(query, *tags)).first() is None:
+        db.session.rollback()
         return False
-
-    db.session.delete(department)
-    db.session.commit()
+    # the statement bypasses the ORM, so a loaded instance of the department is evicted as an ORM delete would do
+    department = db.session.identity_map.get(db.session.identity_key(Department, department_id))
+    if department is not None:
+        db.session.expunge(department)
+    commit_changes(*tags, versions_changed=True)
     return True
+
+
+def get_existing_department_ids(department_ids: Iterable[UUID]) -> set:
+    """
+    Function returns ids of existing Departments among specified ids using a single query
+    :param department_ids: ids of departments
+    :type department_ids: Iterable[UUID]
+    :return: set of ids of departments that exist
+    :rtype: set
+    """
+    department_ids = set(department_ids)
+    if not department_ids:
+        return set()
+    query = select(Department.department_id).where(Department.department_id.in_(department_ids))
+    return set(db.session.execute(query).scalars())
+
+
+def create_departments(departments_data: list) -> list:
+    """
+    Function creates new Departments in a single transaction using batched inserts
+    :param departments_data: list of dicts containing department_name and department_phone_number
+    :type departments_data: list
+    :return: list of ids of created departments in the same order
+    :rtype: list
+    """
+    rows = [dict(department_data, department_id=uuid.uuid4()) for department_data in departments_data]
+    if rows:
+        db.session.execute(insert(Department.__table__), rows)
+    commit_changes(DEPARTMENTS_TAG)
+    return [row['department_id'] for row in rows]
+
+
+def update_departments(departments_data: list) -> list:
+    """
+    Function updates Departments in a single transaction,
+    fields that are not specified in department data are not changed
+    :param departments_data: list of dicts containing department_id and fields of a department that have to be updated
+    :type departments_data: list
+    :return: list containing True for updated departments and False for departments that do not exist
+    :rtype: list
+    """
+    existing_ids = get_existing_department_ids(department_data['department_id']
+                                               for department_data in departments_data)
+    mappings = [department_data for department_data in departments_data
+                if department_data['department_id'] in existing_ids and len(department_data) > 1]
+    db.session.bulk_update_mappings(Department, mappings)
+    commit_changes(DEPARTMENTS_TAG, EMPLOYEES_TAG,
+                   *(department_tag(department_data['department_id']) for department_data in mappings))
+    return [department_data['department_id'] in existing_ids for department_data in departments_data]
+
+
+def delete_departments(department_ids: list) -> list:
+    """
+    Function deletes Departments with specified ids using a single statement, employees of deleted departments
+    are left without a department, deleted or prevent deletion according to DEPARTMENT_ON_DELETE policy
+    :param department_ids: ids of departments
+    :type department_ids: list
+    :return: list containing True for deleted departments and False for departments that do not exist
+    :rtype: list
+    :raises ValueError: if a department has employees and the policy is RESTRICT
+    """
+    deleted_ids = set()
+    if department_ids:
+        query = delete(Department.__table__) \
+            .where(Department.department_id.in_(set(department_ids))) \
+            .returning(Department.department_id)
+        deleted_ids = set(execute_department_delete(query).scalars())
+    commit_changes(DEPARTMENTS_TAG, EMPLOYEES_TAG, *map(department_tag, deleted_ids))
+    return [department_id in deleted_ids for department_id in department_ids]
@@ -0,0 +1,92 @@
+"""
+Module containing read-only data transfer objects built from rows of Core queries
+"""
+
+from typing import Iterable, Union
+
+from department_app.models import Department, Employee
+
+
+class EmployeeDTO:
+    """
+    Class for read-only representation of an employee, department is a dict or None
+    """
+    __slots__ = Employee.FIELDS + ('department',)
+
+    def __init__(self, employee_id=None, employee_name=None, position=None, salary=None, birthdate=None,
+                 department_id=None, department=None):
+        self.employee_id = employee_id
+        self.employee_name = employee_name
+        self.position = position
+        self.salary = salary
+        self.birthdate = birthdate
+        self.department_id = department_id
+        self.department = department
+
+    def as_dict(self, fields: Union[Iterable[str], None] = None, include: Union[Iterable[str], None] = None) -> dict:
+        """
+        Method returns dictionary representation of the employee equal to Employee.to_dict()
+        :param fields: names of fields to represent, None to represent all fields
+        :type fields: Iterable[str] or None
+        :param include: names of related objects to embed, None to embed department
+        :type include: Iterable[str] or None
+        :return: dictionary representation of the employee
+        :rtype: dict
+        """
+        if fields is None:
+            employee_dict = {
+                'employee_id': self.employee_id,
+                'employee_name': self.employee_name,
+                'position': self.position,
+                'salary': self.salary,
+                'birthdate': self.birthdate,
+                'department_id': self.department_id,
+            }
+        else:
+            employee_dict = {field: getattr(self, field) for field in Employee.FIELDS if field in fields}
+        if include is None or 'department' in include:
+            employee_dict['department'] = self.department
+        return employee_dict
+
+
+class DepartmentDTO:
+    """
+    Class for read-only representation of a department, employees is a list of EmployeeDTO
+    """
+    __slots__ = Department.FIELDS + ('employees',)
+
+    def __init__(self, department_id=None, department_name=None, department_phone_number=None,
+                 number_of_employees=None, average_salary=None, employees=()):
+        self.department_id = department_id
+        self.department_name = department_name
+        self.department_phone_number = department_phone_number
+        self.number_of_employees = number_of_employees
+        self.average_salary = average_salary
+        self.employees = employees
+
+    def as_dict(self, fields: Union[Iterable[str], None] = None, include: Union[Iterable[str], None] = None) -> dict:
+        """
+        Method returns dictionary representation of the department equal to Department.to_dict()
+        :param fields: names of fields to represent, None to represent all fields
+        :type fields: Iterable[str] or None
+        :param include: names of related objects to embed, employees are embedded without their department,
+        None to embed employees with their department
+        :type include: Iterable[str] or None
+        :return: dictionary representation of the department
+        :rtype: dict
+        """
+        if fields is None:
+            department_dict = {
+                'department_id': self.department_id,
+                'department_name': self.department_name,
+                'department_phone_number': self.department_phone_number,
+                'number_of_employees': self.number_of_employees,
+                'average_salary': self.average_salary,
+            }
+        else:
+            department_dict = {field: getattr(self, field) for field in Department.FIELDS if field in fields}
+        if include is None:
+            department_dict['employees'] = tuple(employee.as_dict() for employee in self.employees)
+        elif 'employees' in include:
+            department_dict['employees'] = tuple(employee.as_dict(include=()) for employee in self.employees)
+        return department_dict
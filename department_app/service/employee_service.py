@@ -3,68 +3,420 @@ Module containing functions to work with the Employee model
 """
 
 # pylint: disable=no-member
-from typing import Union
+import uuid
+from typing import Union, Callable, Tuple, Iterator, Iterable, NamedTuple
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, tuple_, select, insert, update, delete, func, literal, case, null, cast, distinct, \
+    Text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import joinedload, load_only
 
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag, employee_tag
 from department_app.database import db
-from department_app.models import Employee
+from department_app.service.version_service import commit_changes, with_data_versions
+from department_app.models import Department, Employee
+from department_app.service.dto import EmployeeDTO
 
 
-def get_all_employees() -> list:
+class EmployeesFilter(NamedTuple):
     """
-    Function returns list of all employees
+    Conditions of Employees selected by employees_dtos_query, None for conditions that are not specified
+    """
+    department_id: Union[UUID, None] = None
+    start_date: Union[date, None] = None
+    end_date: Union[date, None] = None
+    department_ids: Union[Iterable[UUID], None] = None
+    employee_id: Union[UUID, None] = None
+
+
+def get_all_employees(loader: Union[Callable, None] = None,
+                      limit: Union[int, None] = None,
+                      after: Union[Tuple[str, UUID], None] = None) -> list:
+    """
+    Function returns list of all employees ordered by name and id
+    :param loader: loader option used to load departments of employees (e.g. joinedload or selectinload),
+    None to load them lazily
+    :type loader: Callable or None
+    :param limit: maximum number of employees to return, None to return all
+    :type limit: int or None
+    :param after: (employee_name, employee_id) of the employee after which employees are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
     :return: list of all employees
     :rtype: list
     """
-    employees = Employee.query.all()
-    return employees
+    return get_employees_with_filter(loader=loader, limit=limit, after=after)
 
 
-def get_employee_by_id(employee_id: UUID) -> Union[Employee, bool]:
+def get_employee_by_id(employee_id: UUID, loader: Union[Callable, None] = None) -> Union[Employee, bool]:
     """
     Function returns Employee with specified id
     :param employee_id: id of an employee
     :type employee_id: UUID
+    :param loader: loader option used to load department of the employee (e.g. joinedload or selectinload),
+    None to load it lazily
+    :type loader: Callable or None
     :return: Employee if employee exists else False
     :rtype: Employee or bool
     """
-    employee = db.session.get(Employee, employee_id)
+    options = (loader(Employee.department),) if loader is not None else ()
+    employee = db.session.get(Employee, employee_id, options=options)
     if not employee:
         return False
     return employee
 
 
+def department_tag_expression(department_id):
+    """
+    Function returns SQL expression of cache tag of a department, NULL if department id is NULL
+    :param department_id: SQL expression of department id
+    :return: SQL expression of the tag
+    """
+    return literal(department_tag('')) + cast(department_id, Text)
+
+
+def employee_department_tag(employee_id: UUID):
+    """
+    Function returns SQL expression of cache tag of department of Employee with specified id,
+    NULL if the employee does not exist or has no department
+    :param employee_id: id of an employee
+    :type employee_id: UUID
+    :return: scalar subquery returning the tag
+    """
+    return select(department_tag_expression(Employee.department_id)) \
+        .where(Employee.employee_id == employee_id) \
+        .scalar_subquery()
+
+
+def _employees_filters(department_id: Union[UUID, None],
+                       start_date: Union[date, None],
+                       end_date: Union[date, None]) -> tuple:
+    """
+    Function returns filter conditions for Employees, True for conditions that are not specified
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :return: tuple of filter conditions
+    :rtype: tuple
+    """
+    department_filter = (Employee.department_id == department_id) if department_id is not None else True
+    start_date_filter = (Employee.birthdate >= start_date) if start_date is not None else True
+    end_date_filter = (Employee.birthdate <= end_date) if end_date is not None else True
+    return department_filter, start_date_filter, end_date_filter
+
+
 def get_employees_with_filter(department_id: Union[UUID, None] = None,
                               start_date: Union[date, None] = None,
-                              end_date: Union[date, None] = None) -> list:
+                              end_date: Union[date, None] = None,
+                              loader: Union[Callable, None] = None,
+                              limit: Union[int, None] = None,
+                              after: Union[Tuple[str, UUID], None] = None,
+                              fields: Union[Iterable[str], None] = None) -> list:
     """
-    Function returns Employees that are satisfying conditions
+    Function returns Employees that are satisfying conditions ordered by name and id
     :param department_id: employees department id condition, None if not specified
     :type department_id: UUID or None
     :param start_date: start date condition, None if not specified
     :type start_date: date or None
     :param end_date: end date condition, None if not specified
     :type end_date: date or None
+    :param loader: loader option used to load departments of employees (e.g. joinedload or selectinload),
+    None to load them lazily
+    :type loader: Callable or None
+    :param limit: maximum number of employees to return, None to return all
+    :type limit: int or None
+    :param after: (employee_name, employee_id) of the employee after which employees are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of Employee fields to load, None to load all fields
+    :type fields: Iterable[str] or None
     :return: list of employees that are satisfying conditions
     :rtype: list
     """
-    department_filter = (Employee.department_id == department_id) if department_id is not None else True
-    start_date_filter = (Employee.birthdate >= start_date) if start_date is not None else True
-    end_date_filter = (Employee.birthdate <= end_date) if end_date is not None else True
+    after_filter = (tuple_(Employee.employee_name, Employee.employee_id) > tuple_(*after)) \
+        if after is not None else True
+
+    filters = (*_employees_filters(department_id, start_date, end_date), after_filter)
+
+    query = Employee.query.filter(and_(*filters)).order_by(Employee.employee_name, Employee.employee_id)
+    if limit is not None:
+        query = query.limit(limit)
+    if fields is not None:
+        query = query.options(load_only(Employee.employee_id, *(getattr(Employee, field) for field in fields)))
+    if loader is not None:
+        query = query.options(loader(Employee.department))
+    employees = query.all()
+
+    return employees
+
+
+def get_employees_data(department_id: Union[UUID, None] = None,
+                       start_date: Union[date, None] = None,
+                       end_date: Union[date, None] = None,
+                       limit: Union[int, None] = None,
+                       after: Union[Tuple[str, UUID], None] = None,
+                       fields: Union[Iterable[str], None] = None,
+                       include: Union[Iterable[str], None] = None) -> list:
+    """
+    Function returns dictionary representations of Employees that are satisfying conditions ordered by name and id,
+    only columns of specified fields are loaded and departments are loaded only if they are embedded
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param limit: maximum number of employees to return, None to return all
+    :type limit: int or None
+    :param after: (employee_name, employee_id) of the employee after which employees are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed department
+    :type include: Iterable[str] or None
+    :return: list of dictionary representations of employees that are satisfying conditions
+    :rtype: list
+    """
+    employees = get_employees_dtos(department_id, start_date, end_date, limit, after, fields,
+                                   include_department=include is None or 'department' in include)
+    return [employee.as_dict(fields, include) for employee in employees]
+
+
+def get_employees_dtos(department_id: Union[UUID, None] = None,
+                       start_date: Union[date, None] = None,
+                       end_date: Union[date, None] = None,
+                       limit: Union[int, None] = None,
+                       after: Union[Tuple[str, UUID], None] = None,
+                       fields: Union[Iterable[str], None] = None,
+                       include_department: bool = True,
+                       department_ids: Union[Iterable[UUID], None] = None) -> list:
+    """
+    Function returns read-only representations of Employees that are satisfying conditions,
+    Core select of only needed columns is used, so no ORM objects are created,
+    employees are ordered by name and id unless department_ids is specified
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param limit: maximum number of employees to return, None to return all
+    :type limit: int or None
+    :param after: (employee_name, employee_id) of the employee after which employees are returned,
+    None to start from the first one
+    :type after: Tuple[str, UUID] or None
+    :param fields: names of Employee fields to load, None to load all fields
+    :type fields: Iterable[str] or None
+    :param include_department: True if department of employees has to be loaded
+    :type include_department: bool
+    :param department_ids: ids of departments of employees, None if not specified
+    :type department_ids: Iterable[UUID] or None
+    :return: list of EmployeeDTO
+    :rtype: list
+    """
+    query, names = employees_dtos_query(EmployeesFilter(department_id, start_date, end_date, department_ids),
+                                        limit, after, fields, include_department)
+    return employees_dtos_from_rows(db.session.execute(query), names, include_department)
 
-    filters = (department_filter, start_date_filter, end_date_filter)
 
-    employees = Employee.query.filter(and_(*filters)).all()
+def employees_dtos_query(employees_filter: EmployeesFilter = EmployeesFilter(),
+                         limit: Union[int, None] = None,
+                         after: Union[Tuple[str, UUID], None] = None,
+                         fields: Union[Iterable[str], None] = None,
+                         include_department: bool = True) -> tuple:
+    """
+    Function returns Core select used by get_employees_dtos, other parameters are the same,
+    the query does not depend on a session, so it is shared with the async service
+    :param employees_filter: conditions of employees, employees are ordered by name and id
+    unless department_ids is specified
+    :type employees_filter: EmployeesFilter
+    :return: tuple containing the select and names of selected Employee fields
+    :rtype: tuple
+    """
+    employee_table, department_table = Employee.__table__, Department.__table__
+    department_id, start_date, end_date, department_ids, employee_id = employees_filter
+    names = tuple(field for field in Employee.FIELDS if fields is None or field in fields)
+    query = select(*(employee_table.c[name] for name in names)) \
+        .where(and_(*_employees_filters(department_id, start_date, end_date)))
+    if include_department:
+        query = query \
+            .add_columns(department_table.c.department_id, department_table.c.department_name,
+                         department_table.c.department_phone_number) \
+            .select_from(employee_table.outerjoin(department_table))
+    if employee_id is not None:
+        query = query.where(employee_table.c.employee_id == employee_id)
+    if department_ids is not None:
+        query = query.where(employee_table.c.department_id.in_(department_ids))
+    else:
+        query = query.order_by(employee_table.c.employee_name, employee_table.c.employee_id)
+    if after is not None:
+        query = query.where(tuple_(employee_table.c.employee_name, employee_table.c.employee_id) > tuple_(*after))
+    if limit is not None:
+        query = query.limit(limit)
+    return query, names
+
 
+def employees_dtos_from_rows(rows: Iterable, names: tuple, include_department: bool) -> list:
+    """
+    Function maps rows of the select returned by employees_dtos_query to EmployeeDTO
+    :param rows: rows of the select
+    :type rows: Iterable
+    :param names: names of selected Employee fields
+    :type names: tuple
+    :param include_department: True if department of employees has been selected
+    :type include_department: bool
+    :return: list of EmployeeDTO
+    :rtype: list
+    """
+    employees = []
+    number_of_fields = len(names)
+    for row in rows:
+        employee = EmployeeDTO(**dict(zip(names, row)))
+        if include_department and row[number_of_fields] is not None:
+            employee.department = {
+                'department_id': row[number_of_fields],
+                'department_name': row[number_of_fields + 1],
+                'department_phone_number': row[number_of_fields + 2],
+            }
+        employees.append(employee)
     return employees
 
 
-def create_employee(employee_name: str, position: str, salary: float, birthdate: date, department_id: UUID) -> bool:
+def employee_json_object(employee_table, fields: Union[Iterable[str], None], include_department: bool,
+                          department_table=None):
+    """
+    Function returns SQL expression that builds JSON object equal to dictionary representation of an Employee
+    :param employee_table: employee table or its alias
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include_department: True to embed department of the employee
+    :type include_department: bool
+    :param department_table: department table joined to employee table, required if department is embedded
+    :return: SQL expression
+    """
+    arguments = []
+    for field in Employee.FIELDS:
+        if fields is None or field in fields:
+            arguments += (literal(field), employee_table.c[field])
+    if include_department:
+        department_object = func.json_build_object(
+            literal('department_id'), department_table.c.department_id,
+            literal('department_name'), department_table.c.department_name,
+            literal('department_phone_number'), department_table.c.department_phone_number,
+        )
+        arguments += (literal('department'),
+                      case((department_table.c.department_id.is_(None), null()), else_=department_object))
+    return func.json_build_object(*arguments)
+
+
+def get_employees_json(department_id: Union[UUID, None] = None,
+                       start_date: Union[date, None] = None,
+                       end_date: Union[date, None] = None,
+                       fields: Union[Iterable[str], None] = None,
+                       include: Union[Iterable[str], None] = None) -> Union[str, None]:
     """
-    Function creates new Employee
+    Function returns JSON array of dictionary representations of Employees that are satisfying conditions
+    ordered by name and id, the document is built by PostgreSQL and is not decoded
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed department
+    :type include: Iterable[str] or None
+    :return: JSON document, None if the database is not PostgreSQL
+    :rtype: str or None
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return None
+    return db.session.execute(employees_json_query(department_id, start_date, end_date, fields, include)).scalar_one()
+
+
+def employees_json_query(department_id: Union[UUID, None] = None,
+                         start_date: Union[date, None] = None,
+                         end_date: Union[date, None] = None,
+                         fields: Union[Iterable[str], None] = None,
+                         include: Union[Iterable[str], None] = None):
+    """
+    Function returns PostgreSQL select used by get_employees_json, parameters are the same
+    :return: select of the JSON document
+    """
+    employee_table, department_table = Employee.__table__, Department.__table__
+    include_department = include is None or 'department' in include
+    employee_object = employee_json_object(employee_table, fields, include_department, department_table)
+    employees_array = func.json_agg(aggregate_order_by(employee_object,
+                                                       employee_table.c.employee_name, employee_table.c.employee_id))
+    query = select(cast(func.coalesce(employees_array, func.json_build_array()), Text)) \
+        .where(and_(*_employees_filters(department_id, start_date, end_date)))
+    return query.select_from(employee_table.outerjoin(department_table)) if include_department \
+        else query.select_from(employee_table)
+
+
+def iter_employees_data(department_id: Union[UUID, None] = None,
+                        start_date: Union[date, None] = None,
+                        end_date: Union[date, None] = None,
+                        batch_size: int = 1000) -> Iterator[dict]:
+    """
+    Function yields dictionary representations of Employees that are satisfying conditions,
+    rows are fetched from a server-side cursor in batches so memory usage does not depend on number of employees
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param batch_size: number of rows fetched from the database at once
+    :type batch_size: int
+    :return: iterator of dictionary representations of employees that are satisfying conditions
+    :rtype: Iterator[dict]
+    """
+    query = Employee.query \
+        .filter(and_(*_employees_filters(department_id, start_date, end_date))) \
+        .options(joinedload(Employee.department)) \
+        .execution_options(stream_results=True) \
+        .yield_per(batch_size)
+    for employee in query:
+        yield employee.to_dict()
+
+
+def get_employee_data(employee_id: UUID,
+                      fields: Union[Iterable[str], None] = None,
+                      include: Union[Iterable[str], None] = None) -> Union[dict, bool]:
+    """
+    Function returns dictionary representation of Employee with specified id,
+    only columns of specified fields are loaded and department is loaded only if it is embedded
+    :param employee_id: id of an employee
+    :type employee_id: UUID
+    :param fields: names of fields to represent, None to represent all fields
+    :type fields: Iterable[str] or None
+    :param include: names of related objects to embed, None to embed department
+    :type include: Iterable[str] or None
+    :return: dictionary representation of an employee if employee exists else False
+    :rtype: dict or bool
+    """
+    options = []
+    if fields is not None:
+        options.append(load_only(Employee.employee_id, *(getattr(Employee, field) for field in fields)))
+    if include is None or 'department' in include:
+        options.append(joinedload(Employee.department))
+    employee = db.session.get(Employee, employee_id, options=options)
+    if not employee:
+        return False
+    return employee.to_dict(fields, include)
+
+
+def create_employee(employee_name: str, position: str, salary: float, birthdate: date, department_id: UUID) -> dict:
+    """
+    Function creates new Employee using a single statement
     :param employee_name: name of an employee
     :type employee_name: str
     :param position: position of an employee
@@ -75,17 +427,17 @@ def create_employee(employee_name: str, position: str, salary: float, birthdate:
     :type birthdate: date
     :param department_id: department id of an employee
     :type department_id: UUID
-    :return: returns True
-    :rtype: bool
+    :return: dict containing id and fields of created employee
+    :rtype: dict
     """
-    employee = Employee(employee_name=employee_name,
-                        position=position,
-                        salary=salary,
-                        birthdate=birthdate,
-                        department_id=department_id)
-    db.session.add(employee)
-    db.session.commit()
-    return True
+    tags = (EMPLOYEES_TAG, DEPARTMENTS_TAG, department_tag(department_id))
+    query = insert(Employee.__table__) \
+        .values(employee_id=uuid.uuid4(), employee_name=employee_name, position=position, salary=salary,
+                birthdate=birthdate, department_id=department_id) \
+        .returning(*Employee.__table__.columns)
+    employee = dict(db.session.execute(with_data_versions(query, *tags)).mappings().one())
+    commit_changes(*tags, versions_changed=True)
+    return employee
 
 
 def update_employee(employee_id: UUID,
@@ -111,23 +463,30 @@ def update_employee(employee_id: UUID,
     :return: returns True on success else False
     :rtype: bool
     """
-    employee = db.session.get(Employee, employee_id)
-    if not employee:
-        return False
+    values = {name: value for name, value in (('employee_name', employee_name), ('position', position),
+                                               ('salary', salary), ('birthdate', birthdate),
+                                               ('department_id', department_id)) if value is not None}
+    if not values:
+        return bool(get_existing_employee_ids((employee_id,)))
 
-    if employee_name is not None:
-        employee.employee_name = employee_name
-    if position is not None:
-        employee.position = position
-    if salary is not None:
-        employee.salary = salary
-    if birthdate is not None:
-        employee.birthdate = birthdate
-    if department_id is not None:
-        employee.department_id = department_id
-
-    db.session.add(employee)
-    db.session.commit()
+    # the row is locked and read in the same statement to return department the employee is moved from
+    old_employee = select(Employee.employee_id, Employee.department_id) \
+        .where(Employee.employee_id == employee_id) \
+        .with_for_update() \
+        .subquery('old_employee')
+    query = update(Employee.__table__) \
+        .where(Employee.employee_id == old_employee.c.employee_id) \
+        .values(**values) \
+        .returning(old_employee.c.department_id)
+    tags = (EMPLOYEES_TAG, DEPARTMENTS_TAG, employee_tag(employee_id),
+            *((department_tag(department_id),) if department_id is not None else ()))
+    query = with_data_versions(query, *tags, row_tag=lambda columns: department_tag_expression(columns.department_id))
+    updated = db.session.execute(query).first()
+    if updated is None:
+        db.session.rollback()
+        return False
+    old_department_tags = (department_tag(updated.department_id),) if updated.department_id is not None else ()
+    commit_changes(*tags, *old_department_tags, versions_changed=True)
     return True
 
 
@@ -139,10 +498,215 @@ def delete_employee(employee_id: UUID) -> bool:
     :return: returns True on success else False
     :rtype: bool
     """
-    employee = db.session.get(Employee, employee_id)
-    if not employee:
+    tags = (EMPLOYEES_TAG, DEPARTMENTS_TAG, employee_tag(employee_id))
+    query = delete(Employee.__table__).where(Employee.employee_id == employee_id).returning(Employee.department_id)
+    query = with_data_versions(query, *tags, row_tag=lambda columns: department_tag_expression(columns.department_id))
+    deleted = db.session.execute(query).first()
+    if deleted is None:
+        db.session.rollback()
         return False
-
-    db.session.delete(employee)
-    db.session.commit()
+    # the statement bypasses the ORM, so a loaded instance of the employee is evicted as an ORM delete would do
+    employee = db.session.identity_map.get(db.session.identity_key(Employee, employee_id))
+    if employee is not None:
+        db.session.expunge(employee)
+    commit_changes(*tags, *((department_tag(deleted.department_id),) if deleted.department_id is not None else ()),
+                   versions_changed=True)
     return True
+
+
+def get_existing_employee_ids(employee_ids: Iterable[UUID]) -> set:
+    """
+    Function returns ids of existing Employees among specified ids using a single query
+    :param employee_ids: ids of employees
+    :type employee_ids: Iterable[UUID]
+    :return: set of ids of employees that exist
+    :rtype: set
+    """
+    employee_ids = set(employee_ids)
+    if not employee_ids:
+        return set()
+    query = select(Employee.employee_id).where(Employee.employee_id.in_(employee_ids))
+    return set(db.session.execute(query).scalars())
+
+
+def create_employees(employees_data: list) -> list:
+    """
+    Function creates new Employees in a single transaction using batched inserts
+    :param employees_data: list of dicts containing employee_name, position, salary, birthdate and department_id
+    :type employees_data: list
+    :return: list of ids of created employees in the same order
+    :rtype: list
+    """
+    rows = [dict(employee_data, employee_id=uuid.uuid4()) for employee_data in employees_data]
+    if rows:
+        db.session.execute(insert(Employee.__table__), rows)
+    commit_changes(EMPLOYEES_TAG, DEPARTMENTS_TAG, *{department_tag(row['department_id']) for row in rows})
+    return [row['employee_id'] for row in rows]
+
+
+def update_employees(employees_data: list) -> list:
+    """
+    Function updates Employees in a single transaction,
+    fields that are not specified in employee data are not changed
+    :param employees_data: list of dicts containing employee_id and fields of an employee that have to be updated
+    :type employees_data: list
+    :return: list containing True for updated employees and False for employees that do not exist
+    :rtype: list
+    """
+    employee_ids = {employee_data['employee_id'] for employee_data in employees_data}
+    # departments employees are moved from are read with rows locked, so they are not changed until commit
+    query = select(Employee.employee_id, Employee.department_id) \
+        .where(Employee.employee_id.in_(employee_ids)) \
+        .with_for_update()
+    old_department_ids = dict(db.session.execute(query).all()) if employee_ids else {}
+    mappings = [employee_data for employee_data in employees_data
+                if employee_data['employee_id'] in old_department_ids and len(employee_data) > 1]
+    db.session.bulk_update_mappings(Employee, mappings)
+    department_ids = {old_department_ids[employee_data['employee_id']] for employee_data in mappings} | \
+        {employee_data['department_id'] for employee_data in mappings if 'department_id' in employee_data}
+    commit_changes(EMPLOYEES_TAG, DEPARTMENTS_TAG,
+                   *(employee_tag(employee_data['employee_id']) for employee_data in mappings),
+                   *map(department_tag, department_ids - {None}))
+    return [employee_data['employee_id'] in old_department_ids for employee_data in employees_data]
+
+
+def delete_employees(employee_ids: list) -> list:
+    """
+    Function deletes Employees with specified ids using a single statement
+    :param employee_ids: ids of employees
+    :type employee_ids: list
+    :return: list containing True for deleted employees and False for employees that do not exist
+    :rtype: list
+    """
+    deleted = {}
+    if employee_ids:
+        query = delete(Employee.__table__) \
+            .where(Employee.employee_id.in_(set(employee_ids))) \
+            .returning(Employee.employee_id, Employee.department_id)
+        deleted = dict(db.session.execute(query).all())
+    commit_changes(EMPLOYEES_TAG, DEPARTMENTS_TAG, *map(employee_tag, deleted),
+                   *map(department_tag, set(deleted.values()) - {None}))
+    return [employee_id in deleted for employee_id in employee_ids]
+
+
+def transfer_employees(department_id: UUID,
+                       from_department_id: Union[UUID, None] = None,
+                       employee_ids: Union[Iterable[UUID], None] = None) -> Tuple[list, list]:
+    """
+    Function moves all employees of a department or employees with specified ids to department with specified id
+    using a single statement, employees are not moved if any of specified ids does not exist
+    :param department_id: id of the department employees are moved to
+    :type department_id: UUID
+    :param from_department_id: id of the department employees are moved from, None if employee ids are specified
+    :type from_department_id: UUID or None
+    :param employee_ids: ids of employees, None if department employees are moved from is specified
+    :type employee_ids: Iterable[UUID] or None
+    :return: tuple containing list of ids of moved employees and list of specified ids that do not exist
+    :rtype: Tuple[list, list]
+    """
+    if employee_ids is not None:
+        employee_ids = set(employee_ids)
+        condition = Employee.employee_id.in_(employee_ids)
+    else:
+        condition = Employee.department_id == from_department_id
+    # rows are locked and read in the same statement to return departments employees are moved from
+    old_employees = select(Employee.employee_id, Employee.department_id) \
+        .where(condition) \
+        .with_for_update() \
+        .subquery('old_employees')
+    query = update(Employee.__table__) \
+        .where(Employee.employee_id == old_employees.c.employee_id) \
+        .values(department_id=department_id) \
+        .returning(old_employees.c.employee_id, old_employees.c.department_id)
+    moved_rows = db.session.execute(query).all()
+    moved_ids = [row.employee_id for row in moved_rows]
+    missing_ids = sorted(employee_ids - set(moved_ids), key=str) if employee_ids is not None else []
+    if missing_ids:
+        db.session.rollback()
+        return [], missing_ids
+    # cached employees are tagged with tag of their department, so they are invalidated with departments
+    source_department_ids = {row.department_id for row in moved_rows} - {None}
+    commit_changes(EMPLOYEES_TAG, DEPARTMENTS_TAG, department_tag(department_id),
+                   *map(department_tag, source_department_ids))
+    return moved_ids, []
+
+
+def adjust_salaries(percent: Union[float, None] = None,
+                    amount: Union[float, None] = None,
+                    department_id: Union[UUID, None] = None,
+                    position: Union[str, None] = None,
+                    start_date: Union[date, None] = None,
+                    end_date: Union[date, None] = None,
+                    dry_run: bool = False) -> dict:
+    """
+    Function changes salaries of Employees that are satisfying conditions by a percentage or an absolute amount
+    using a single statement, salaries are not changed if any of them would not be positive
+    :param percent: percentage salaries are changed by, None if amount is specified
+    :type percent: float or None
+    :param amount: amount added to salaries, None if percent is specified
+    :type amount: float or None
+    :param department_id: employees department id condition, None if not specified
+    :type department_id: UUID or None
+    :param position: employees position condition, None if not specified
+    :type position: str or None
+    :param start_date: start date condition, None if not specified
+    :type start_date: date or None
+    :param end_date: end date condition, None if not specified
+    :type end_date: date or None
+    :param dry_run: True to only compute the result using a single aggregate query
+    :type dry_run: bool
+    :return: dict containing number of matched employees and number of employees whose salary would not be
+    positive, and current and new sums of salaries of matched employees on dry run
+    :rtype: dict
+    """
+    filters = (*_employees_filters(department_id, start_date, end_date),
+               (Employee.position == position) if position is not None else True)
+    new_salary = Employee.salary * (1 + percent / 100) if percent is not None else Employee.salary + amount
+    if dry_run:
+        return _salaries_summary(filters, new_salary)
+    return _update_salaries(filters, new_salary)
+
+
+def _salaries_summary(filters: tuple, new_salary) -> dict:
+    """
+    Function computes result of adjust_salaries without changing salaries using a single aggregate query
+    :param filters: filter conditions of employees
+    :type filters: tuple
+    :param new_salary: SQL expression of new salary of an employee
+    :return: dict containing number of matched employees, number of employees whose salary would not be
+    positive, and current and new sums of salaries of matched employees
+    :rtype: dict
+    """
+    query = select(func.count(), func.count().filter(new_salary <= 0),
+                   func.coalesce(func.sum(Employee.salary), 0), func.coalesce(func.sum(new_salary), 0)) \
+        .where(and_(*filters))
+    matched, rejected, salary_total, new_salary_total = db.session.execute(query).one()
+    return {'matched': matched, 'rejected': rejected,
+            'salary_total': salary_total, 'new_salary_total': new_salary_total}
+
+
+def _update_salaries(filters: tuple, new_salary) -> dict:
+    """
+    Function sets salaries of employees using a single statement, salaries are not changed
+    if any of them would not be positive
+    :param filters: filter conditions of employees
+    :type filters: tuple
+    :param new_salary: SQL expression of new salary of an employee
+    :return: dict containing number of matched employees and number of employees whose salary would not be positive
+    :rtype: dict
+    """
+    updated = update(Employee.__table__).where(and_(*filters)).values(salary=new_salary) \
+        .returning(Employee.employee_id, Employee.salary, Employee.department_id) \
+        .cte('updated')
+    query = select(func.count(), func.count().filter(updated.c.salary <= 0),
+                   func.array_agg(distinct(cast(updated.c.department_id, Text))),
+                   func.array_agg(cast(updated.c.employee_id, Text)).filter(updated.c.department_id.is_(None)))
+    matched, rejected, department_ids, employee_ids = db.session.execute(query).one()
+    if rejected:
+        db.session.rollback()
+        return {'matched': matched, 'rejected': rejected}
+    # cached employees are tagged with tag of their department, employees without a department by their own tag
+    commit_changes(EMPLOYEES_TAG, DEPARTMENTS_TAG,
+                   *(department_tag(department_id) for department_id in department_ids or () if department_id),
+                   *map(employee_tag, employee_ids or ()))
+    return {'matched': matched, 'rejected': 0}
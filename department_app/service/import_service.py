@@ -0,0 +1,215 @@
+"""
+Module containing functions to import employees from CSV files
+
+A file is streamed into a temporary staging table with COPY, rows are validated by a single SQL query
+with the same rules as REST API employee data and valid files are merged into employee table
+in the same transaction: rows with employee_id of an existing employee update it, other rows create employees.
+Requires PostgreSQL 13 or newer.
+"""
+
+# pylint: disable=no-member
+import csv
+import re
+from typing import BinaryIO, Tuple, Union
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import text
+
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag, employee_tag
+from department_app.database import db
+from department_app.service.version_service import commit_changes
+
+IMPORT_COLUMNS = ('employee_id', 'employee_name', 'position', 'salary', 'birthdate', 'department_id')
+REQUIRED_IMPORT_COLUMNS = ('employee_name', 'position', 'salary', 'birthdate', 'department_id')
+MAX_REJECTED_ROWS = 1000
+
+# bounded repetitions are slow in PostgreSQL regular expressions, so shapes are checked by simpler patterns
+SALARY_PATTERN = r'^\s*\+?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9][0-9]?)?\s*$'
+DATE_PATTERN = '^[0-9]+-[0-9]+-[0-9]+$'
+
+
+def is_uuid_sql(column: str) -> str:
+    """
+    Returns SQL condition that is true if text column contains a UUID in canonical form
+    :param column: name of the column
+    :type column: str
+    :rtype: str
+    """
+    return (f"({column} ~ '^[0-9a-fA-F]+-[0-9a-fA-F]+-[0-9a-fA-F]+-[0-9a-fA-F]+-[0-9a-fA-F]+$' "
+            f"AND length({column}) = 36 AND substr({column}, 9, 1) || substr({column}, 14, 1) "
+            f"|| substr({column}, 19, 1) || substr({column}, 24, 1) = '----')")
+
+
+CREATE_STAGING_TABLE = text(f'''
+CREATE TEMPORARY TABLE employee_import (
+    line serial,
+    {", ".join(f"{column} text" for column in IMPORT_COLUMNS)}
+) ON COMMIT DROP
+''')
+
+# first error of every invalid row, checks are nested in CASE so that casts run only on valid text
+VALIDATE_STAGING_TABLE = text(f'''
+WITH staged AS MATERIALIZED (
+    SELECT *, CASE WHEN {is_uuid_sql('department_id')} THEN department_id::uuid END AS department_uuid
+    FROM employee_import
+)
+SELECT line + 1 AS line, count(*) OVER () AS rejected_count, error FROM (
+    SELECT staged.line, CASE
+        WHEN staged.employee_id IS NOT NULL AND NOT {is_uuid_sql('staged.employee_id')}
+            THEN 'employee_id is invalid'
+        WHEN duplicated.employee_id IS NOT NULL
+            THEN 'employee_id is duplicated'
+        WHEN staged.employee_name IS NULL OR char_length(staged.employee_name) NOT BETWEEN 2 AND 32
+            THEN 'employee_name is invalid'
+        WHEN staged.position IS NULL OR char_length(staged.position) NOT BETWEEN 2 AND 32
+            THEN 'position is invalid'
+        WHEN NOT CASE WHEN staged.salary ~ '{SALARY_PATTERN}' AND length(staged.salary) <= 30
+                THEN staged.salary::float8 > 0 ELSE false END
+            THEN 'salary is invalid'
+        WHEN NOT CASE WHEN staged.birthdate ~ '{DATE_PATTERN}' AND length(staged.birthdate) <= 10
+                       AND split_part(staged.birthdate, '-', 1)::int >= 1
+                       AND split_part(staged.birthdate, '-', 2)::int BETWEEN 1 AND 12
+                       AND split_part(staged.birthdate, '-', 3)::int >= 1
+                THEN CASE WHEN split_part(staged.birthdate, '-', 3)::int <= extract(day from
+                               make_date(split_part(staged.birthdate, '-', 1)::int,
+                                         split_part(staged.birthdate, '-', 2)::int, 1)
+                               + interval '1 month - 1 day')
+                     THEN staged.birthdate::date <= current_date ELSE false END
+                ELSE false END
+            THEN 'birthdate is invalid'
+        WHEN staged.department_uuid IS NULL
+            THEN 'department_id is invalid'
+        WHEN department.department_id IS NULL
+            THEN 'department not found'
+    END AS error
+    FROM staged
+    LEFT JOIN department ON department.department_id = staged.department_uuid
+    LEFT JOIN (
+        SELECT lower(employee_id) AS employee_id FROM employee_import
+        WHERE employee_id IS NOT NULL
+        GROUP BY lower(employee_id)
+        HAVING count(*) > 1
+    ) AS duplicated ON duplicated.employee_id = lower(staged.employee_id)
+) AS checked
+WHERE error IS NOT NULL
+ORDER BY line
+LIMIT :limit
+''')
+
+SELECT_UPDATED_EMPLOYEES = text('''
+SELECT employee.department_id FROM employee
+JOIN employee_import ON employee.employee_id = employee_import.employee_id::uuid
+''')
+
+# merged rows are aggregated by department to avoid sending every row to the application
+MERGE_STAGING_TABLE = text('''
+WITH merged AS (
+    INSERT INTO employee (employee_id, employee_name, position, salary, birthdate, department_id)
+    SELECT coalesce(employee_id::uuid, gen_random_uuid()), employee_name, position, salary::float8,
+           birthdate::date, department_id::uuid
+    FROM employee_import
+    ON CONFLICT (employee_id) DO UPDATE SET
+        employee_name = excluded.employee_name,
+        position = excluded.position,
+        salary = excluded.salary,
+        birthdate = excluded.birthdate,
+        department_id = excluded.department_id
+    RETURNING employee_id, department_id, xmax = 0 AS is_created
+)
+SELECT department_id, count(*) FILTER (WHERE is_created) AS created,
+       coalesce(array_agg(employee_id::text) FILTER (WHERE NOT is_created), '{}') AS updated_employee_ids
+FROM merged
+GROUP BY department_id
+''')
+
+
+def read_import_header(stream: BinaryIO) -> tuple:
+    """
+    Reads and validates header line of a CSV file
+    :param stream: binary stream of the file
+    :type stream: BinaryIO
+    :return: tuple containing names of columns
+    :rtype: tuple
+    """
+    header_line = stream.readline().decode('utf-8-sig')
+    columns = tuple(column.strip() for column in next(csv.reader([header_line]), []))
+    for column in columns:
+        if column not in IMPORT_COLUMNS:
+            raise ValueError(f"unknown column '{column}'")
+    if len(set(columns)) != len(columns):
+        raise ValueError('header contains duplicated columns')
+    for column in REQUIRED_IMPORT_COLUMNS:
+        if column not in columns:
+            raise ValueError(f"missing column '{column}'")
+    return columns
+
+
+def copy_import_rows(stream: BinaryIO, columns: tuple):
+    """
+    Streams rows of a CSV file that follow its header into the staging table
+    :param stream: binary stream of the file positioned after the header
+    :type stream: BinaryIO
+    :param columns: names of columns of the file
+    :type columns: tuple
+    """
+    import psycopg2  # pylint: disable=import-outside-toplevel
+    copy_statement = f'COPY employee_import ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv, ENCODING \'UTF8\')'
+    with db.session.connection().connection.cursor() as cursor:
+        try:
+            cursor.copy_expert(copy_statement, stream, size=1 << 20)
+        except psycopg2.DataError as error:
+            line = re.search(r'line (\d+)', error.diag.context or '')
+            message = error.diag.message_primary or str(error).strip()
+            raise ValueError(f'line {int(line.group(1)) + 1}: {message}' if line else message) from None
+
+
+def import_employees_csv(stream: BinaryIO) -> Tuple[Union[dict, None], Union[dict, None]]:
+    """
+    Function imports employees from CSV file with header containing employee_name, position, salary,
+    birthdate, department_id and optionally employee_id columns, rows that contain employee_id of an existing
+    employee update it, other rows create employees, nothing is imported if any row is invalid
+    :param stream: binary stream of the file
+    :type stream: BinaryIO
+    :return: tuple containing dict with numbers of created and updated employees and None,
+    or None and dict containing number of rejected rows and list of dicts with line number
+    and error message of first MAX_REJECTED_ROWS rejected rows
+    :rtype: Tuple[Union[dict, None], Union[dict, None]]
+    """
+    try:
+        columns = read_import_header(stream)
+        db.session.execute(CREATE_STAGING_TABLE)
+        copy_import_rows(stream, columns)
+        rejected_rows = db.session.execute(VALIDATE_STAGING_TABLE, {'limit': MAX_REJECTED_ROWS}).all()
+        if rejected_rows:
+            db.session.rollback()
+            return None, {'count': rejected_rows[0].rejected_count,
+                          'rows': [{'line': row.line, 'error': row.error} for row in rejected_rows]}
+        department_ids = set(db.session.execute(SELECT_UPDATED_EMPLOYEES).scalars())
+        merged_rows = db.session.execute(MERGE_STAGING_TABLE).all()
+    except Exception:
+        db.session.rollback()
+        raise
+    department_ids.update(row.department_id for row in merged_rows)
+    updated_employee_ids = [employee_id for row in merged_rows for employee_id in row.updated_employee_ids]
+    commit_changes(EMPLOYEES_TAG, DEPARTMENTS_TAG, *map(department_tag, department_ids),
+                   *map(employee_tag, updated_employee_ids))
+    return {'created': sum(row.created for row in merged_rows), 'updated': len(updated_employee_ids)}, None
+
+
+@click.command('import-employees')
+@click.argument('file', type=click.File('rb'))
+@with_appcontext
+def import_employees_command(file: BinaryIO):
+    """
+    Imports employees from CSV FILE, nothing is imported if any row is invalid.
+    """
+    try:
+        result, rejected = import_employees_csv(file)
+    except ValueError as error:
+        raise click.UsageError(str(error)) from error
+    if rejected:
+        for row in rejected['rows']:
+            click.echo(f'line {row["line"]}: {row["error"]}', err=True)
+        raise click.ClickException(f'{rejected["count"]} rows are invalid, no employees have been imported')
+    click.echo(f'Created {result["created"]} and updated {result["updated"]} employees')
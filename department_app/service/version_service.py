@@ -0,0 +1,106 @@
+"""
+Module containing functions to work with versions of departments and employees data
+
+Every cache tag (e.g. departments or department:<id>) has a version that is changed by commit_changes
+in the same transaction as the data with that tag, so a version read by a request is never newer than
+the data the request reads after it, and a change is never visible without a new version.
+Single-row writes change versions in their own statement with with_data_versions, so they take
+no extra round-trip, other writes change them with one more statement before the commit.
+"""
+
+# pylint: disable=no-member
+from typing import Callable, Iterable, Union
+
+from sqlalchemy import Text, cast, exists, func, select, text, union
+from sqlalchemy.dialects import postgresql
+
+from department_app.cache import response_cache
+from department_app.database import db
+from department_app.models import DataVersion, data_version_seq
+
+# tags are updated in sorted order, so transactions changing the same tags do not deadlock
+UPDATE_DATA_VERSIONS = text(f'''
+INSERT INTO {DataVersion.__tablename__} (tag, version)
+SELECT tag, nextval('{data_version_seq.name}') FROM unnest(CAST(:tags AS text[])) AS tag
+ON CONFLICT (tag) DO UPDATE SET version = excluded.version
+''')
+
+
+def data_version_query(tags: Iterable):
+    """
+    Function returns select of versions of specified cache tags, the query does not depend on a session,
+    so it is shared with the async service
+    :param tags: cache tags or SQL expressions returning cache tags
+    :type tags: Iterable
+    :return: select of tags and their versions
+    """
+    return select(DataVersion.tag, DataVersion.version).where(DataVersion.tag.in_(list(tags)))
+
+
+def data_version_from_rows(rows: Iterable) -> str:
+    """
+    Function returns version of data with cache tags from rows of data_version_query,
+    tags that have never been changed have no rows
+    :param rows: rows containing tags and their versions
+    :type rows: Iterable
+    :return: version of the data
+    :rtype: str
+    """
+    return ','.join(f'{tag}={version}' for tag, version in sorted(rows))
+
+
+def get_data_version(*tags) -> str:
+    """
+    Function returns version of data with specified cache tags, the version changes when any of the tags is changed
+    :param tags: cache tags or SQL expressions returning cache tags
+    :return: version of the data
+    :rtype: str
+    """
+    return data_version_from_rows(db.session.execute(data_version_query(tags)))
+
+
+def with_data_versions(statement, *tags: str, row_tag: Union[Callable, None] = None):
+    """
+    Function returns select of rows returned by INSERT, UPDATE or DELETE statement with RETURNING
+    that also changes versions of cache tags, the statement and the version changes are data-modifying CTEs
+    of the select, so they take a single round-trip, the transaction has to be committed
+    with commit_changes(..., versions_changed=True)
+    :param statement: INSERT, UPDATE or DELETE statement with RETURNING
+    :param tags: cache tags of changed data
+    :type tags: str
+    :param row_tag: function that receives columns of returned rows and returns SQL expression of a cache tag
+    of every row (NULL if the row has none), None if tags do not depend on rows
+    :type row_tag: Callable or None
+    :return: select of rows returned by the statement
+    """
+    changed = statement.cte('changed')
+    changed_tags = select(func.unnest(cast(sorted(set(tags)), postgresql.ARRAY(Text))).label('tag'))
+    if row_tag is not None:
+        tag = row_tag(changed.c)
+        changed_tags = union(changed_tags, select(tag.label('tag')).where(tag.isnot(None)))
+    changed_tags = changed_tags.subquery('changed_tags')
+    # tags are updated in sorted order, so transactions changing the same tags do not deadlock
+    versions = postgresql.insert(DataVersion).from_select(
+        ['tag', 'version'], select(changed_tags.c.tag, data_version_seq.next_value()).order_by(changed_tags.c.tag)
+    )
+    versions = versions.on_conflict_do_update(index_elements=[DataVersion.tag],
+                                              set_={'version': versions.excluded.version}) \
+        .returning(DataVersion.tag) \
+        .cte('data_versions')
+    # the versions CTE has to be referenced to be rendered, it returns a row for every tag
+    return select(changed).where(exists(select(versions.c.tag)))
+
+
+def commit_changes(*tags: str, versions_changed: bool = False):
+    """
+    Function changes versions of specified cache tags, commits current transaction with them and removes
+    cached responses that have any of the tags
+    :param tags: tags of cached responses that contain changed data
+    :type tags: str
+    :param versions_changed: True if versions have been changed by a statement from with_data_versions
+    :type versions_changed: bool
+    """
+    if tags and not versions_changed:
+        db.session.execute(UPDATE_DATA_VERSIONS, {'tags': sorted(set(tags))})
+    db.session.commit()
+    response_cache.invalidate(*tags)
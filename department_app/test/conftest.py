@@ -5,9 +5,11 @@ Module containing unit tests base class
 # pylint: disable=C0103, no-member
 import logging
 import unittest
+from contextlib import contextmanager
 from datetime import date
 
 from flask_testing import TestCase
+from sqlalchemy import event
 
 from department_app import create_app
 from department_app.database import db
@@ -22,6 +24,25 @@ logging.basicConfig(filename='test_log.log',
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def count_queries():
+    """
+    Context manager that collects SQL statements executed by the database engine inside its block
+    :return: list that is filled with executed statements
+    :rtype: list
+    """
+    statements = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
 class BaseTest(TestCase):
     """
     Base test case class
@@ -54,6 +75,7 @@ class BaseTest(TestCase):
         logger.debug("Creating app")
         app = create_app(test_config=True)
         app.config['TESTING'] = True
+        app.config['RESPONSE_CACHE_BACKEND'] = None
         return app
 
     def setUp(self):
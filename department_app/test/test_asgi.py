@@ -0,0 +1,165 @@
+"""
+Module containing class for async ASGI application testing
+"""
+
+# pylint: disable=C0103, no-member
+import asyncio
+import json
+import threading
+import unittest
+import uuid
+from urllib.parse import urlencode
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.database import db
+from department_app.models import Department, Employee
+
+try:
+    from department_app.asgi import AsyncRestAPI, ThreadPoolWsgiToAsgi
+except ImportError:  # asyncpg or asgiref is not installed
+    AsyncRestAPI = ThreadPoolWsgiToAsgi = None
+
+
+@unittest.skipIf(AsyncRestAPI is None, 'asyncpg or asgiref is not installed')
+class AsyncRestAPITest(BaseTest):
+    """
+    Class for async ASGI application tests, responses are compared with responses of the WSGI application
+    """
+    def request(self, path: str, method: str = 'GET', headers: dict = None, body: bytes = b'') -> tuple:
+        """
+        Sends request to the ASGI application
+        :return: tuple containing status code, dict of response headers and response body
+        :rtype: tuple
+        """
+        db.session.commit()
+        headers = dict(headers or {}, **({'Content-Length': str(len(body))} if body else {}))
+        path, _, query_string = path.partition('?')
+        scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': method,
+                 'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'root_path': '',
+                 'query_string': query_string.encode(), 'server': ('localhost', 80), 'client': ('127.0.0.1', 1),
+                 'headers': [(b'host', b'localhost')] + [(name.lower().encode(), value.encode())
+                                                         for name, value in headers.items()]}
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        async def run():
+            asgi_app = AsyncRestAPI(self.app.application)
+            try:
+                await asgi_app(scope, receive, send)
+            finally:
+                await asgi_app.engine.dispose()
+
+        asyncio.run(run())
+        start = messages[0]
+        response_headers = {name.decode(): value.decode() for name, value in start['headers']}
+        return start['status'], response_headers, b''.join(message.get('body', b'') for message in messages[1:])
+
+    def assert_same_response(self, path: str):
+        """
+        Checks that ASGI and WSGI applications return the same status, body, ETag and Link headers
+        """
+        status, headers, body = self.request(path)
+        response = self.app.get(path)
+        assert status == response.status_code
+        assert json.loads(body) == response.json
+        assert headers.get('etag') == response.headers.get('ETag')
+        assert headers.get('link') == response.headers.get('Link')
+        assert headers['content-type'] == 'application/json'
+
+    def test_departments_get(self):
+        logger.info("Testing ASGI application get method of departments")
+        self.assert_same_response('/api/departments')
+        self.assert_same_response('/api/departments?limit=2')
+        self.assert_same_response('/api/departments?fields=department_name,average_salary&include=')
+        self.assert_same_response('/api/departments?fields=invalid')
+
+    def test_department_get(self):
+        logger.info("Testing ASGI application get method of a department")
+        department = Department.query.filter_by(department_name='TEST_DP1').first()
+        self.assert_same_response(f'/api/departments/{department.department_id}')
+        self.assert_same_response(f'/api/departments/{department.department_id}?fields=department_name')
+        self.assert_same_response(f'/api/departments/{uuid.uuid4()}')
+
+    def test_employees_get(self):
+        logger.info("Testing ASGI application get method of employees")
+        department_id = Department.query.filter_by(department_name='TEST_DP1').first().department_id
+        self.assert_same_response('/api/employees')
+        self.assert_same_response('/api/employees?limit=2')
+        self.assert_same_response('/api/employees?' + urlencode({'department_id': department_id,
+                                                                 'start_date': '1991-01-01'}))
+        self.assert_same_response(f'/api/employees?department_id={uuid.uuid4()}')
+        self.assert_same_response('/api/employees?start_date=invalid')
+
+    def test_employee_get(self):
+        logger.info("Testing ASGI application get method of an employee")
+        employee = Employee.query.filter_by(employee_name='TEST_E1').first()
+        self.assert_same_response(f'/api/employees/{employee.employee_id}')
+        self.assert_same_response(f'/api/employees/{employee.employee_id}?fields=employee_name&include=')
+        self.assert_same_response(f'/api/employees/{uuid.uuid4()}')
+
+    def test_database_json_get(self):
+        logger.info("Testing ASGI application get methods with JSON built by the database")
+        self.app.application.config['DATABASE_JSON_RESPONSES'] = True
+        self.assert_same_response('/api/departments')
+        self.assert_same_response('/api/employees?fields=employee_name,salary')
+
+    def test_conditional_get(self):
+        logger.info("Testing ASGI application conditional get")
+        _, headers, _ = self.request('/api/departments')
+        status, headers_not_modified, body = self.request('/api/departments',
+                                                          headers={'If-None-Match': headers['etag']})
+        assert status == 304
+        assert headers_not_modified['etag'] == headers['etag']
+        assert body == b''
+
+    def test_delegated_request(self):
+        logger.info("Testing ASGI application requests passed to the WSGI application")
+        status, _, body = self.request('/api/departments', method='POST',
+                                       headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                                       body=urlencode({'department_name': 'TEST_DP4',
+                                                       'department_phone_number': '+384444444444'}).encode())
+        assert status == 201
+        assert json.loads(body)['success'] == 'department has been created'
+        assert json.loads(body)['department_name'] == 'TEST_DP4'
+        assert Department.query.filter_by(department_name='TEST_DP4').first()
+        status, _, _ = self.request('/departments/')
+        assert status == 200
+
+    def test_delegated_requests_concurrency(self):
+        logger.info("Testing ASGI application runs requests passed to the WSGI application concurrently")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wsgi_app(_environ, start_response):
+            barrier.wait()
+            start_response('200 OK', [('Content-Type', 'text/plain')])
+            return [threading.current_thread().name.encode()]
+
+        async def request():
+            messages = []
+
+            async def receive():
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+            async def send(message):
+                messages.append(message)
+
+            scope = {'type': 'http', 'http_version': '1.1', 'method': 'GET', 'path': '/', 'query_string': b'',
+                     'headers': []}
+            await ThreadPoolWsgiToAsgi(wsgi_app)(scope, receive, send)
+            return messages
+
+        async def run():
+            return await asyncio.gather(request(), request())
+
+        responses = asyncio.run(run())
+        assert [messages[0]['status'] for messages in responses] == [200, 200]
+        assert responses[0][1]['body'] != responses[1][1]['body']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+"""
+Module containing classes for response cache testing
+"""
+
+# pylint: disable=C0103, no-member
+import os
+import time
+import unittest
+import uuid
+from typing import Union
+from unittest import mock
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.cache import MemoryCacheBackend, RedisCacheBackend, response_cache, DEPARTMENTS_TAG, \
+    department_tag, employee_tag
+from department_app.database import db
+from department_app.models import Department, Employee
+from department_app.service.version_service import UPDATE_DATA_VERSIONS
+
+
+class MemoryCacheBackendTest(unittest.TestCase):
+    """
+    Class for in-process cache backend tests
+    """
+    @staticmethod
+    def test_lru_eviction():
+        logger.info("Testing MemoryCacheBackend eviction of least recently used entries")
+        backend = MemoryCacheBackend(max_size=2, ttl=60)
+        backend.set('a', 1, ('tag_a',))
+        backend.set('b', 2, ())
+        assert backend.get('a') == 1
+        backend.set('c', 3, ())
+        assert backend.get('b') is None
+        assert backend.get('a') == 1 and backend.get('c') == 3
+        assert backend.size() == 2
+
+    @staticmethod
+    def test_ttl_expiration():
+        logger.info("Testing MemoryCacheBackend expiration of entries")
+        backend = MemoryCacheBackend(max_size=2, ttl=0.01)
+        backend.set('a', 1, ())
+        time.sleep(0.02)
+        assert backend.get('a') is None
+        assert backend.size() == 0
+
+    @staticmethod
+    def test_invalidation():
+        logger.info("Testing MemoryCacheBackend invalidation by tags")
+        backend = MemoryCacheBackend(max_size=10, ttl=60)
+        backend.set('a', 1, ('tag_a', 'tag_common'))
+        backend.set('b', 2, ('tag_b', 'tag_common'))
+        backend.set('c', 3, ('tag_c',))
+        backend.invalidate(('tag_a',))
+        assert backend.get('a') is None and backend.get('b') == 2
+        backend.invalidate(('tag_common', 'tag_unknown'))
+        assert backend.get('b') is None and backend.get('c') == 3
+
+
+def redis_url() -> Union[str, None]:
+    """
+    Returns URL of redis used by tests or None if redis package is not installed or redis is not available
+    """
+    url = os.getenv('RESPONSE_CACHE_TEST_REDIS_URL', 'redis://localhost:6379/15')
+    try:
+        import redis  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    try:
+        redis.Redis.from_url(url, socket_connect_timeout=1).ping()
+    except redis.RedisError:
+        return None
+    return url
+
+
+REDIS_URL = redis_url()
+
+
+@unittest.skipIf(REDIS_URL is None, 'redis is not installed or not available')
+class RedisCacheBackendTest(unittest.TestCase):
+    """
+    Class for redis cache backend tests
+    """
+    def setUp(self):
+        self.backend = RedisCacheBackend(REDIS_URL, ttl=60, prefix=f'department_app:test:{uuid.uuid4()}:')
+
+    def tearDown(self):
+        keys = list(self.backend._redis.scan_iter(self.backend.prefix + '*'))  # pylint: disable=protected-access
+        if keys:
+            self.backend._redis.delete(*keys)  # pylint: disable=protected-access
+
+    def test_set_and_get(self):
+        logger.info("Testing RedisCacheBackend storing of entries")
+        assert self.backend.get('a') is None
+        self.backend.set('a', ({'department_id': uuid.UUID(int=1)}, 200, {}), ('tag_a',))
+        assert self.backend.get('a') == ({'department_id': uuid.UUID(int=1)}, 200, {})
+        assert self.backend.size() == 1
+        ttl = self.backend._redis.ttl(self.backend.prefix + 'a')  # pylint: disable=protected-access
+        assert 0 < ttl <= 60
+
+    def test_invalidation(self):
+        logger.info("Testing RedisCacheBackend invalidation by tags")
+        self.backend.set('a', 1, ('tag_a', 'tag_common'))
+        self.backend.set('b', 2, ('tag_b', 'tag_common'))
+        self.backend.set('c', 3, ('tag_c',))
+        self.backend.invalidate(('tag_a',))
+        assert self.backend.get('a') is None and self.backend.get('b') == 2
+        self.backend.invalidate(('tag_common', 'tag_unknown'))
+        assert self.backend.get('b') is None and self.backend.get('c') == 3
+        assert self.backend.size() == 1
+
+    def test_backends_share_entries(self):
+        logger.info("Testing RedisCacheBackend entries shared by workers")
+        other_backend = RedisCacheBackend(REDIS_URL, ttl=60, prefix=self.backend.prefix)
+        self.backend.set('a', 1, ('tag_a',))
+        assert other_backend.get('a') == 1
+        other_backend.invalidate(('tag_a',))
+        assert self.backend.get('a') is None
+
+
+class ResponseCacheTest(BaseTest):
+    """
+    Class for response cache of REST API tests
+    """
+    def create_app(self):
+        app = super().create_app()
+        app.config['RESPONSE_CACHE_BACKEND'] = 'memory'
+        return app
+
+    def test_departments_cache(self):
+        logger.info("Testing caching of departments responses")
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'MISS'
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'HIT'
+        assert len(response.get_json()) == 3
+        response = self.app.get(url_for('rest_api.departmentsapi'), query_string={'limit': 1})
+        assert response.headers['X-Cache'] == 'MISS'
+
+        response = self.app.post(url_for('rest_api.departmentsapi'), data={'department_name': 'TEST_DP4',
+                                                                           'department_phone_number': '+384444444444'})
+        assert response.status_code == 201
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert len(response.get_json()) == 4
+
+        stats = self.app.get(url_for('rest_api.cacheapi')).get_json()
+        assert stats['backend'] == 'memory'
+        assert stats['hits'] == 1
+        assert stats['misses'] == 3
+
+    def test_department_cache_invalidation(self):
+        logger.info("Testing invalidation of department responses by employees changes")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        for department_id in (department1_id, department2_id):
+            self.app.get(url_for('rest_api.departmentapi', department_id=department_id))
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+
+        self.app.put(url_for('rest_api.employeeapi', employee_id=employee1_id),
+                     data={'department_id': department2_id})
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['number_of_employees'] == 1
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department2_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['number_of_employees'] == 2
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['department_id'] == str(department2_id)
+
+        self.app.put(url_for('rest_api.departmentapi', department_id=department2_id),
+                     data={'department_name': 'TEST_DP4'})
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['department']['department_name'] == 'TEST_DP4'
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        assert response.headers['X-Cache'] == 'HIT'
+
+    def test_employee_changes_invalidate_departments(self):
+        logger.info("Testing invalidation of departments employees are moved from and deleted from")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        department3_id = Department.query.filter_by(department_name='TEST_DP3').one().department_id
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        employee2_id = Employee.query.filter_by(employee_name='TEST_E2').one().employee_id
+        with mock.patch.object(response_cache, 'invalidate') as invalidate:
+            self.app.put(url_for('rest_api.employeeapi', employee_id=employee1_id),
+                         data={'department_id': department2_id})
+            assert {department_tag(department1_id), department_tag(department2_id)} <= set(invalidate.call_args.args)
+
+            self.app.put(url_for('rest_api.employeeapi', employee_id=employee1_id), data={'salary': 1000})
+            assert department_tag(department2_id) in invalidate.call_args.args
+
+            self.app.post(url_for('rest_api.departmenttransferapi', department_id=department3_id),
+                          json={'employee_ids': [str(employee1_id), str(employee2_id)]})
+            assert {department_tag(department1_id), department_tag(department2_id),
+                    department_tag(department3_id)} <= set(invalidate.call_args.args)
+
+            self.app.delete(url_for('rest_api.employeeapi', employee_id=employee1_id))
+            assert department_tag(department3_id) in invalidate.call_args.args
+
+    def test_cache_uses_data_version(self):
+        logger.info("Testing that cached responses are not used after changes made by other workers")
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        self.app.get(url_for('rest_api.departmentsapi'))
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'HIT'
+
+        db.session.execute(UPDATE_DATA_VERSIONS, {'tags': [employee_tag(employee1_id)]})
+        db.session.commit()
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'HIT'
+
+        db.session.execute(UPDATE_DATA_VERSIONS, {'tags': [DEPARTMENTS_TAG]})
+        db.session.commit()
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'MISS'
+
+    def test_error_responses_are_not_cached(self):
+        logger.info("Testing that error responses are not cached")
+        for _ in range(2):
+            response = self.app.get(url_for('rest_api.employeesapi'), query_string={'department_id': 'abc'})
+            assert response.status_code == 400
+            assert response.headers['X-Cache'] == 'MISS'
@@ -8,7 +8,7 @@ import uuid
 from flask import url_for
 
 from department_app.test.conftest import BaseTest, logger
-from department_app.models import Department
+from department_app.models import Department, Employee
 
 
 class DepartmentAPITest(BaseTest):
@@ -29,6 +29,49 @@ class DepartmentAPITest(BaseTest):
         assert response.status_code == 404
         assert not department_json
 
+    def test_departmentapi_get_conditional(self):
+        logger.info("Testing DepartmentAPI get method conditional requests")
+        department_ids = {department.department_name: department.department_id
+                          for department in Department.query.all()}
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        urls = {name: url_for('rest_api.departmentapi', department_id=department_id)
+                for name, department_id in department_ids.items()}
+        etags = {name: self.app.get(url).headers['ETag'] for name, url in urls.items()}
+
+        self.app.put(url_for('rest_api.employeeapi', employee_id=employee1_id), data={'salary': 1000})
+        response = self.app.get(urls['TEST_DP1'], headers={'If-None-Match': etags['TEST_DP1']})
+        assert response.status_code == 200
+        assert response.get_json()['average_salary'] == (1000 + 222) / 2
+        for name in ('TEST_DP2', 'TEST_DP3'):
+            response = self.app.get(urls[name], headers={'If-None-Match': etags[name]})
+            assert response.status_code == 304
+
+        self.app.put(url_for('rest_api.employeeapi', employee_id=uuid.uuid4()), data={'salary': 1000})
+        response = self.app.get(urls['TEST_DP2'], headers={'If-None-Match': etags['TEST_DP2']})
+        assert response.status_code == 304
+
+        self.app.put(url_for('rest_api.employeeapi', employee_id=employee1_id),
+                     data={'department_id': department_ids['TEST_DP2']})
+        for name in ('TEST_DP1', 'TEST_DP2'):
+            response = self.app.get(urls[name], headers={'If-None-Match': etags[name]})
+            assert response.status_code == 200
+        response = self.app.get(urls['TEST_DP3'], headers={'If-None-Match': etags['TEST_DP3']})
+        assert response.status_code == 304
+
+    def test_departmentapi_get_fields(self):
+        logger.info("Testing DepartmentAPI get method with selected fields")
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department1.department_id),
+                                query_string={'fields': 'department_name,number_of_employees', 'include': ''})
+        assert response.status_code == 200
+        assert response.get_json() == {'department_name': 'TEST_DP1',
+                                       'number_of_employees': department1.number_of_employees}
+
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department1.department_id),
+                                query_string={'fields': 'department_phone_number,salary'})
+        assert response.status_code == 400
+
     def test_departmentapi_put(self):
         logger.info("Testing DepartmentAPI put method")
         while True:
@@ -0,0 +1,104 @@
+"""
+Module containing class for DepartmentTransferAPI resource testing
+"""
+
+# pylint: disable=C0103, no-member
+import uuid
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.models import Department, Employee
+
+
+class DepartmentTransferAPITest(BaseTest):
+    """
+    Class for department transfer api tests
+    """
+    def create_app(self):
+        app = super().create_app()
+        app.config['RESPONSE_CACHE_BACKEND'] = 'memory'
+        app.config['SQL_INSTRUMENTATION_HEADERS'] = True
+        return app
+
+    def test_departmenttransferapi_post_from_department(self):
+        logger.info("Testing DepartmentTransferAPI post method with source department")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department3_id = Department.query.filter_by(department_name='TEST_DP3').one().department_id
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        for url in (url_for('rest_api.departmentapi', department_id=department1_id),
+                    url_for('rest_api.departmentapi', department_id=department3_id),
+                    url_for('rest_api.departmentsapi'),
+                    url_for('rest_api.employeeapi', employee_id=employee1_id)):
+            self.app.get(url)
+
+        response = self.app.post(url_for('rest_api.departmenttransferapi', department_id=department3_id),
+                                 json={'from_department_id': str(department1_id)})
+        assert response.status_code == 200
+        assert response.get_json() == {'success': 'employees have been transferred', 'transferred': 2}
+        assert int(response.headers['X-Query-Count']) <= 3
+        assert Employee.query.filter_by(department_id=department3_id).count() == 2
+        assert Employee.query.filter_by(department_id=department1_id).count() == 0
+
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['number_of_employees'] == 0
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department3_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['number_of_employees'] == 2
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.headers['X-Cache'] == 'MISS'
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['department_id'] == str(department3_id)
+
+    def test_departmenttransferapi_post_employee_ids(self):
+        logger.info("Testing DepartmentTransferAPI post method with employee ids")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        employee3_id = Employee.query.filter_by(employee_name='TEST_E3').one().employee_id
+        self.app.get(url_for('rest_api.departmentapi', department_id=department2_id))
+        self.app.get(url_for('rest_api.employeeapi', employee_id=employee3_id))
+        url = url_for('rest_api.departmenttransferapi', department_id=department1_id)
+
+        nonexistent_employee_id = uuid.uuid4()
+        response = self.app.post(url, json={'employee_ids': [str(employee3_id), str(nonexistent_employee_id)]})
+        assert response.status_code == 404
+        assert response.get_json() == {'error': 'employees not found', 'employee_ids': [str(nonexistent_employee_id)]}
+        assert Employee.query.get(employee3_id).department_id == department2_id
+
+        response = self.app.post(url, json={'employee_ids': [str(employee1_id), str(employee3_id)]})
+        assert response.status_code == 200
+        assert response.get_json()['transferred'] == 2
+        assert Employee.query.filter_by(department_id=department1_id).count() == 3
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department2_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['number_of_employees'] == 0
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee3_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert response.get_json()['department_id'] == str(department1_id)
+
+    def test_departmenttransferapi_post_invalid(self):
+        logger.info("Testing DepartmentTransferAPI post method with invalid requests")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        url = url_for('rest_api.departmenttransferapi', department_id=department2_id)
+        for data, status_code in (
+                (None, 400),
+                ([str(department1_id)], 400),
+                ({}, 400),
+                ({'from_department_id': str(department1_id), 'employee_ids': []}, 400),
+                ({'from_department_id': 'abc'}, 400),
+                ({'employee_ids': 'abc'}, 400),
+                ({'employee_ids': ['abc']}, 400),
+                ({'from_department_id': str(uuid.uuid4())}, 404),
+        ):
+            response = self.app.post(url, json=data)
+            assert response.status_code == status_code, data
+            assert 'error' in response.get_json()
+
+        response = self.app.post(url_for('rest_api.departmenttransferapi', department_id=uuid.uuid4()),
+                                 json={'from_department_id': str(department1_id)})
+        assert response.status_code == 404
+        assert Employee.query.filter_by(department_id=department1_id).count() == 2
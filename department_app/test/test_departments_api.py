@@ -3,10 +3,13 @@ Module containing class for DepartmentsAPI resource testing
 """
 
 # pylint: disable=C0103, no-member
+from datetime import date
+
 from flask import url_for
 
-from department_app.test.conftest import BaseTest, logger
-from department_app.models import Department
+from department_app.test.conftest import BaseTest, logger, count_queries
+from department_app.database import db
+from department_app.models import Department, Employee
 
 
 class DepartmentsAPITest(BaseTest):
@@ -20,6 +23,104 @@ class DepartmentsAPITest(BaseTest):
         assert response.status_code == 200
         assert len(departments_json) == 3
 
+    def test_departmentsapi_get_pagination(self):
+        logger.info("Testing DepartmentsAPI get method pagination")
+        departments_names = []
+        url = url_for('rest_api.departmentsapi', limit=2)
+        while url:
+            response = self.app.get(url)
+            assert response.status_code == 200
+            departments_json = response.get_json()
+            assert len(departments_json) <= 2
+            departments_names.extend(department['department_name'] for department in departments_json)
+            url = response.headers['Link'][1:response.headers['Link'].index('>')] if 'Link' in response.headers \
+                else None
+        assert departments_names == ['TEST_DP1', 'TEST_DP2', 'TEST_DP3']
+
+        for query_string in ({'limit': -1}, {'after': 'W10'}):
+            response = self.app.get(url_for('rest_api.departmentsapi'), query_string=query_string)
+            message = response.get_json()
+            assert response.status_code == 400
+            assert 'error' in message
+
+    def test_departmentsapi_get_fields(self):
+        logger.info("Testing DepartmentsAPI get method with selected fields")
+        response = self.app.get(url_for('rest_api.departmentsapi'),
+                                query_string={'fields': 'department_name,average_salary', 'include': ''})
+        assert response.status_code == 200
+        assert [set(department) for department in response.get_json()] == [{'department_name', 'average_salary'}] * 3
+
+        departments_names = []
+        url = url_for('rest_api.departmentsapi', limit=2, fields='average_salary')
+        while url:
+            response = self.app.get(url)
+            departments_json = response.get_json()
+            assert all(set(department) == {'average_salary', 'employees'} for department in departments_json)
+            departments_names.extend(department['average_salary'] for department in departments_json)
+            url = response.headers['Link'][1:response.headers['Link'].index('>')] if 'Link' in response.headers \
+                else None
+        assert len(departments_names) == 3
+
+        for query_string in ({'fields': 'employees'}, {'fields': ''}, {'include': 'department'}):
+            response = self.app.get(url_for('rest_api.departmentsapi'), query_string=query_string)
+            assert response.status_code == 400
+            assert 'error' in response.get_json()
+
+    def test_departmentsapi_get_database_json(self):
+        logger.info("Testing DepartmentsAPI get method with JSON built by the database")
+        expected_json = self.app.get(url_for('rest_api.departmentsapi')).get_json()
+        self.app.application.config['DATABASE_JSON_RESPONSES'] = True
+        db.session.commit()
+        with count_queries() as statements:
+            response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == expected_json
+        assert any('json_agg' in statement for statement in statements)
+
+        response = self.app.get(url_for('rest_api.departmentsapi'), query_string={'limit': 2})
+        assert response.get_json() == expected_json[:2]
+        assert 'Link' in response.headers
+
+    def test_departmentsapi_get_query_count(self):
+        logger.info("Testing number of queries run by DepartmentsAPI get method")
+        numbers_of_queries = []
+        for _ in range(2):
+            for department in Department.query.all():
+                db.session.add_all(Employee(employee_name=f'TEST_E{index}', position='Test Subject', salary=100,
+                                            birthdate=date(1990, 1, 1), department_id=department.department_id)
+                                   for index in range(5))
+            db.session.commit()
+            db.session.expunge_all()
+
+            with count_queries() as statements:
+                response = self.app.get(url_for('rest_api.departmentsapi'))
+            assert response.status_code == 200
+            numbers_of_queries.append(len(statements))
+        assert numbers_of_queries[0] == numbers_of_queries[1] <= 3  # one query reads version of the data for ETag
+
+    def test_departmentsapi_get_conditional(self):
+        logger.info("Testing DepartmentsAPI get method conditional requests")
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        etag = response.headers['ETag']
+        assert response.status_code == 200
+        assert response.headers['ETag'] != self.app.get(url_for('rest_api.departmentsapi', limit=1)).headers['ETag']
+        db.session.commit()
+
+        with count_queries() as statements:
+            response = self.app.get(url_for('rest_api.departmentsapi'), headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert not response.data
+        assert len(statements) == 1
+
+        self.app.post(url_for('rest_api.departmentsapi'), data={'department_name': 'TEST_DP4',
+                                                                'department_phone_number': '+384444444444'})
+        response = self.app.get(url_for('rest_api.departmentsapi'), headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert len(response.get_json()) == 4
+
     def test_departmentsapi_post(self):
         logger.info("Testing DepartmentsAPI post method")
         response = self.app.post(url_for('rest_api.departmentsapi'), data={'department_name': 'TEST_DP4',
@@ -29,6 +130,12 @@ class DepartmentsAPITest(BaseTest):
         assert 'success' in message
         filtered_departments = Department.query.filter_by(department_name='TEST_DP4').all()
         assert len(filtered_departments) == 1
+        assert message['department_id'] == str(filtered_departments[0].department_id)
+        assert message['department_name'] == 'TEST_DP4'
+        assert message['department_phone_number'] == '+384444444444'
+        assert response.headers['Location'].endswith(url_for('rest_api.departmentapi',
+                                                             department_id=filtered_departments[0].department_id))
+        assert self.app.get(response.headers['Location']).get_json()['department_name'] == 'TEST_DP4'
 
         response = self.app.post(url_for('rest_api.departmentsapi'))
         message = response.get_json()
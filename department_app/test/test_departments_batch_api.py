@@ -0,0 +1,66 @@
+"""
+Module containing class for DepartmentsBatchAPI resource testing
+"""
+
+# pylint: disable=C0103, no-member
+import uuid
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.models import Department, Employee
+
+
+class DepartmentsBatchAPITest(BaseTest):
+    """
+    Class for departments batch api tests
+    """
+    def test_departmentsbatchapi_post(self):
+        logger.info("Testing DepartmentsBatchAPI post method")
+        departments_data = [{'department_name': f'TEST_DP{index}', 'department_phone_number': '+384444444444'}
+                            for index in range(4, 8)]
+        response = self.app.post(url_for('rest_api.departmentsbatchapi'), json=departments_data)
+        results = response.get_json()
+        assert response.status_code == 201
+        assert all('success' in result for result in results)
+        department4 = Department.query.get(uuid.UUID(results[0]['department_id']))
+        assert department4.department_name == 'TEST_DP4'
+        assert Department.query.count() == 7
+
+        response = self.app.post(url_for('rest_api.departmentsbatchapi'),
+                                 json=[departments_data[0], {'department_name': 'TEST_DP8'}])
+        message = response.get_json()
+        assert response.status_code == 400
+        assert message['items'] == [{'index': 1, 'error': "missing parameter 'department_phone_number'"}]
+        assert Department.query.count() == 7
+
+    def test_departmentsbatchapi_put(self):
+        logger.info("Testing DepartmentsBatchAPI put method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        response = self.app.put(url_for('rest_api.departmentsbatchapi'),
+                                json=[{'department_id': str(department1_id), 'department_name': 'TEST_DP4'},
+                                      {'department_id': str(uuid.uuid4()), 'department_name': 'TEST_DP5'}])
+        results = response.get_json()
+        assert response.status_code == 200
+        assert 'success' in results[0]
+        assert results[1] == {'error': 'Not Found'}
+        assert Department.query.get(department1_id).department_name == 'TEST_DP4'
+
+        response = self.app.put(url_for('rest_api.departmentsbatchapi'),
+                                json=[{'department_id': str(department1_id), 'department_name': ''}])
+        assert response.status_code == 400
+
+    def test_departmentsbatchapi_delete(self):
+        logger.info("Testing DepartmentsBatchAPI delete method")
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        department3 = Department.query.filter_by(department_name='TEST_DP3').one()
+        response = self.app.delete(url_for('rest_api.departmentsbatchapi'),
+                                   json=[str(department1.department_id), str(department3.department_id),
+                                         str(uuid.uuid4())])
+        results = response.get_json()
+        assert response.status_code == 200
+        assert 'success' in results[0] and 'success' in results[1]
+        assert results[2] == {'error': 'Not Found'}
+        assert [department.department_name for department in Department.query.all()] == ['TEST_DP2']
+        assert Employee.query.count() == 3
+        assert Employee.query.filter_by(department_id=None).count() == 2
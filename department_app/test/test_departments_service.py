@@ -3,12 +3,23 @@ Module containing class for Department model testing
 """
 
 # pylint: disable=C0103, no-member
+import json
+import os
+import unittest
 import uuid
+from unittest import mock
 
-from department_app.test.conftest import BaseTest, logger
-from department_app.models import Department
+from flask import url_for
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+
+from department_app.test.conftest import BaseTest, logger, count_queries
+from department_app.database import db
+from department_app.models import Department, Employee, department_on_delete
 from department_app.service import get_all_departments, get_department_by_id, create_department, update_department, \
-    delete_department
+    delete_department, get_departments_data, get_department_data, create_departments, update_departments, \
+    delete_departments, get_existing_department_ids, get_departments_json, department_statistics
+from department_app.rest.representation import dumps
 
 
 class DepartmentsServiceTest(BaseTest):
@@ -23,6 +34,44 @@ class DepartmentsServiceTest(BaseTest):
         assert isinstance(all_departments, list)
         assert all_departments == all_departments_from_query
 
+        departments_page = get_all_departments(limit=2)
+        assert [department.department_name for department in departments_page] == ['TEST_DP1', 'TEST_DP2']
+        after = (departments_page[-1].department_name, departments_page[-1].department_id)
+        departments_page = get_all_departments(limit=2, after=after)
+        assert [department.department_name for department in departments_page] == ['TEST_DP3']
+
+    @staticmethod
+    def test_department_statistics():
+        logger.info("Testing department_statistics method")
+        statistics, number_of_employees, average_salary = department_statistics()
+        query = select(Department.department_name, number_of_employees, average_salary) \
+            .select_from(Department.__table__.outerjoin(statistics,
+                                                        statistics.c.department_id == Department.department_id))
+        assert {name: (count, average) for name, count, average in db.session.execute(query)} == {
+            'TEST_DP1': (2, (111 + 222) / 2), 'TEST_DP2': (1, 333), 'TEST_DP3': (0, 0)
+        }
+        query = query.with_only_columns(Department.department_name).where(number_of_employees == 2)
+        assert db.session.execute(query).scalars().all() == ['TEST_DP1']
+
+    @staticmethod
+    def test_get_all_departments_statistics():
+        logger.info("Testing employees statistics computed by get_all_departments method")
+        db.session.expunge_all()
+        with count_queries() as statements:
+            all_departments = get_all_departments()
+            statistics = {department.department_name: (department.number_of_employees, department.average_salary)
+                          for department in all_departments}
+        assert len(statements) == 1
+        assert statistics['TEST_DP1'] == (2, (111 + 222) / 2)
+        assert statistics['TEST_DP2'] == (1, 333)
+        assert statistics['TEST_DP3'] == (0, 0)
+
+        for loader in (joinedload, selectinload):
+            db.session.expunge_all()
+            departments_dicts = [department.to_dict() for department in get_all_departments(loader)]
+            assert [department['number_of_employees'] for department in departments_dicts] == [2, 1, 0]
+            assert [len(department['employees']) for department in departments_dicts] == [2, 1, 0]
+
     @staticmethod
     def test_get_department_by_id():
         logger.info("Testing get_department_by_id method")
@@ -36,6 +85,52 @@ class DepartmentsServiceTest(BaseTest):
                 break
         assert not get_department_by_id(nonexistent_department_id)
 
+    @staticmethod
+    def test_get_departments_data():
+        logger.info("Testing get_departments_data method")
+        departments_data = get_departments_data()
+        assert isinstance(departments_data, list)
+        assert departments_data == [department.to_dict() for department in Department.query.all()]
+
+    @staticmethod
+    def test_get_departments_data_fields():
+        logger.info("Testing get_departments_data method with selected fields")
+        with count_queries() as statements:
+            departments_data = get_departments_data(fields=('department_name', 'number_of_employees'), include=())
+        assert departments_data == [{'department_name': department.department_name,
+                                     'number_of_employees': department.number_of_employees}
+                                    for department in Department.query.all()]
+        assert len(statements) == 1
+        assert 'department_phone_number' not in statements[0]
+
+        with count_queries() as statements:
+            departments_data = get_departments_data(fields=('department_name',), include=('employees',))
+        assert all(set(department) == {'department_name', 'employees'} for department in departments_data)
+        assert all('department' not in employee for department in departments_data
+                   for employee in department['employees'])
+        assert len(statements) == 2
+        assert 'JOIN' not in statements[0].upper()
+
+    @staticmethod
+    def test_get_departments_json():
+        logger.info("Testing get_departments_json method")
+        departments = Department.query.order_by(Department.department_name).all()
+        for fields, include in ((None, None), (None, ('employees',)), (('average_salary',), ())):
+            assert json.loads(get_departments_json(fields=fields, include=include)) == \
+                json.loads(dumps([department.to_dict(fields, include) for department in departments]))
+
+    @staticmethod
+    def test_get_department_data():
+        logger.info("Testing get_department_data method")
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        assert get_department_data(department1.department_id) == department1.to_dict()
+
+        while True:
+            nonexistent_department_id = uuid.uuid4()
+            if all(nonexistent_department_id != department.department_id for department in Department.query.all()):
+                break
+        assert not get_department_data(nonexistent_department_id)
+
     @staticmethod
     def test_create_department():
         logger.info("Testing create_department method")
@@ -83,3 +178,98 @@ class DepartmentsServiceTest(BaseTest):
                 break
         assert not delete_department(nonexistent_department_id)
 
+    @staticmethod
+    def test_create_departments():
+        logger.info("Testing create_departments method")
+        department_ids = create_departments([{'department_name': f'TEST_DP{index}',
+                                              'department_phone_number': '+389999999999'} for index in range(4, 6)])
+        assert [Department.query.get(department_id).department_name for department_id in department_ids] == \
+            ['TEST_DP4', 'TEST_DP5']
+
+    @staticmethod
+    def test_update_departments():
+        logger.info("Testing update_departments method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        results = update_departments([{'department_id': department1_id, 'department_name': 'TEST_DP4'},
+                                      {'department_id': uuid.uuid4(), 'department_name': 'TEST_DP5'}])
+        assert results == [True, False]
+        assert Department.query.get(department1_id).department_name == 'TEST_DP4'
+
+    @staticmethod
+    def test_delete_departments():
+        logger.info("Testing delete_departments method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        nonexistent_department_id = uuid.uuid4()
+        assert get_existing_department_ids([department1_id, nonexistent_department_id]) == {department1_id}
+        assert delete_departments([department1_id, nonexistent_department_id]) == [True, False]
+        assert not Department.query.get(department1_id)
+        assert Employee.query.filter_by(department_id=None).count() == 2
+
+
+class DepartmentOnDeleteTest(unittest.TestCase):
+    """
+    Class for ON DELETE policy config tests
+    """
+    def test_department_on_delete(self):
+        logger.info("Testing ON DELETE policy config")
+        assert department_on_delete({}) == 'SET NULL'
+        assert department_on_delete({'DEPARTMENT_ON_DELETE': 'cascade'}) == 'CASCADE'
+        assert department_on_delete({'DEPARTMENT_ON_DELETE': 'set_null'}) == 'SET NULL'
+        with self.assertRaises(ValueError):
+            department_on_delete({'DEPARTMENT_ON_DELETE': 'NO ACTION; DROP TABLE employee'})
+
+
+class DepartmentOnDeleteCascadeTest(BaseTest):
+    """
+    Class for deleting departments with CASCADE policy tests
+    """
+    def create_app(self):
+        with mock.patch.dict(os.environ, {'DEPARTMENT_ON_DELETE': 'CASCADE'}):
+            app = super().create_app()
+        # an application with another policy in the same process does not change the policy of this one
+        with mock.patch.dict(os.environ, {'DEPARTMENT_ON_DELETE': 'RESTRICT'}):
+            super().create_app()
+        return app
+
+    @staticmethod
+    def test_delete_department():
+        logger.info("Testing delete_department method with CASCADE policy")
+        assert [foreign_key.ondelete for foreign_key in Employee.__table__.c.department_id.foreign_keys] == \
+            ['SET NULL']
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        with count_queries() as statements:
+            assert delete_department(department1_id)
+        assert len([statement for statement in statements if 'DELETE FROM department' in statement]) == 1
+        assert not any('UPDATE employee' in statement for statement in statements)
+        assert Employee.query.count() == 1
+        assert delete_departments([Department.query.filter_by(department_name='TEST_DP2').one().department_id])
+        assert Employee.query.count() == 0
+
+
+class DepartmentOnDeleteRestrictTest(BaseTest):
+    """
+    Class for deleting departments with RESTRICT policy tests
+    """
+    def create_app(self):
+        with mock.patch.dict(os.environ, {'DEPARTMENT_ON_DELETE': 'RESTRICT'}):
+            return super().create_app()
+
+    def test_delete_department(self):
+        logger.info("Testing deleting departments with RESTRICT policy")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department3_id = Department.query.filter_by(department_name='TEST_DP3').one().department_id
+        with self.assertRaises(ValueError):
+            delete_department(department1_id)
+        assert Employee.query.filter_by(department_id=department1_id).count() == 2
+
+        response = self.app.delete(url_for('rest_api.departmentapi', department_id=department1_id))
+        assert response.status_code == 409
+        assert response.get_json() == {'error': 'department has employees'}
+        response = self.app.delete(url_for('rest_api.departmentsbatchapi'),
+                                   json=[{'department_id': str(department3_id)},
+                                         {'department_id': str(department1_id)}])
+        assert response.status_code == 409
+        assert Department.query.count() == 3
+
+        assert delete_department(department3_id)
+        assert Department.query.count() == 2
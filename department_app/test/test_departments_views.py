@@ -19,3 +19,28 @@ class DepartmentsViewsTest(BaseTest):
     """
     Class for departments views tests
     """
+    def test_departments_view(self):
+        logger.info("Testing departments_view function")
+        response = self.app.get(url_for('departments.departments_view'))
+        assert response.status_code == http.HTTPStatus.OK
+        page = response.get_data(as_text=True)
+        assert all(department.department_name in page for department in get_all_departments())
+
+    def test_departments_add(self):
+        logger.info("Testing departments_add function")
+        response = self.app.get(url_for('departments.departments_add'))
+        assert response.status_code == http.HTTPStatus.OK
+
+    def test_departments_edit(self):
+        logger.info("Testing departments_edit function")
+        department1 = get_all_departments()[0]
+        response = self.app.get(url_for('departments.departments_edit', department_id=department1.department_id))
+        assert response.status_code == http.HTTPStatus.OK
+        assert department1.department_name in response.get_data(as_text=True)
+
+        while True:
+            nonexistent_department_id = uuid.uuid4()
+            if not get_department_by_id(nonexistent_department_id):
+                break
+        response = self.app.get(url_for('departments.departments_edit', department_id=nonexistent_department_id))
+        assert response.status_code == http.HTTPStatus.NOT_FOUND
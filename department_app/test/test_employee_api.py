@@ -30,6 +30,37 @@ class EmployeeAPITest(BaseTest):
         assert response.status_code == 404
         assert not department_json
 
+    def test_employeeapi_get_fields(self):
+        logger.info("Testing EmployeeAPI get method with selected fields")
+        employee1 = Employee.query.filter_by(employee_name='TEST_E1').one()
+
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1.employee_id),
+                                query_string={'fields': 'employee_name,birthdate', 'include': ''})
+        assert response.status_code == 200
+        assert response.get_json() == {'employee_name': 'TEST_E1', 'birthdate': str(employee1.birthdate)}
+
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1.employee_id),
+                                query_string={'include': 'employees'})
+        assert response.status_code == 400
+
+    def test_employeeapi_get_conditional(self):
+        logger.info("Testing EmployeeAPI get method conditional requests")
+        employee1 = Employee.query.filter_by(employee_name='TEST_E1').one()
+        employee1_id, department_id = employee1.employee_id, employee1.department_id
+
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        etag = response.headers['ETag']
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id),
+                                headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+        self.app.put(url_for('rest_api.departmentapi', department_id=department_id),
+                     data={'department_name': 'TEST_DP4'})
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id),
+                                headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['department']['department_name'] == 'TEST_DP4'
+
     def test_employeeapi_put(self):
         logger.info("Testing EmployeeAPI put method")
         employee2 = Employee.query.filter_by(employee_name='TEST_E2').one()
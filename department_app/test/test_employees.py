@@ -3,6 +3,8 @@ Module containing class for Employee model testing
 """
 
 # pylint: disable=C0103, no-member
+import subprocess
+import sys
 from uuid import UUID
 from datetime import date
 
@@ -72,3 +74,8 @@ class EmployeesTest(BaseTest):
         assert isinstance(employee1_dict, dict)
         assert all(key in employee1_dict for key in expected_dict_keys)
 
+    @staticmethod
+    def test_employee_department_attribute():
+        logger.info("Testing department attribute of Employee class before mappers are configured")
+        subprocess.run([sys.executable, '-c', 'from department_app.models import Employee; Employee.department'],
+                       check=True)
@@ -8,7 +8,8 @@ import uuid
 from flask import url_for
 from datetime import date, timedelta
 
-from department_app.test.conftest import BaseTest, logger
+from department_app.test.conftest import BaseTest, logger, count_queries
+from department_app.database import db
 from department_app.models import Department, Employee
 
 
@@ -87,6 +88,79 @@ class EmployeesAPITest(BaseTest):
         assert len(employees_json) == 1
         assert employees_json[0]['birthdate'] == str(date(1992, 2, 12))
 
+    def test_employeesapi_get_pagination(self):
+        logger.info("Testing EmployeesAPI get method pagination")
+        response = self.app.get(url_for('rest_api.employeesapi'), query_string={'limit': 2})
+        employees_json = response.get_json()
+        assert response.status_code == 200
+        assert [employee['employee_name'] for employee in employees_json] == ['TEST_E1', 'TEST_E2']
+        assert response.headers['Link'].endswith('>; rel="next"')
+
+        next_url = response.headers['Link'][1:response.headers['Link'].index('>')]
+        response = self.app.get(next_url)
+        employees_json = response.get_json()
+        assert response.status_code == 200
+        assert [employee['employee_name'] for employee in employees_json] == ['TEST_E3']
+        assert 'Link' not in response.headers
+
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        response = self.app.get(url_for('rest_api.employeesapi'),
+                                query_string={'limit': 1, 'department_id': department1.department_id})
+        assert [employee['employee_name'] for employee in response.get_json()] == ['TEST_E1']
+        next_url = response.headers['Link'][1:response.headers['Link'].index('>')]
+        response = self.app.get(next_url)
+        assert [employee['employee_name'] for employee in response.get_json()] == ['TEST_E2']
+
+        for query_string in ({'limit': 0}, {'limit': 'a'}, {'limit': 100000}, {'after': 'abc'}):
+            response = self.app.get(url_for('rest_api.employeesapi'), query_string=query_string)
+            message = response.get_json()
+            assert response.status_code == 400
+            assert 'error' in message
+
+    def test_employeesapi_get_fields(self):
+        logger.info("Testing EmployeesAPI get method with selected fields")
+        response = self.app.get(url_for('rest_api.employeesapi'),
+                                query_string={'fields': 'employee_name,salary', 'include': '', 'limit': 2})
+        assert response.status_code == 200
+        assert response.get_json() == [{'employee_name': employee.employee_name, 'salary': employee.salary}
+                                       for employee in Employee.query.order_by(Employee.employee_name).limit(2)]
+        assert 'Link' in response.headers
+
+        response = self.app.get(url_for('rest_api.employeesapi'), query_string={'fields': 'position'})
+        assert all(set(employee) == {'position', 'department'} for employee in response.get_json())
+
+        for query_string in ({'fields': 'department'}, {'include': 'employees'}):
+            response = self.app.get(url_for('rest_api.employeesapi'), query_string=query_string)
+            assert response.status_code == 400
+            assert 'error' in response.get_json()
+
+    def test_employeesapi_get_database_json(self):
+        logger.info("Testing EmployeesAPI get method with JSON built by the database")
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        query_string = {'department_id': department1.department_id, 'fields': 'employee_name,salary'}
+        expected_json = self.app.get(url_for('rest_api.employeesapi'), query_string=query_string).get_json()
+        self.app.application.config['DATABASE_JSON_RESPONSES'] = True
+        response = self.app.get(url_for('rest_api.employeesapi'), query_string=query_string)
+        assert response.status_code == 200
+        assert response.get_json() == expected_json
+
+    def test_employeesapi_get_query_count(self):
+        logger.info("Testing number of queries run by EmployeesAPI get method")
+        numbers_of_queries = []
+        for _ in range(2):
+            for department in Department.query.all():
+                db.session.add_all(Employee(employee_name=f'TEST_E{index}', position='Test Subject', salary=100,
+                                            birthdate=date(1990, 1, 1), department_id=department.department_id)
+                                   for index in range(5))
+            db.session.commit()
+            db.session.expunge_all()
+
+            with count_queries() as statements:
+                response = self.app.get(url_for('rest_api.employeesapi'))
+            assert response.status_code == 200
+            numbers_of_queries.append(len(statements))
+        assert numbers_of_queries[0] == numbers_of_queries[1] <= 2  # one query reads version of the data for ETag
+
     def test_employeesapi_post(self):
         logger.info("Testing EmployeesAPI post method")
 
@@ -101,6 +175,7 @@ class EmployeesAPITest(BaseTest):
         assert 'error' in message
 
         department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        department1_id = department1.department_id
         response = self.app.post(url_for('rest_api.employeesapi'), data={'employee_name': 'TEST_E4',
                                                                          'position': 'Test Subject 4',
                                                                          'salary': 444,
@@ -111,6 +186,13 @@ class EmployeesAPITest(BaseTest):
         assert 'success' in message
         filtered_employees = Employee.query.filter_by(employee_name='TEST_E4').all()
         assert len(filtered_employees) == 1
+        assert message['employee_id'] == str(filtered_employees[0].employee_id)
+        assert message['salary'] == 444
+        assert message['birthdate'] == '1994-04-14'
+        assert message['department_id'] == str(department1_id)
+        assert response.headers['Location'].endswith(url_for('rest_api.employeeapi',
+                                                             employee_id=filtered_employees[0].employee_id))
+        assert self.app.get(response.headers['Location']).get_json()['employee_name'] == 'TEST_E4'
 
         department1 = Department.query.filter_by(department_name='TEST_DP1').one()
         response = self.app.post(url_for('rest_api.employeesapi'), data={'employee_name': '',
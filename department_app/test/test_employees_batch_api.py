@@ -0,0 +1,94 @@
+"""
+Module containing class for EmployeesBatchAPI resource testing
+"""
+
+# pylint: disable=C0103, no-member
+import uuid
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger, count_queries
+from department_app.models import Department, Employee
+
+
+class EmployeesBatchAPITest(BaseTest):
+    """
+    Class for employees batch api tests
+    """
+    def test_employeesbatchapi_post(self):
+        logger.info("Testing EmployeesBatchAPI post method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        employees_data = [{'employee_name': f'TEST_E{index}', 'position': 'Test Subject', 'salary': 100 + index,
+                           'birthdate': '1990-01-01',
+                           'department_id': str((department1_id, department2_id)[index % 2])}
+                          for index in range(4, 14)]
+
+        with count_queries() as statements:
+            response = self.app.post(url_for('rest_api.employeesbatchapi'), json=employees_data)
+        results = response.get_json()
+        assert response.status_code == 201
+        assert len(results) == 10
+        assert all('success' in result for result in results)
+        assert len([statement for statement in statements if 'FROM department' in statement]) == 1
+        employee4 = Employee.query.get(uuid.UUID(results[0]['employee_id']))
+        assert employee4.employee_name == 'TEST_E4'
+        assert employee4.department_id == department1_id
+        assert Employee.query.count() == 13
+
+        invalid_employees_data = [employees_data[0], dict(employees_data[0], salary=-1),
+                                  dict(employees_data[0], department_id=str(uuid.uuid4())), 'abc']
+        response = self.app.post(url_for('rest_api.employeesbatchapi'), json=invalid_employees_data)
+        message = response.get_json()
+        assert response.status_code == 400
+        assert [item['index'] for item in message['items']] == [1, 2, 3]
+        assert message['items'][1]['error'] == 'department not found'
+        assert Employee.query.count() == 13
+
+        response = self.app.post(url_for('rest_api.employeesbatchapi'), json={'employee_name': 'TEST_E4'})
+        message = response.get_json()
+        assert response.status_code == 400
+        assert 'error' in message
+
+    def test_employeesbatchapi_put(self):
+        logger.info("Testing EmployeesBatchAPI put method")
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        employee2_id = Employee.query.filter_by(employee_name='TEST_E2').one().employee_id
+        department3_id = Department.query.filter_by(department_name='TEST_DP3').one().department_id
+        nonexistent_employee_id = uuid.uuid4()
+
+        response = self.app.put(url_for('rest_api.employeesbatchapi'),
+                                json=[{'employee_id': str(employee1_id), 'salary': 1000},
+                                      {'employee_id': str(employee2_id), 'department_id': str(department3_id)},
+                                      {'employee_id': str(nonexistent_employee_id), 'salary': 1000}])
+        results = response.get_json()
+        assert response.status_code == 200
+        assert 'success' in results[0] and 'success' in results[1]
+        assert results[2] == {'error': 'Not Found'}
+        assert Employee.query.get(employee1_id).salary == 1000
+        assert Employee.query.get(employee2_id).department_id == department3_id
+
+        response = self.app.put(url_for('rest_api.employeesbatchapi'),
+                                json=[{'salary': 1000}, {'employee_id': str(employee1_id), 'salary': 0}])
+        message = response.get_json()
+        assert response.status_code == 400
+        assert [item['index'] for item in message['items']] == [0, 1]
+
+    def test_employeesbatchapi_delete(self):
+        logger.info("Testing EmployeesBatchAPI delete method")
+        employee1 = Employee.query.filter_by(employee_name='TEST_E1').one()
+        employee2 = Employee.query.filter_by(employee_name='TEST_E2').one()
+
+        response = self.app.delete(url_for('rest_api.employeesbatchapi'),
+                                   json=[str(employee1.employee_id), str(employee2.employee_id),
+                                         str(uuid.uuid4())])
+        results = response.get_json()
+        assert response.status_code == 200
+        assert 'success' in results[0] and 'success' in results[1]
+        assert results[2] == {'error': 'Not Found'}
+        assert [employee.employee_name for employee in Employee.query.all()] == ['TEST_E3']
+
+        response = self.app.delete(url_for('rest_api.employeesbatchapi'), json=['abc'])
+        message = response.get_json()
+        assert response.status_code == 400
+        assert message['items'][0]['index'] == 0
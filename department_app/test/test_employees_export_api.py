@@ -0,0 +1,45 @@
+"""
+Module containing class for EmployeesExportAPI resource testing
+"""
+
+# pylint: disable=C0103, no-member
+import json
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.models import Department, Employee
+from department_app.rest.representation import dumps
+
+
+class EmployeesExportAPITest(BaseTest):
+    """
+    Class for employees export api tests
+    """
+    def test_employeesexportapi_get(self):
+        logger.info("Testing EmployeesExportAPI get method")
+        response = self.app.get(url_for('rest_api.employeesexportapi'))
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        employees_json = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        employees = Employee.query.order_by(Employee.employee_name).all()
+        assert sorted(employees_json, key=lambda employee: employee['employee_name']) == \
+            [json.loads(dumps(employee.to_dict())) for employee in employees]
+
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        response = self.app.get(url_for('rest_api.employeesexportapi'),
+                                query_string={'department_id': department1.department_id,
+                                              'start_date': '1992-01-01'})
+        employees_json = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert response.status_code == 200
+        assert [employee['employee_name'] for employee in employees_json] == ['TEST_E2']
+
+        response = self.app.get(url_for('rest_api.employeesexportapi'), query_string={'department_id': 'abc'})
+        message = response.get_json()
+        assert response.status_code == 400
+        assert 'error' in message
+
+        response = self.app.get(url_for('rest_api.employeesexportapi'), query_string={'end_date': 'abc'})
+        message = response.get_json()
+        assert response.status_code == 400
+        assert 'error' in message
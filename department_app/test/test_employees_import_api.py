@@ -0,0 +1,143 @@
+"""
+Module containing class for EmployeesImportAPI resource testing
+"""
+
+# pylint: disable=C0103, no-member
+import io
+import uuid
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.models import Department, Employee
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG
+from department_app.service import get_data_version
+
+HEADER = 'employee_name,position,salary,birthdate,department_id\n'
+
+
+class EmployeesImportAPITest(BaseTest):
+    """
+    Class for employees import api tests
+    """
+    def test_employeesimportapi_post(self):
+        logger.info("Testing EmployeesImportAPI post method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        data_version = get_data_version(DEPARTMENTS_TAG, EMPLOYEES_TAG)
+        csv_data = HEADER + ''.join(f'TEST_E{index},"Test, Subject",{100 + index},1990-01-0{index % 9 + 1},'
+                                    f'{(department1_id, department2_id)[index % 2]}\n' for index in range(4, 14))
+
+        response = self.app.post(url_for('rest_api.employeesimportapi'),
+                                 data={'file': (io.BytesIO(csv_data.encode()), 'employees.csv')})
+        assert response.status_code == 201
+        assert response.get_json() == {'success': 'employees have been imported', 'created': 10, 'updated': 0}
+        assert Employee.query.count() == 13
+        employee4 = Employee.query.filter_by(employee_name='TEST_E4').one()
+        assert employee4.position == 'Test, Subject'
+        assert employee4.salary == 104
+        assert employee4.department_id == department1_id
+        assert get_data_version(DEPARTMENTS_TAG, EMPLOYEES_TAG) != data_version
+
+        response = self.app.post(url_for('rest_api.employeesimportapi'), data=csv_data,
+                                 content_type='text/csv')
+        assert response.status_code == 201
+        assert Employee.query.count() == 23
+
+    def test_employeesimportapi_post_update(self):
+        logger.info("Testing EmployeesImportAPI post method updating employees")
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        department3_id = Department.query.filter_by(department_name='TEST_DP3').one().department_id
+        csv_data = (f'\ufeffemployee_id,{HEADER}'
+                    f'{employee1_id},TEST_E1_NEW,Manager,500.5,1980-02-29,{department3_id}\n'
+                    f',TEST_E4,Manager,300,1985-12-31,{department3_id}\n')
+
+        response = self.app.post(url_for('rest_api.employeesimportapi'), data=csv_data.encode(),
+                                 content_type='text/csv')
+        assert response.status_code == 201
+        assert response.get_json()['created'] == 1
+        assert response.get_json()['updated'] == 1
+        employee1 = Employee.query.get(employee1_id)
+        assert employee1.employee_name == 'TEST_E1_NEW'
+        assert employee1.salary == 500.5
+        assert employee1.department_id == department3_id
+        assert Employee.query.count() == 4
+
+    def test_employeesimportapi_post_invalid_rows(self):
+        logger.info("Testing EmployeesImportAPI post method with invalid rows")
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        rows = [
+            f'{employee1_id},TEST_E4,Manager,100,1990-01-01,{department1_id}',
+            f'abc,TEST_E5,Manager,100,1990-01-01,{department1_id}',
+            f'{employee1_id},TEST_E6,Manager,100,1990-01-01,{department1_id}',
+            f',T,Manager,100,1990-01-01,{department1_id}',
+            f',TEST_E8,Manager,-1,1990-01-01,{department1_id}',
+            f',TEST_E9,Manager,1O0,1990-01-01,{department1_id}',
+            f',TEST_E10,Manager,100,1990-02-30,{department1_id}',
+            f',TEST_E11,Manager,100,2990-01-01,{department1_id}',
+            ',TEST_E12,Manager,100,1990-01-01,abc',
+            f',TEST_E13,Manager,100,1990-01-01,{uuid.uuid4()}',
+            f',TEST_E14,Manager,100,1990-01-01,{department1_id}',
+        ]
+        csv_data = f'employee_id,{HEADER}' + '\n'.join(rows) + '\n'
+
+        response = self.app.post(url_for('rest_api.employeesimportapi'), data=csv_data, content_type='text/csv')
+        message = response.get_json()
+        assert response.status_code == 400
+        assert message['error'] == 'file contains invalid rows'
+        assert message['rejected'] == 10
+        assert message['rows'] == [
+            {'line': 2, 'error': 'employee_id is duplicated'},
+            {'line': 3, 'error': 'employee_id is invalid'},
+            {'line': 4, 'error': 'employee_id is duplicated'},
+            {'line': 5, 'error': 'employee_name is invalid'},
+            {'line': 6, 'error': 'salary is invalid'},
+            {'line': 7, 'error': 'salary is invalid'},
+            {'line': 8, 'error': 'birthdate is invalid'},
+            {'line': 9, 'error': 'birthdate is invalid'},
+            {'line': 10, 'error': 'department_id is invalid'},
+            {'line': 11, 'error': 'department not found'},
+        ]
+        assert Employee.query.count() == 3
+
+        csv_data = HEADER + f'TEST_E4,Manager,100,1990-01-01,{uuid.uuid4()}\n'
+        response = self.app.post(url_for('rest_api.employeesimportapi'), data=csv_data, content_type='text/csv')
+        assert response.status_code == 404
+        assert response.get_json()['rows'] == [{'line': 2, 'error': 'department not found'}]
+
+    def test_employeesimportapi_post_invalid_file(self):
+        logger.info("Testing EmployeesImportAPI post method with invalid files")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        for csv_data, error in (
+                ('employee_name,position,salary,birthdate\n', "missing column 'department_id'"),
+                (HEADER.replace('position', 'title'), "unknown column 'title'"),
+                (HEADER.strip() + ',salary\n', 'header contains duplicated columns'),
+                (HEADER + f'TEST_E4,Manager,100,1990-01-01,{department1_id}\nTEST_E5,Manager\n', 'line 3:'),
+        ):
+            response = self.app.post(url_for('rest_api.employeesimportapi'), data=csv_data,
+                                     content_type='text/csv')
+            assert response.status_code == 400
+            assert response.get_json()['error'].startswith(error), response.get_json()
+        assert Employee.query.count() == 3
+
+        response = self.app.post(url_for('rest_api.employeesimportapi'), json=[])
+        assert response.status_code == 400
+
+    def test_import_employees_command(self):
+        logger.info("Testing flask import-employees command")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        runner = self.app.application.test_cli_runner()
+        with runner.isolated_filesystem():
+            with open('employees.csv', 'w', encoding='utf-8') as file:
+                file.write(HEADER + f'TEST_E4,Manager,100,1990-01-01,{department1_id}\n')
+            result = runner.invoke(args=['import-employees', 'employees.csv'])
+            assert result.exit_code == 0, result.output
+            assert 'Created 1 and updated 0 employees' in result.output
+
+            with open('employees.csv', 'w', encoding='utf-8') as file:
+                file.write(HEADER + f'TEST_E5,Manager,0,1990-01-01,{department1_id}\n')
+            result = runner.invoke(args=['import-employees', 'employees.csv'])
+            assert result.exit_code != 0
+            assert 'line 2: salary is invalid' in result.output
+        assert Employee.query.count() == 4
@@ -0,0 +1,113 @@
+"""
+Module containing class for EmployeesSalaryAPI resource testing
+"""
+
+# pylint: disable=C0103, no-member
+import uuid
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.models import Department, Employee
+
+
+class EmployeesSalaryAPITest(BaseTest):
+    """
+    Class for employees salary api tests
+    """
+    def create_app(self):
+        app = super().create_app()
+        app.config['RESPONSE_CACHE_BACKEND'] = 'memory'
+        app.config['SQL_INSTRUMENTATION_HEADERS'] = True
+        return app
+
+    @staticmethod
+    def query_count(response) -> int:
+        """
+        Returns number of SQL statements executed while handling the request
+        """
+        return int(response.headers['X-Query-Count'])
+
+    @staticmethod
+    def salaries() -> dict:
+        """
+        Returns dict mapping names of employees to their salaries
+        """
+        return {employee.employee_name: employee.salary for employee in Employee.query.all()}
+
+    def test_employeessalaryapi_post(self):
+        logger.info("Testing EmployeesSalaryAPI post method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        self.app.get(url_for('rest_api.departmentapi', department_id=department1_id))
+
+        response = self.app.post(url_for('rest_api.employeessalaryapi'),
+                                 json={'percent': 10, 'department_id': str(department1_id), 'dry_run': True})
+        assert response.status_code == 200
+        result = response.get_json()
+        assert result['dry_run'] is True
+        assert (result['matched'], result['rejected']) == (2, 0)
+        assert result['salary_total'] == 333
+        assert round(result['new_salary_total'], 6) == 366.3
+        assert self.query_count(response) <= 2
+        assert self.salaries() == {'TEST_E1': 111, 'TEST_E2': 222, 'TEST_E3': 333}
+
+        response = self.app.post(url_for('rest_api.employeessalaryapi'),
+                                 json={'percent': 10, 'department_id': str(department1_id)})
+        assert response.status_code == 200
+        assert response.get_json() == {'success': 'salaries have been changed', 'updated': 2}
+        assert self.query_count(response) <= 3
+        salaries = self.salaries()
+        assert round(salaries['TEST_E1'], 6) == 122.1
+        assert round(salaries['TEST_E2'], 6) == 244.2
+        assert salaries['TEST_E3'] == 333
+
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+        assert round(response.get_json()['salary'], 6) == 122.1
+        response = self.app.get(url_for('rest_api.departmentapi', department_id=department1_id))
+        assert response.headers['X-Cache'] == 'MISS'
+
+        response = self.app.post(url_for('rest_api.employeessalaryapi'),
+                                 json={'amount': 50, 'position': 'Test Subject 3', 'start_date': '1993-01-01',
+                                       'end_date': '1993-12-31'})
+        assert response.status_code == 200
+        assert response.get_json()['updated'] == 1
+        assert self.salaries()['TEST_E3'] == 383
+
+    def test_employeessalaryapi_post_rejected(self):
+        logger.info("Testing EmployeesSalaryAPI post method with salaries that would not be positive")
+        response = self.app.post(url_for('rest_api.employeessalaryapi'), json={'amount': -200, 'dry_run': True})
+        assert response.status_code == 200
+        assert (response.get_json()['matched'], response.get_json()['rejected']) == (3, 1)
+
+        response = self.app.post(url_for('rest_api.employeessalaryapi'), json={'amount': -200})
+        assert response.status_code == 400
+        assert response.get_json() == {'error': 'salary is invalid', 'rejected': 1}
+        assert self.salaries() == {'TEST_E1': 111, 'TEST_E2': 222, 'TEST_E3': 333}
+
+        response = self.app.post(url_for('rest_api.employeessalaryapi'), json={'percent': -100})
+        assert response.status_code == 400
+        assert response.get_json()['rejected'] == 3
+
+    def test_employeessalaryapi_post_invalid(self):
+        logger.info("Testing EmployeesSalaryAPI post method with invalid requests")
+        for data, status_code in (
+                (None, 400),
+                ([], 400),
+                ({}, 400),
+                ({'percent': 5, 'amount': 5}, 400),
+                ({'percent': '5'}, 400),
+                ({'percent': True}, 400),
+                ({'amount': 5, 'position': 'T'}, 400),
+                ({'amount': 5, 'dry_run': 'yes'}, 400),
+                ({'amount': 5, 'department_id': 'abc'}, 400),
+                ({'amount': 5, 'department_id': 5}, 400),
+                ({'amount': 5, 'start_date': '1990-13-01'}, 400),
+                ({'amount': 5, 'department_id': str(uuid.uuid4())}, 404),
+        ):
+            response = self.app.post(url_for('rest_api.employeessalaryapi'), json=data)
+            assert response.status_code == status_code, data
+            assert 'error' in response.get_json()
+        assert self.salaries() == {'TEST_E1': 111, 'TEST_E2': 222, 'TEST_E3': 333}
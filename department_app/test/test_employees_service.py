@@ -3,13 +3,19 @@ Module containing class for Department model testing
 """
 
 # pylint: disable=C0103, no-member
+import json
 import uuid
 from datetime import date
 
-from department_app.test.conftest import BaseTest, logger
+from department_app.test.conftest import BaseTest, logger, count_queries
+from department_app.cache import EMPLOYEES_TAG, department_tag, employee_tag
 from department_app.models import Employee, Department
+from department_app.service.dto import EmployeeDTO
+from department_app.rest.representation import dumps
 from department_app.service import get_all_employees, get_employees_with_filter, get_employee_by_id, create_employee, \
-    update_employee, delete_employee
+    update_employee, delete_employee, get_employees_data, get_employee_data, iter_employees_data, create_employees, \
+    update_employees, delete_employees, get_existing_employee_ids, get_employees_dtos, get_employees_json, \
+    get_data_version
 
 
 class DepartmentsServiceTest(BaseTest):
@@ -41,6 +47,12 @@ class DepartmentsServiceTest(BaseTest):
         filtered_employees_from_query = Employee.query.filter_by(birthdate=date(1992, 2, 12)).all()
         assert filtered_employees == filtered_employees_from_query
 
+        employees_page = get_employees_with_filter(department_id=department1.department_id, limit=1)
+        assert [employee.employee_name for employee in employees_page] == ['TEST_E1']
+        after = (employees_page[0].employee_name, employees_page[0].employee_id)
+        employees_page = get_employees_with_filter(department_id=department1.department_id, limit=1, after=after)
+        assert [employee.employee_name for employee in employees_page] == ['TEST_E2']
+
     @staticmethod
     def test_get_employee_by_id():
         logger.info("Testing get_employee_by_id method")
@@ -54,6 +66,68 @@ class DepartmentsServiceTest(BaseTest):
                 break
         assert not get_employee_by_id(nonexistent_employee_id)
 
+    @staticmethod
+    def test_get_employees_data():
+        logger.info("Testing get_employees_data method")
+        employees_data = get_employees_data()
+        assert isinstance(employees_data, list)
+        assert employees_data == [employee.to_dict() for employee in Employee.query.all()]
+
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        employees_data = get_employees_data(department_id=department1.department_id)
+        assert employees_data == [employee.to_dict() for employee in
+                                  Employee.query.filter_by(department_id=department1.department_id).all()]
+
+    @staticmethod
+    def test_get_employees_data_fields():
+        logger.info("Testing get_employees_data method with selected fields")
+        employees = Employee.query.order_by(Employee.employee_name).all()
+        for fields, include in ((None, ()), (('salary', 'department_id'), None), (('employee_name',), ('department',))):
+            assert get_employees_data(fields=fields, include=include) == \
+                [employee.to_dict(fields, include) for employee in employees]
+
+    @staticmethod
+    def test_get_employees_json():
+        logger.info("Testing get_employees_json method")
+        employees = Employee.query.order_by(Employee.employee_name).all()
+        for fields, include in ((None, None), (None, ()), (('salary', 'birthdate'), ('department',))):
+            assert json.loads(get_employees_json(fields=fields, include=include)) == \
+                json.loads(dumps([employee.to_dict(fields, include) for employee in employees]))
+
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        assert json.loads(get_employees_json(department_id=department1.department_id,
+                                             start_date=date(2000, 1, 1))) == []
+
+    @staticmethod
+    def test_get_employees_dtos():
+        logger.info("Testing get_employees_dtos method")
+        employees_dtos = get_employees_dtos(fields=('employee_name',), include_department=False)
+        assert all(isinstance(employee, EmployeeDTO) and not hasattr(employee, '__dict__')
+                   for employee in employees_dtos)
+        assert [employee.employee_name for employee in employees_dtos] == ['TEST_E1', 'TEST_E2', 'TEST_E3']
+        assert all(employee.department is None and employee.salary is None for employee in employees_dtos)
+
+    @staticmethod
+    def test_iter_employees_data():
+        logger.info("Testing iter_employees_data method")
+        employees_data = list(iter_employees_data(batch_size=2))
+        assert sorted(employees_data, key=lambda employee: employee['employee_name']) == get_employees_data()
+
+        employees_data = list(iter_employees_data(start_date=date(1991, 12, 31), end_date=date(1992, 12, 31)))
+        assert employees_data == get_employees_data(start_date=date(1991, 12, 31), end_date=date(1992, 12, 31))
+
+    @staticmethod
+    def test_get_employee_data():
+        logger.info("Testing get_employee_data method")
+        employee1 = Employee.query.filter_by(employee_name='TEST_E1').one()
+        assert get_employee_data(employee1.employee_id) == employee1.to_dict()
+
+        while True:
+            nonexistent_employee_id = uuid.uuid4()
+            if all(nonexistent_employee_id != employee.employee_id for employee in Employee.query.all()):
+                break
+        assert not get_employee_data(nonexistent_employee_id)
+
     @staticmethod
     def test_create_employee():
         logger.info("Testing create_employee method")
@@ -99,6 +173,21 @@ class DepartmentsServiceTest(BaseTest):
                 break
         assert not update_employee(nonexistent_employee_id)
 
+    @staticmethod
+    def test_update_employee_data_versions():
+        logger.info("Testing update_employee method changes data versions in the same statement")
+        employee1 = Employee.query.filter_by(employee_name='TEST_E1').one()
+        department1_id = employee1.department_id
+        department2_id = Department.query.filter_by(department_name='TEST_DP2').one().department_id
+        tags = (EMPLOYEES_TAG, employee_tag(employee1.employee_id), department_tag(department1_id),
+                department_tag(department2_id))
+        data_versions = [get_data_version(tag) for tag in tags]
+
+        with count_queries() as statements:
+            assert update_employee(employee1.employee_id, department_id=department2_id)
+        assert len(statements) == 1
+        assert all(get_data_version(tag) != data_version for tag, data_version in zip(tags, data_versions))
+
     @staticmethod
     def test_delete_employee():
         logger.info("Testing delete_employee method")
@@ -114,3 +203,36 @@ class DepartmentsServiceTest(BaseTest):
                 break
         assert not delete_employee(nonexistent_employee_id)
 
+    @staticmethod
+    def test_create_employees():
+        logger.info("Testing create_employees method")
+        department1_id = Department.query.filter_by(department_name='TEST_DP1').one().department_id
+        employee_ids = create_employees([{'employee_name': f'TEST_E{index}', 'position': 'Test Subject',
+                                          'salary': index, 'birthdate': date(2000, 1, index),
+                                          'department_id': department1_id} for index in range(4, 7)])
+        assert len(employee_ids) == 3
+        assert [Employee.query.get(employee_id).employee_name for employee_id in employee_ids] == \
+            ['TEST_E4', 'TEST_E5', 'TEST_E6']
+        assert create_employees([]) == []
+
+    @staticmethod
+    def test_update_employees():
+        logger.info("Testing update_employees method")
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        employee2_id = Employee.query.filter_by(employee_name='TEST_E2').one().employee_id
+        results = update_employees([{'employee_id': employee1_id, 'salary': 1000},
+                                    {'employee_id': employee2_id},
+                                    {'employee_id': uuid.uuid4(), 'salary': 1000}])
+        assert results == [True, True, False]
+        assert Employee.query.get(employee1_id).salary == 1000
+        assert Employee.query.get(employee2_id).salary == 222
+
+    @staticmethod
+    def test_delete_employees():
+        logger.info("Testing delete_employees method")
+        employee1_id = Employee.query.filter_by(employee_name='TEST_E1').one().employee_id
+        nonexistent_employee_id = uuid.uuid4()
+        assert get_existing_employee_ids([employee1_id, nonexistent_employee_id]) == {employee1_id}
+        assert delete_employees([employee1_id, nonexistent_employee_id]) == [True, False]
+        assert not Employee.query.get(employee1_id)
+        assert get_existing_employee_ids([employee1_id]) == set()
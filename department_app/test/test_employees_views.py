@@ -6,16 +6,60 @@ Module containing class for Employees views testing
 import http
 import uuid
 
-from flask import current_app, url_for
+from flask import url_for
 
 from department_app.test.conftest import BaseTest, logger
-from department_app.views import departments
-from department_app.views.departments_views import departments_view, departments_add, departments_edit
-from department_app.service import get_all_departments, get_department_by_id, create_department, update_department, \
-    delete_department
+from department_app.models import Department
+from department_app.service import get_all_employees, get_employee_by_id
 
 
 class EmployeesViewsTest(BaseTest):
     """
     Class for employees views tests
     """
+    def test_employees_view(self):
+        logger.info("Testing employees_view function")
+        response = self.app.get(url_for('employees.employees_view'))
+        assert response.status_code == http.HTTPStatus.OK
+        page = response.get_data(as_text=True)
+        assert all(employee.employee_name in page for employee in get_all_employees())
+
+        department1 = Department.query.filter_by(department_name='TEST_DP1').one()
+        response = self.app.get(url_for('employees.employees_view'),
+                                query_string={'department_id': department1.department_id,
+                                              'start_date': '', 'end_date': ''})
+        page = response.get_data(as_text=True)
+        assert response.status_code == http.HTTPStatus.OK
+        assert 'TEST_E1' in page and 'TEST_E2' in page and 'TEST_E3' not in page
+
+        response = self.app.get(url_for('employees.employees_view'),
+                                query_string={'start_date': '1991-12-31', 'end_date': '1992-12-31'})
+        page = response.get_data(as_text=True)
+        assert response.status_code == http.HTTPStatus.OK
+        assert 'TEST_E1' not in page and 'TEST_E2' in page and 'TEST_E3' not in page
+
+        response = self.app.get(url_for('employees.employees_view'), query_string={'department_id': 'abc'})
+        assert response.status_code == http.HTTPStatus.BAD_REQUEST
+
+        response = self.app.get(url_for('employees.employees_view'), query_string={'start_date': 'abc'})
+        assert response.status_code == http.HTTPStatus.BAD_REQUEST
+
+    def test_employees_add(self):
+        logger.info("Testing employees_add function")
+        response = self.app.get(url_for('employees.employees_add'))
+        assert response.status_code == http.HTTPStatus.OK
+        assert 'TEST_DP1' in response.get_data(as_text=True)
+
+    def test_employees_edit(self):
+        logger.info("Testing employees_edit function")
+        employee1 = get_all_employees()[0]
+        response = self.app.get(url_for('employees.employees_edit', employee_id=employee1.employee_id))
+        assert response.status_code == http.HTTPStatus.OK
+        assert employee1.employee_name in response.get_data(as_text=True)
+
+        while True:
+            nonexistent_employee_id = uuid.uuid4()
+            if not get_employee_by_id(nonexistent_employee_id):
+                break
+        response = self.app.get(url_for('employees.employees_edit', employee_id=nonexistent_employee_id))
+        assert response.status_code == http.HTTPStatus.NOT_FOUND
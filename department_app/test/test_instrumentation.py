@@ -0,0 +1,107 @@
+"""
+Module containing class for SQL instrumentation testing
+"""
+
+# pylint: disable=C0103, no-member
+import unittest
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.instrumentation import redact_parameters
+from department_app.models import Department, Employee
+
+
+class RedactParametersTest(unittest.TestCase):
+    """
+    Class for redaction of statement parameters tests
+    """
+    def test_redact_parameters(self):
+        logger.info("Testing redaction of statement parameters")
+        assert redact_parameters({'employee_name': 'TEST_E1', 'salary': 111}) == {'employee_name': '?', 'salary': '?'}
+        assert redact_parameters(('TEST_E1', 111)) == ('?', '?')
+        assert redact_parameters([{'salary': 111}, {'salary': 222}], executemany=True) == '2 parameter sets'
+
+
+class InstrumentationTest(BaseTest):
+    """
+    Class for SQL instrumentation of requests tests
+    """
+    def create_app(self):
+        app = super().create_app()
+        app.config['SQL_INSTRUMENTATION_HEADERS'] = True
+        return app
+
+    @staticmethod
+    def query_count(response) -> int:
+        """
+        Returns number of SQL statements executed while handling the request
+        """
+        return int(response.headers['X-Query-Count'])
+
+    def test_headers(self):
+        logger.info("Testing SQL instrumentation response headers")
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert response.status_code == 200
+        assert self.query_count(response) >= 2
+        assert response.headers['Server-Timing'].startswith(f'db;desc="{self.query_count(response)} queries";dur=')
+        assert 'db-max;' in response.headers['Server-Timing']
+
+        self.app.application.config['SQL_INSTRUMENTATION_HEADERS'] = False
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        assert 'X-Query-Count' not in response.headers
+        assert 'Server-Timing' not in response.headers
+
+    def test_query_budgets(self):
+        logger.info("Testing numbers of queries run by REST API read endpoints")
+        department = Department.query.filter_by(department_name='TEST_DP1').first()
+        employee = Employee.query.filter_by(employee_name='TEST_E1').first()
+        budgets = {
+            url_for('rest_api.departmentsapi'): 3,
+            url_for('rest_api.departmentapi', department_id=department.department_id): 3,
+            url_for('rest_api.employeesapi'): 2,
+            url_for('rest_api.employeesapi', department_id=department.department_id): 3,
+            url_for('rest_api.employeeapi', employee_id=employee.employee_id): 2,
+        }
+        for url, budget in budgets.items():
+            response = self.app.get(url)
+            assert response.status_code == 200
+            assert self.query_count(response) <= budget, url
+
+    def test_slow_query_log(self):
+        logger.info("Testing slow query log")
+        self.app.application.config['SLOW_QUERY_THRESHOLD'] = 0
+        department = Department.query.filter_by(department_name='TEST_DP1').first()
+        with self.assertLogs('department_app.slow_query', 'WARNING') as logs:
+            self.app.get(url_for('rest_api.employeesapi', department_id=department.department_id))
+        assert len(logs.output) >= 2
+        assert all('slow query' in message for message in logs.output)
+        assert not any(str(department.department_id) in message for message in logs.output)
+
+        self.app.application.config['SLOW_QUERY_THRESHOLD'] = None
+        with self.assertNoLogs('department_app.slow_query', 'WARNING'):
+            self.app.get(url_for('rest_api.departmentsapi'))
+
+    def test_write_query_budgets(self):
+        logger.info("Testing numbers of queries run by REST API update and delete endpoints")
+        department_id = Department.query.filter_by(department_name='TEST_DP1').first().department_id
+        employee_id = Employee.query.filter_by(employee_name='TEST_E1').first().employee_id
+        employee_url = url_for('rest_api.employeeapi', employee_id=employee_id)
+        department_url = url_for('rest_api.departmentapi', department_id=department_id)
+        # one statement changes the row, one increments version of the data
+        for method, url, data, status_code, budget in (
+                ('put', employee_url, {'salary': 500}, 201, 2),
+                ('put', employee_url, {'department_id': str(department_id)}, 201, 3),
+                ('delete', employee_url, None, 200, 2),
+                ('put', employee_url, {'salary': 500}, 404, 1),
+                ('delete', employee_url, None, 404, 1),
+                ('put', department_url, {'department_name': 'TEST_DP5'}, 201, 2),
+                ('delete', department_url, None, 200, 2),
+                ('delete', department_url, None, 404, 1),
+        ):
+            response = getattr(self.app, method)(url, data=data)
+            assert response.status_code == status_code, (method, data)
+            assert self.query_count(response) <= budget, (method, data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Module containing class for Prometheus metrics testing
+"""
+
+# pylint: disable=C0103, no-member
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.metrics import prometheus_client
+
+WORKER_SCRIPT = textwrap.dedent('''
+    from department_app import create_app
+    app = create_app(test_config=True)
+    app.config['RESPONSE_CACHE_BACKEND'] = None
+    app.test_client().get('/api/departments')
+''')
+
+
+@unittest.skipIf(prometheus_client is None, 'prometheus_client is not installed')
+class MetricsTest(BaseTest):
+    """
+    Class for Prometheus metrics tests
+    """
+    @staticmethod
+    def sample(name: str, **labels) -> float:
+        """
+        Returns value of a sample of the default registry or 0 if there is no such sample
+        """
+        return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_request_metrics(self):
+        logger.info("Testing metrics of requests")
+        labels = {'endpoint': 'rest_api.departmentsapi', 'method': 'GET'}
+        requests_before = self.sample('http_requests_total', status='200', **labels)
+        latency_count_before = self.sample('http_request_duration_seconds_count', **labels)
+        size_sum_before = self.sample('http_response_size_bytes_sum', **labels)
+        db_time_count_before = self.sample('http_request_db_duration_seconds_count', **labels)
+
+        response = self.app.get(url_for('rest_api.departmentsapi'))
+        self.app.get(url_for('rest_api.departmentsapi', limit='invalid'))
+        assert self.sample('http_requests_total', status='200', **labels) == requests_before + 1
+        assert self.sample('http_requests_total', status='400', **labels) >= 1
+        assert self.sample('http_request_duration_seconds_count', **labels) == latency_count_before + 2
+        assert self.sample('http_response_size_bytes_sum', **labels) >= size_sum_before + len(response.data)
+        assert self.sample('http_request_db_duration_seconds_count', **labels) == db_time_count_before + 2
+        assert self.sample('http_requests_in_progress', **labels) == 0
+
+    def test_view_metrics(self):
+        logger.info("Testing metrics of views and unknown routes")
+        labels = {'endpoint': 'departments.departments_view', 'method': 'GET', 'status': '200'}
+        requests_before = self.sample('http_requests_total', **labels)
+        not_found_before = self.sample('http_requests_total', endpoint='none', method='GET', status='404')
+        self.app.get(url_for('departments.departments_view'))
+        self.app.get('/unknown')
+        assert self.sample('http_requests_total', **labels) == requests_before + 1
+        assert self.sample('http_requests_total', endpoint='none', method='GET', status='404') == \
+               not_found_before + 1
+
+    def test_metrics_endpoint(self):
+        logger.info("Testing metrics endpoint")
+        self.app.get(url_for('rest_api.departmentsapi'))
+        response = self.app.get(url_for('metrics'))
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        text = response.get_data(as_text=True)
+        assert 'http_requests_total{endpoint="rest_api.departmentsapi",method="GET",status="200"}' in text
+        assert 'http_request_duration_seconds_bucket{' in text
+
+    def test_multiprocess_metrics(self):
+        logger.info("Testing metrics collected by several processes")
+        with tempfile.TemporaryDirectory() as directory:
+            environment = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=directory)
+            for _ in range(2):
+                subprocess.run([sys.executable, '-c', WORKER_SCRIPT], env=environment, check=True)
+            registry = prometheus_client.CollectorRegistry()
+            prometheus_client.multiprocess.MultiProcessCollector(registry, path=directory)
+            assert registry.get_sample_value('http_requests_total', {'endpoint': 'rest_api.departmentsapi',
+                                                                     'method': 'GET', 'status': '200'}) == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
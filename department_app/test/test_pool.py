@@ -0,0 +1,86 @@
+"""
+Module containing class for database connection pool testing
+"""
+
+# pylint: disable=C0103, no-member
+import os
+import unittest
+from unittest import mock
+
+from flask import url_for
+from sqlalchemy import create_engine, exc
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.database import db
+from department_app.pool import InstrumentedQueuePool, pool_options, pool_stats
+
+
+class PoolOptionsTest(unittest.TestCase):
+    """
+    Class for connection pool options tests
+    """
+    def test_pool_options(self):
+        logger.info("Testing connection pool options")
+        assert pool_options({}) == {}
+        assert pool_options({'DATABASE_POOL_SIZE': '10', 'DATABASE_MAX_OVERFLOW': 5, 'DATABASE_POOL_TIMEOUT': '2.5',
+                             'DATABASE_POOL_RECYCLE': '1800', 'DATABASE_POOL_PRE_PING': 'true'}) == \
+               {'pool_size': 10, 'max_overflow': 5, 'pool_timeout': 2.5, 'pool_recycle': 1800, 'pool_pre_ping': True}
+        assert pool_options({'DATABASE_POOL_SIZE': '', 'DATABASE_POOL_PRE_PING': 'off'}) == {'pool_pre_ping': False}
+
+    def test_pool_options_invalid(self):
+        logger.info("Testing invalid connection pool options")
+        with self.assertRaisesRegex(ValueError, 'DATABASE_POOL_SIZE is invalid'):
+            pool_options({'DATABASE_POOL_SIZE': 'ten'})
+        with self.assertRaisesRegex(ValueError, 'DATABASE_POOL_PRE_PING is invalid'):
+            pool_options({'DATABASE_POOL_PRE_PING': 'maybe'})
+
+
+class PoolTest(BaseTest):
+    """
+    Class for instrumented connection pool tests
+    """
+    def create_app(self):
+        with mock.patch.dict(os.environ, {'DATABASE_POOL_SIZE': '3'}):
+            return super().create_app()
+
+    def test_app_pool(self):
+        logger.info("Testing connection pool of the application")
+        assert isinstance(db.engine.pool, InstrumentedQueuePool)
+        assert db.engine.pool.size() == 3
+        stats = self.app.get(url_for('rest_api.poolapi')).get_json()
+        assert stats['pool_class'] == 'InstrumentedQueuePool'
+        assert stats['size'] == 3
+        assert stats['checkouts'] >= 1
+        assert stats['connects'] >= 1
+        assert stats['timeouts'] == 0
+
+    def test_pool_counters(self):
+        logger.info("Testing connection pool counters")
+        engine = create_engine(db.engine.url, poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0,
+                               pool_timeout=0.1)
+        try:
+            connection = engine.connect()
+            with self.assertRaises(exc.TimeoutError):
+                engine.connect()
+            stats = pool_stats(engine)
+            assert stats['checked_out'] == 1
+            assert stats['peak_checked_out'] == 1
+            assert stats['checkouts'] == 1
+            assert stats['timeouts'] == 1
+            assert stats['checkout_wait_max'] >= 0.1
+            connection.invalidate()
+            connection.close()
+            engine.dispose()
+            with engine.connect():
+                pass
+            stats = pool_stats(engine)
+            assert stats['checked_out'] == 0
+            assert stats['checkouts'] == 2
+            assert stats['connects'] == 2
+            assert stats['invalidations'] == 1
+        finally:
+            engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
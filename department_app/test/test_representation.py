@@ -0,0 +1,55 @@
+"""
+Module containing class for JSON representation of REST API responses testing
+"""
+
+# pylint: disable=C0103, no-member
+import json
+import unittest
+import uuid
+from datetime import date
+
+from flask import url_for
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.models import Employee
+from department_app.rest.representation import dumps_json, dumps_orjson, orjson
+
+
+class RepresentationTest(unittest.TestCase):
+    """
+    Class for JSON encoders tests
+    """
+    employee_id = uuid.uuid4()
+    data = [{'employee_id': employee_id, 'salary': 111.5, 'birthdate': date(1991, 1, 11), 'department': None},
+            ('a', 1)]
+    expected = [{'employee_id': str(employee_id), 'salary': 111.5, 'birthdate': '1991-01-11', 'department': None},
+                ['a', 1]]
+
+    def test_json_encoder(self):
+        logger.info("Testing standard json encoder of REST API responses")
+        assert json.loads(dumps_json(self.data)) == self.expected
+        assert dumps_json(self.data).endswith(b'\n')
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_encoder(self):
+        logger.info("Testing orjson encoder of REST API responses")
+        assert json.loads(dumps_orjson(self.data)) == self.expected
+        assert dumps_orjson(self.data).endswith(b'\n')
+
+    def test_unsupported_type(self):
+        logger.info("Testing JSON encoders of REST API responses with unsupported type")
+        with self.assertRaises(TypeError):
+            dumps_json({'value': object()})
+
+
+class RepresentationAPITest(BaseTest):
+    """
+    Class for JSON representation of REST API responses tests
+    """
+    def test_employeeapi_get_representation(self):
+        logger.info("Testing JSON representation of EmployeeAPI get method response")
+        employee1 = Employee.query.filter_by(employee_name='TEST_E1').one()
+        response = self.app.get(url_for('rest_api.employeeapi', employee_id=employee1.employee_id))
+        assert response.mimetype == 'application/json'
+        assert response.get_json()['employee_id'] == str(employee1.employee_id)
+        assert response.get_json()['birthdate'] == employee1.birthdate.isoformat()
@@ -0,0 +1,118 @@
+"""
+Module containing class for synthetic data generator testing
+"""
+
+# pylint: disable=C0103, no-member
+import random
+import re
+import unittest
+import uuid
+from datetime import date
+from unittest import mock
+
+from sqlalchemy import inspect
+
+from department_app.test.conftest import BaseTest, logger
+from department_app.database import db
+from department_app.models import Department, Employee
+from department_app.seed import generate_departments, generate_employees, format_copy_row, insert_rows, \
+    seed_database, EMPLOYEE_COLUMNS
+from department_app.cache import DEPARTMENTS_TAG, EMPLOYEES_TAG, department_tag, employee_tag
+from department_app.service import get_data_version
+
+
+class GenerateTest(unittest.TestCase):
+    """
+    Class for data generation tests
+    """
+    def test_deterministic(self):
+        logger.info("Testing that generated data depends only on seed")
+        def generate(seed):
+            rng = random.Random(seed)
+            departments = generate_departments(rng, 5)
+            return departments, list(generate_employees(rng, 100, [row[0] for row in departments], chunk_size=30))
+
+        assert generate(1) == generate(1)
+        assert generate(1) != generate(2)
+
+    def test_generated_values(self):
+        logger.info("Testing values of generated data")
+        rng = random.Random(0)
+        departments = generate_departments(rng, 20)
+        department_ids = [row[0] for row in departments]
+        employees = list(generate_employees(rng, 1000, department_ids, chunk_size=300))
+        assert len(employees) == 1000
+        assert len({row[0] for row in departments + employees}) == 1020
+        for department_id, department_name, department_phone_number in departments:
+            assert isinstance(department_id, uuid.UUID)
+            assert 3 <= len(department_name) <= 32
+            assert re.match(r'(\+?[\d]{1,3})?\d{10}$', department_phone_number)
+        for _, employee_name, position, salary, birthdate, department_id in employees:
+            assert 2 <= len(employee_name) <= 32
+            assert 2 <= len(position) <= 32
+            assert salary > 0
+            assert date(1960, 1, 1) <= birthdate < date.today()
+            assert department_id in department_ids
+
+    def test_format_copy_row(self):
+        logger.info("Testing text format of COPY rows")
+        employee_id = uuid.uuid4()
+        assert format_copy_row((employee_id, 'a\tb\\c\nd', 1.5, date(1991, 1, 11), None)) == \
+               f'{employee_id.hex}\ta\\tb\\\\c\\nd\t1.5\t1991-01-11\t\\N\n'
+
+
+class SeedTest(BaseTest):
+    """
+    Class for loading generated data tests
+    """
+    def test_seed_database(self):
+        logger.info("Testing loading generated data")
+        data_version = get_data_version(DEPARTMENTS_TAG, EMPLOYEES_TAG)
+        department_ids = seed_database(4, 200, seed=1)
+        assert len(department_ids) == 4
+        assert Department.query.count() == 7
+        assert Employee.query.count() == 203
+        assert Employee.query.filter(Employee.department_id.in_(department_ids)).count() == 200
+        assert get_data_version(DEPARTMENTS_TAG, EMPLOYEES_TAG) != data_version
+
+        department_tags = [department_tag(department_id) for department_id in department_ids]
+        employee_tags = [employee_tag(employee.employee_id) for employee in Employee.query.limit(5).all()]
+        data_versions = [get_data_version(tag) for tag in department_tags + employee_tags]
+        seed_database(2, 10, seed=1, clear=True)
+        assert Department.query.count() == 2
+        assert Employee.query.count() == 10
+        assert all(get_data_version(tag) != data_version
+                   for tag, data_version in zip(department_tags + employee_tags, data_versions))
+
+    def test_seed_database_deferred_indexes(self):
+        logger.info("Testing loading generated data with deferred indexes")
+        with mock.patch('department_app.seed.DEFER_INDEXES_MIN_ROWS', 100):
+            seed_database(3, 300, clear=True)
+        assert Employee.query.count() == 300
+        index_names = {index['name'] for index in inspect(db.engine).get_indexes('employee')}
+        assert index_names == {index.name for index in Employee.__table__.indexes}
+
+    def test_insert_rows(self):
+        logger.info("Testing loading generated data with batched inserts")
+        department_id = Department.query.filter_by(department_name='TEST_DP1').first().department_id
+        rows = generate_employees(random.Random(0), 25, [department_id])
+        assert insert_rows(Employee.__table__, EMPLOYEE_COLUMNS, rows, chunk_size=10) == 25
+        db.session.commit()
+        assert Employee.query.filter_by(department_id=department_id).count() == 27
+
+    def test_seed_command(self):
+        logger.info("Testing flask seed command")
+        runner = self.app.application.test_cli_runner()
+        result = runner.invoke(args=['seed', '--departments', '3', '--employees', '50', '--clear'])
+        assert result.exit_code == 0, result.output
+        assert 'Created 3 departments and 50 employees' in result.output
+        assert Department.query.count() == 3
+        assert Employee.query.count() == 50
+
+        result = runner.invoke(args=['seed', '--departments', '0', '--employees', '10'])
+        assert result.exit_code != 0
+        assert 'employees require at least one department' in result.output
+
+
+if __name__ == '__main__':
+    unittest.main()
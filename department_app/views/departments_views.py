@@ -4,8 +4,9 @@ Module containing departments blueprint and functions
 
 from uuid import UUID
 
-import requests
-from flask import Blueprint, render_template, url_for
+from flask import Blueprint, render_template, abort
+
+from department_app.service import get_departments_data, get_department_data
 
 
 departments = Blueprint('departments', __name__, template_folder='templates')
@@ -18,8 +19,9 @@ def departments_view() -> str:
     :return: rendered HTML page
     :rtype: str
     """
-    response = requests.get(url_for('rest_api.departmentsapi', _external=True))
-    departments_json = response.json()
+    departments_json = get_departments_data(fields=('department_id', 'department_name', 'department_phone_number',
+                                                    'number_of_employees', 'average_salary'),
+                                            include=())
     return render_template('departments.html', departments=departments_json)
 
 
@@ -42,6 +44,9 @@ def departments_edit(department_id: UUID) -> str:
     :return: rendered HTML page
     :rtype: str
     """
-    response = requests.get(url_for('rest_api.departmentapi', department_id=department_id, _external=True))
-    department_json = response.json()
+    department_json = get_department_data(department_id,
+                                          fields=('department_id', 'department_name', 'department_phone_number'),
+                                          include=())
+    if not department_json:
+        abort(404)
     return render_template('department_edit.html', department=department_json)
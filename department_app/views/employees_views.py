@@ -3,9 +3,12 @@ Module containing employees blueprint and functions
 """
 
 from uuid import UUID
+from datetime import datetime
 
-import requests
-from flask import Blueprint, render_template, request, url_for
+import validators
+from flask import Blueprint, render_template, request, abort
+
+from department_app.service import get_employees_data, get_employee_data, get_departments_data
 
 employees = Blueprint('employees', __name__, template_folder='templates')
 
@@ -18,29 +21,26 @@ def employees_view() -> str:
     :rtype: str
     """
     request_data = request.args.to_dict()
-    if request_data is not None:
-        if 'department_id' in request_data and request_data['department_id']:
-            department_id = request_data['department_id']
-        else:
-            department_id = None
+    if 'department_id' in request_data and request_data['department_id']:
+        if not validators.uuid(request_data['department_id']):
+            abort(400)
+        department_id = UUID(request_data['department_id'])
+    else:
+        department_id = None
+    try:
         if 'start_date' in request_data and request_data['start_date']:
-            start_date = request_data['start_date']
+            start_date = datetime.strptime(request_data['start_date'], "%Y-%m-%d").date()
         else:
             start_date = None
         if 'end_date' in request_data and request_data['end_date']:
-            end_date = request_data['end_date']
+            end_date = datetime.strptime(request_data['end_date'], "%Y-%m-%d").date()
         else:
             end_date = None
+    except ValueError:
+        abort(400)
 
-        response = requests.get(url_for('rest_api.employeesapi', _external=True,
-                                        department_id=department_id,
-                                        start_date=start_date,
-                                        end_date=end_date))
-    else:
-        response = requests.get(url_for('rest_api.employeesapi', _external=True))
-    employees_json = response.json()
-    response = requests.get(url_for('rest_api.departmentsapi', _external=True))
-    departments_json = response.json()
+    employees_json = get_employees_data(department_id, start_date, end_date)
+    departments_json = get_departments_data(fields=('department_id', 'department_name'), include=())
     return render_template('employees.html', employees=employees_json, departments=departments_json)
 
 
@@ -51,8 +51,7 @@ def employees_add() -> str:
     :return: rendered HTML page
     :rtype: str
     """
-    response = requests.get(url_for('rest_api.departmentsapi', _external=True))
-    departments_json = response.json()
+    departments_json = get_departments_data(fields=('department_id', 'department_name'), include=())
     return render_template('employees_add.html', departments=departments_json)
 
 
@@ -65,8 +64,8 @@ def employees_edit(employee_id: UUID):
     :return: rendered HTML page
     :rtype: str
     """
-    response = requests.get(url_for('rest_api.employeeapi', employee_id=employee_id, _external=True))
-    employee_json = response.json()
-    response = requests.get(url_for('rest_api.departmentsapi', _external=True))
-    departments_json = response.json()
+    employee_json = get_employee_data(employee_id)
+    if not employee_json:
+        abort(404)
+    departments_json = get_departments_data(fields=('department_id', 'department_name'), include=())
     return render_template('employee_edit.html', employee=employee_json, departments=departments_json)
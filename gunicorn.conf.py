@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration, removes metrics of stopped workers when metrics are shared by workers
+through PROMETHEUS_MULTIPROC_DIR
+"""
+
+from department_app.metrics import mark_process_dead
+
+
+def child_exit(_server, worker):
+    """
+    Gunicorn hook called in the master process after a worker has exited
+    """
+    mark_process_dead(worker.pid)
@@ -10,7 +10,7 @@ setup(
     description="A simple web application for managing departments and employees",
     license="MIT",
     url="https://github.com/RezOleksandr/epam_python_project",
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
     include_package_data=True,
     zip_safe=False,
     install_requires=[
@@ -63,4 +63,10 @@ setup(
         "Werkzeug==2.0.2",
         "wrapt==1.13.3",
     ],
+    extras_require={
+        "orjson": ["orjson==3.8.3"],
+        "metrics": ["prometheus_client==0.13.1"],
+        "asgi": ["asgiref==3.11.1", "asyncpg==0.32.0", "uvicorn==0.39.0"],
+        "redis": ["redis==4.1.0"],
+    },
 )